@@ -19,6 +19,17 @@ _bundle_xlsx = (
     "LD example data import.xlsx",
 )
 
+# Pre-compile the VT export/schedule rules, section anchors and the Schedules template's
+# label -> row map into an importable module so the frozen app does not parse the xlsx on
+# first export (it still falls back to live parsing if the shipped workbook differs).
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+from lift_designer_vt_rules import BAKED_MODULE_NAME, bake_vt_rules_module
+
+baked_module_path = os.path.join(script_dir, BAKED_MODULE_NAME + ".py")
+bake_vt_rules_module(baked_module_path)
+print(f"Baked VT rules into {baked_module_path}")
+
 command = [
     sys.executable,
     '-m',
@@ -28,6 +39,7 @@ command = [
     '--noconsole',
     '--icon', os.path.join(script_dir, 'Elevator.ico'),
     '--exclude-module', '__pycache__',
+    '--hidden-import', BAKED_MODULE_NAME,
     '--exclude', '.gitignore',
     '--clean',  # Clean PyInstaller cache and remove temporary files
 ]
@@ -35,6 +47,10 @@ for name in _bundle_xlsx:
     src = os.path.join(script_dir, name)
     if os.path.isfile(src):
         command.extend(["--add-data", f"{src};."])
+# Door-manufacturer catalogue (one JSON file per supplier) -> ``door_catalogue/`` in the bundle.
+catalogue_dir = os.path.join(script_dir, "door_catalogue")
+if os.path.isdir(catalogue_dir):
+    command.extend(["--add-data", f"{catalogue_dir};door_catalogue"])
 command.extend([
     os.path.join(script_dir, 'gui.py'),
     '--distpath', desktop_dir,
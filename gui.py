@@ -1,4 +1,5 @@
 # gui.py
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -35,4 +36,5 @@ def main():
     app.exec_()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # process-pool exports in the PyInstaller build
     main()
\ No newline at end of file
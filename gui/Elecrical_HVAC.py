@@ -15,7 +15,7 @@ import sys
 
 from .formula_line_edit import apply_formula_value
 from .override_combobox import OverrideComboBox
-from .project_lift_schema import merged_lift_at, normalize_project_lift_data
+from .project_lift_schema import normalize_project_lift_data
 from .custom_parameter_rows import (
     KEY_CUSTOM_LIFT_DRIVE,
     add_plus_minus_button_row,
@@ -27,11 +27,13 @@ from .custom_parameter_rows import (
 )
 
 try:
+    from .lift_record import lift_record_at
     from .lift_types import ELECTRICAL_HVAC_DEFAULTS, electrical_hvac_derived_for_lift
 except ImportError:  # running as ``python gui/Elecrical_HVAC.py``
     _repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     if _repo_root not in sys.path:
         sys.path.insert(0, _repo_root)
+    from gui.lift_record import lift_record_at
     from gui.lift_types import ELECTRICAL_HVAC_DEFAULTS, electrical_hvac_derived_for_lift
 
 
@@ -81,9 +83,6 @@ class LiftDriveControlPage(QWidget):
     ROW_ENERGY_RECOVERY = 10
     ROW_NUMERIC = frozenset({5, 6, 7, 8, 9, 11, 12, 13})
 
-    LOAD_CAPACITY_KEY = "Load capacity"
-    PERSONS_KEY = "Permissible number of persons"
-
     # Older project files may use these labels
     _POPULATE_ALIASES = {
         "Power grid voltage/type": ("Power network", "Power grid voltage/type (V)"),
@@ -360,11 +359,11 @@ class LiftDriveControlPage(QWidget):
 
     def _apply_computed_for_column(self, col):
         idx = col - 2
-        lift = merged_lift_at(self.user_inputs, idx)
-        if not lift:
+        lift = lift_record_at(self.user_inputs, idx)
+        if not lift.lift:
             return
-        load = lift.get(self.LOAD_CAPACITY_KEY, "")
-        persons = lift.get(self.PERSONS_KEY, "")
+        load = lift.load_kg
+        persons = lift.persons_count
         duty_w = self.system_table.cellWidget(self.ROW_DUTY_CYCLE, col)
         duty_txt = duty_w.text() if isinstance(duty_w, QLineEdit) else ""
 
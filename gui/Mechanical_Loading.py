@@ -21,7 +21,7 @@ import sys
 
 from .formula_line_edit import apply_formula_value
 from .override_combobox import OverrideComboBox
-from .project_lift_schema import ensure_lift_section_slots, merged_lift_at
+from .project_lift_schema import ensure_lift_section_slots
 from .custom_parameter_rows import (
     KEY_CUSTOM_FORCES,
     add_plus_minus_button_row,
@@ -33,9 +33,10 @@ from .custom_parameter_rows import (
 )
 
 try:
+    from .lift_record import LiftRecord, lift_record_at
     from .lift_types import (
         _parse_width_mm,
-        load_profile_for_capacity,
+        load_profile_constants,
         mechanical_loading_derived_for_lift,
         mechanical_rail_weight_car_kg_m,
         mechanical_rail_weight_cwt_kg_m,
@@ -44,9 +45,10 @@ except ImportError:
     _repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     if _repo_root not in sys.path:
         sys.path.insert(0, _repo_root)
+    from gui.lift_record import LiftRecord, lift_record_at
     from gui.lift_types import (
         _parse_width_mm,
-        load_profile_for_capacity,
+        load_profile_constants,
         mechanical_loading_derived_for_lift,
         mechanical_rail_weight_car_kg_m,
         mechanical_rail_weight_cwt_kg_m,
@@ -91,12 +93,8 @@ class ForceSpecPage(QWidget):
         {1, 3, 7, 8, 9, 10, 11, 12, 13, 14, 15}
     )
 
-    LOAD_KEY = "Load capacity"
-    TRAVEL_KEY = "Travel height"
-    CABIN_W_KEY = "Cabin width"
-    CABIN_D_KEY = "Cabin depth"
-    CABIN_SHAPE_KEY = "Cabin type/shape"
-    ACCESSIBLE_YN_KEY = "Accessible rooms/cwt safety"
+    # Lift inputs (load, travel, cabin size / shape, accessible rooms) come from
+    # :class:`gui.lift_record.LiftRecord`, parsed once per column refresh.
 
     # Legacy saved keys → current description label
     _POPULATE_ALIASES = {
@@ -129,33 +127,24 @@ class ForceSpecPage(QWidget):
         for col in range(2, self.force_table.columnCount()):
             self._sync_derived_fields(col)
 
-    def _lift_at_column(self, col: int) -> dict:
+    def _lift_at_column(self, col: int) -> LiftRecord:
         i = col - 2
-        return merged_lift_at(self.user_inputs, i)
+        return lift_record_at(self.user_inputs, i)
 
-    def _resolved_cabin_width_depth_mm(self, lift: dict):
+    def _resolved_cabin_width_depth_mm(self, lift: LiftRecord):
         """
         Use layout table values when present; otherwise Excel-style defaults from
         ``Load capacity`` + ``Cabin type/shape`` (same as layout page logic).
         """
-        w = _parse_width_mm(str(lift.get(self.CABIN_W_KEY, "") or ""))
-        d = _parse_width_mm(str(lift.get(self.CABIN_D_KEY, "") or ""))
-        if w is not None and d is not None:
-            return w, d
-        prof = load_profile_for_capacity(lift.get(self.LOAD_KEY, 0))
+        if lift.cabin_width_mm is not None and lift.cabin_depth_mm is not None:
+            return lift.cabin_width_mm, lift.cabin_depth_mm
         # Layout page may not be saved yet; Excel template defaults to a cabin shape.
-        shape = str(lift.get(self.CABIN_SHAPE_KEY, "") or "").strip() or "Deep"
-        cw_s = prof.cabin_width_mm(shape)
-        if cw_s is None:
+        row = load_profile_constants(lift.load_kg, lift.cabin_shape or "Deep")
+        if row.cabin_width_mm is None or row.cabin_depth_mm is None:
             return None, None
-        w2 = _parse_width_mm(str(cw_s))
-        if w2 is None:
-            return None, None
-        cd_s = prof.cabin_depth_mm(str(w2))
-        if cd_s is None:
-            return None, None
-        d2 = _parse_width_mm(str(cd_s))
-        if d2 is None:
+        w2 = _parse_width_mm(row.cabin_width_mm)
+        d2 = _parse_width_mm(row.cabin_depth_mm)
+        if w2 is None or d2 is None:
             return None, None
         return w2, d2
 
@@ -187,15 +176,13 @@ class ForceSpecPage(QWidget):
         cwt_yes = isinstance(cb, QCheckBox) and cb.isChecked()
 
         cw_i, cd_i = self._resolved_cabin_width_depth_mm(lift)
-        cw_arg = str(cw_i) if cw_i is not None else lift.get(self.CABIN_W_KEY)
-        cd_arg = str(cd_i) if cd_i is not None else lift.get(self.CABIN_D_KEY)
 
         try:
             derived = mechanical_loading_derived_for_lift(
-                lift.get(self.LOAD_KEY),
-                lift.get(self.TRAVEL_KEY),
-                cw_arg,
-                cd_arg,
+                lift.load_kg,
+                lift.travel_m,
+                cw_i,
+                cd_i,
                 cwt_yes,
                 n_car or "2",
                 n_cwt or "2",
@@ -336,40 +323,24 @@ class ForceSpecPage(QWidget):
                 widget = OverrideComboBox()
                 widget.setInsertPolicy(QComboBox.NoInsert)
                 widget.addItems(["14", "18"])
-                if lift is not None:
-                    dflt = mechanical_rail_weight_car_kg_m(lift.get(self.LOAD_KEY))
-                    if dflt is not None:
-                        i = widget.findText(dflt)
-                        if i >= 0:
-                            widget.setCurrentIndex(i)
+                dflt = mechanical_rail_weight_car_kg_m(lift.load_kg)
+                if dflt is not None:
+                    i = widget.findText(dflt)
+                    if i >= 0:
+                        widget.setCurrentIndex(i)
             elif row == self.ROW_RAIL_CWT:
                 widget = OverrideComboBox()
                 widget.setInsertPolicy(QComboBox.NoInsert)
                 widget.addItems(["4", "14", "18"])
-                if lift is not None:
-                    dflt = mechanical_rail_weight_cwt_kg_m(lift.get(self.LOAD_KEY))
-                    if dflt is not None:
-                        i = widget.findText(dflt)
-                        if i >= 0:
-                            widget.setCurrentIndex(i)
+                dflt = mechanical_rail_weight_cwt_kg_m(lift.load_kg)
+                if dflt is not None:
+                    i = widget.findText(dflt)
+                    if i >= 0:
+                        widget.setCurrentIndex(i)
             elif row == self.ROW_CWT_SAFETY:
                 widget = QCheckBox()
-                if lift is not None:
-                    yn = str(lift.get(self.ACCESSIBLE_YN_KEY, "") or "").strip().lower()
-                    try:
-                        cap = int(
-                            round(
-                                float(
-                                    str(lift.get(self.LOAD_KEY, "") or "")
-                                    .strip()
-                                    .replace(",", ".")
-                                )
-                            )
-                        )
-                    except (ValueError, TypeError, OverflowError):
-                        cap = None
-                    # Excel template: column M (630 kg) uses ``yes``; other capacities ``no``.
-                    widget.setChecked(cap == 630 or yn == "yes")
+                # Excel template: column M (630 kg) uses ``yes``; other capacities ``no``.
+                widget.setChecked(lift.load_kg == 630 or lift.accessible_rooms_yes)
                 widget.toggled.connect(lambda _c, cp=col_position: self._sync_derived_fields(cp))
             elif row in (self.ROW_CAR_BUFFERS, self.ROW_CWT_BUFFERS):
                 widget = QLineEdit()
@@ -4,7 +4,7 @@ from .project_lift_schema import (
     KEY_FLOORS,
     KEY_GENERAL_SPECIFICATION,
     ensure_lift_section_slots,
-    merged_lift_at,
+    merged_lift_view,
     normalize_project_lift_data,
 )
 
@@ -285,7 +285,7 @@ class BuildingFloorPage(QWidget):
         floors_top = self.user_inputs.get(KEY_FLOORS) or []
         nfs = []
         for i in range(n_lifts):
-            lift_system = merged_lift_at(self.user_inputs, i)
+            lift_system = merged_lift_view(self.user_inputs, i)
             n = self._floor_row_count_from_lift_system(lift_system)
             if n < 1:
                 saved = []
@@ -42,6 +42,7 @@ from gui.custom_parameter_rows import (
 import copy
 from lift_designer_vt_derived import (
     DEFAULT_DOOR_MANUFACTURER,
+    DOOR_CATALOGUE_PROBLEMS,
     DOOR_MANUFACTURER_OPTIONS,
     normalize_door_manufacturer,
 )
@@ -78,6 +79,15 @@ class DoorManufacturerDialog(QDialog):
         self._combo.setCurrentIndex(idx if idx >= 0 else 0)
         layout.addWidget(self._combo)
 
+        if DOOR_CATALOGUE_PROBLEMS:
+            warning = QLabel(
+                "Some door catalogue files were skipped:\n"
+                + "\n".join(f"• {p}" for p in DOOR_CATALOGUE_PROBLEMS)
+            )
+            warning.setWordWrap(True)
+            warning.setStyleSheet("color: rgb(192, 0, 0);")
+            layout.addWidget(warning)
+
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
@@ -309,7 +319,7 @@ class CostPage(QWidget):
             path += ".xlsx"
 
         try:
-            from lift_designer_ld_export import build_ld_rows_per_lift, write_ld_exports_per_group
+            from lift_designer_ld_export import build_ld_rows_per_lift, write_ld_group_exports
         except ImportError as e:
             QMessageBox.critical(
                 self,
@@ -325,16 +335,28 @@ class CostPage(QWidget):
                 self.number_of_lifts,
                 door_manufacturer=manufacturer,
             )
-            written = write_ld_exports_per_group(
+            results = write_ld_group_exports(
                 path,
                 rows_by_lift,
                 payload.get(KEY_LIFT_COLUMN_GROUPS),
+                workers=os.cpu_count(),
             )
-            QMessageBox.information(
-                self,
-                "LD data export",
-                "Saved:\n" + "\n".join(written),
-            )
+            saved = [r.path for r in results if r.ok]
+            failed = [r for r in results if not r.ok]
+            if failed:
+                QMessageBox.warning(
+                    self,
+                    "LD data export",
+                    ("Saved:\n" + "\n".join(saved) + "\n\n" if saved else "")
+                    + "Failed:\n"
+                    + "\n".join(f"{r.path}: {r.error}" for r in failed),
+                )
+            else:
+                QMessageBox.information(
+                    self,
+                    "LD data export",
+                    "Saved:\n" + "\n".join(saved),
+                )
         except Exception as e:
             QMessageBox.critical(self, "LD data export", f"Export failed:\n{e}")
 
@@ -435,11 +457,11 @@ class CostPage(QWidget):
                 door_manufacturer=manufacturer,
             )
             msg_extras = []
-            if self.number_of_lifts > TEMPLATE_MAX_LIFTS:
+            if written > TEMPLATE_MAX_LIFTS:
+                sheets = -(-written // TEMPLATE_MAX_LIFTS)
                 msg_extras.append(
-                    f"Note: the template supports {TEMPLATE_MAX_LIFTS} lifts; "
-                    f"only the first {written} of {self.number_of_lifts} lifts "
-                    "were written."
+                    f"Note: the template sheet holds {TEMPLATE_MAX_LIFTS} lifts; "
+                    f"the {written} lifts were written across {sheets} sheets."
                 )
             if len(revisions_to_write) > TEMPLATE_REVISION_MAX_ROWS:
                 dropped = len(revisions_to_write) - TEMPLATE_REVISION_MAX_ROWS
@@ -11,7 +11,6 @@ from PyQt5.QtGui import QDoubleValidator, QShowEvent
 import copy
 import os
 import sys
-from typing import Optional
 
 from .formula_line_edit import apply_formula_value
 from .override_combobox import OverrideComboBox
@@ -26,7 +25,7 @@ REQUIRED_FIELD_COMBO_QSS: str = (
 )
 from .project_lift_schema import (
     KEY_LAYOUT_INFORMATION,
-    merged_lift_at,
+    merged_lift_view,
     normalize_project_lift_data,
 )
 from .custom_parameter_rows import (
@@ -40,20 +39,21 @@ from .custom_parameter_rows import (
 )
 
 try:
+    from .lift_record import lift_record_at
     from .lift_types import (
         cabin_width_for_load_and_shape,
         cabin_depth_for_load_and_width,
-        load_profile_for_capacity,
     )
 except ImportError:  # running as ``python gui/layout_information_page.py``
     _repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     if _repo_root not in sys.path:
         sys.path.insert(0, _repo_root)
+    from gui.lift_record import lift_record_at
     from gui.lift_types import (
         cabin_width_for_load_and_shape,
         cabin_depth_for_load_and_width,
-        load_profile_for_capacity,
     )
+from lift_designer_vt_graph import LAYOUT_GRAPH, VTGraphEvaluator
 
 
 class LayoutInformationPage(QWidget):
@@ -88,7 +88,6 @@ class LayoutInformationPage(QWidget):
     SPEED_KEY = 'Speed'
     CWT_KEY = 'Counterweight location'
     ACCESS_TYPE_KEY = 'Access type'
-    ACCESSIBLE_YN_KEY = 'Accessible rooms/cwt safety'
     _COMBO_OPTIONS = {
         ROW_DOOR_FIXATION: ['insert rail 40/22', 'insert rail 50/30', 'anchor bolts', 'steel structure'],
         ROW_PERMISSIBLE_SILL: ['ASME-A', 'ASME-B', 'ASME-C1', 'ASME-C2', 'EN81-40%', 'EN81-60%', 'EN81-85%'],
@@ -100,6 +99,25 @@ class LayoutInformationPage(QWidget):
         ROW_SHAFT_DIVISION_TYPE: ['structural wall', 'beam'],
     }
 
+    # Derived rows ↔ nodes of :data:`lift_designer_vt_graph.LAYOUT_GRAPH`. Cabin width / depth
+    # are filled by ``_apply_cabin_*_for_column`` and enter the graph as inputs.
+    _DERIVED_GRAPH = LAYOUT_GRAPH.with_inputs('cabin width (clear)', 'cabin depth (clear)')
+    _DERIVED_NODE_ROWS = {
+        'cladding thickness each wall': ROW_CLADDING,
+        'clear cabin height': ROW_CLEAR_CABIN_HEIGHT,
+        'structural cabin height': ROW_STRUCTURAL_CABIN_HEIGHT,
+        'door width': ROW_DOOR_WIDTH,
+        'door structural opening width': ROW_DOOR_STRUCTURAL_WIDTH,
+        'door height': ROW_DOOR_HEIGHT,
+        'door structural opening height': ROW_DOOR_STRUCTURAL_HEIGHT,
+        'door type': ROW_DOOR_TYPE,
+        'shaft width suggested': ROW_SHAFT_WIDTH_SUGG,
+        'shaft depth suggested': ROW_SHAFT_DEPTH_SUGG,
+        'shaft head suggested': ROW_SHAFT_HEAD_SUGG,
+        'shaft pit suggested': ROW_SHAFT_PIT_SUGG,
+    }
+    _DERIVED_ROW_NODES = {row: name for name, row in _DERIVED_NODE_ROWS.items()}
+
     # (json_key, description label, unit). JSON uses ``json_key`` only — units are in the Unit column.
     LAYOUT_ROWS: tuple[tuple[str, str, str], ...] = (
         ('Cabin type/shape', 'Cabin type/shape', '—'),
@@ -153,6 +171,8 @@ class LayoutInformationPage(QWidget):
         self.user_inputs = user_inputs
         normalize_project_lift_data(self.user_inputs)
         self.number_of_lifts = len(user_inputs['BuildingSystems'])
+        # Per-column :class:`VTGraphEvaluator` so an edit only recomputes its downstream rows.
+        self._derived_evaluators = {}
         self.initUI()
 
         systems = copy.deepcopy(self.user_inputs.get(KEY_LAYOUT_INFORMATION) or [])
@@ -168,21 +188,12 @@ class LayoutInformationPage(QWidget):
         for col in range(2, self.layout_table.columnCount()):
             self._apply_cabin_width_for_column(col)
 
-    def _parse_float(self, text):
-        t = (text or '').strip()
-        if not t:
-            return None
-        try:
-            return float(t.replace(',', '.'))
-        except ValueError:
-            return None
-
     def _apply_cabin_width_for_column(self, col):
         i, ww = col - 2, self.layout_table.cellWidget(self.ROW_CABIN_WIDTH, col)
-        lift = merged_lift_at(self.user_inputs, i)
-        if not lift or not isinstance(ww, QLineEdit):
+        lift = lift_record_at(self.user_inputs, i)
+        if not lift.lift or not isinstance(ww, QLineEdit):
             return
-        v = self._parse_float(str(lift.get(self.LOAD_CAPACITY_KEY, '') or ''))
+        v = lift.load_kg
         if v is None:
             self._sync_derived_fields(col)
             return
@@ -195,13 +206,13 @@ class LayoutInformationPage(QWidget):
 
     def _apply_cabin_depth_for_column(self, col):
         i = col - 2
-        lift = merged_lift_at(self.user_inputs, i)
+        lift = lift_record_at(self.user_inputs, i)
         dw = self.layout_table.cellWidget(self.ROW_CABIN_DEPTH, col)
         ww = self.layout_table.cellWidget(self.ROW_CABIN_WIDTH, col)
-        if not lift or not isinstance(dw, QLineEdit) or not isinstance(ww, QLineEdit):
+        if not lift.lift or not isinstance(dw, QLineEdit) or not isinstance(ww, QLineEdit):
             self._sync_derived_fields(col)
             return
-        v = self._parse_float(str(lift.get(self.LOAD_CAPACITY_KEY, '') or ''))
+        v = lift.load_kg
         if v is None:
             self._sync_derived_fields(col)
             return
@@ -212,157 +223,65 @@ class LayoutInformationPage(QWidget):
 
     def _lift_at_column(self, col):
         i = col - 2
-        lift = merged_lift_at(self.user_inputs, i)
+        lift = merged_lift_view(self.user_inputs, i)
         return lift if lift else None
 
-    def _cladding_mm(self, col):
-        w = self.layout_table.cellWidget(self.ROW_CLADDING, col)
-        if not isinstance(w, QLineEdit):
-            return 0.0
-        v = self._parse_float(w.text())
-        return float(v) if v is not None else 0.0
-
-    def _accessible_rooms_yes(self, lift):
-        return str(lift.get(self.ACCESSIBLE_YN_KEY, '') or '').strip().lower() == 'yes'
-
-    def _sync_derived_fields(self, col):
+    def _sync_derived_fields(self, col, changed=None):
         """
         Excel-dependent layout: row 35 cladding, 36 clear, 37 structural, 40–43 doors,
         44 door type, 53/57 shaft suggested, 59 shaft head suggested, 61 shaft pit suggested.
+
+        Only rows downstream of what changed are recomputed: lift inputs (load, speed,
+        cabin width/depth, …) are diffed against the column's last evaluation, and
+        ``changed`` names the derived row the user just edited, if any.
         """
         lift = self._lift_at_column(col)
         if lift is None:
             return
-        load = self._parse_float(str(lift.get(self.LOAD_CAPACITY_KEY, '') or ''))
-        prof = load_profile_for_capacity(load if load is not None else 0)
-
-        _rows_written = (
-            self.ROW_CLADDING,
-            self.ROW_CLEAR_CABIN_HEIGHT,
-            self.ROW_STRUCTURAL_CABIN_HEIGHT,
-            self.ROW_DOOR_WIDTH,
-            self.ROW_DOOR_STRUCTURAL_WIDTH,
-            self.ROW_DOOR_HEIGHT,
-            self.ROW_DOOR_STRUCTURAL_HEIGHT,
-            self.ROW_DOOR_TYPE,
-            self.ROW_SHAFT_WIDTH_SUGG,
-            self.ROW_SHAFT_DEPTH_SUGG,
-            self.ROW_SHAFT_HEAD_SUGG,
-            self.ROW_SHAFT_PIT_SUGG,
-        )
+        ev = self._derived_evaluators.get(col)
+        if ev is None:
+            ev = VTGraphEvaluator(
+                self._DERIVED_GRAPH,
+                apply=lambda name, comp, c=col: self._apply_derived_node(c, name, comp),
+            )
+            self._derived_evaluators[col] = ev
+
+        cw = self.layout_table.cellWidget(self.ROW_CABIN_WIDTH, col)
+        depth_w = self.layout_table.cellWidget(self.ROW_CABIN_DEPTH, col)
+        inputs = {
+            'load capacity': str(lift.get(self.LOAD_CAPACITY_KEY, '') or ''),
+            'cabin width (clear)': cw.text() if isinstance(cw, QLineEdit) else '',
+            'cabin depth (clear)': depth_w.text() if isinstance(depth_w, QLineEdit) else '',
+            'counterweight location': lift.get(self.CWT_KEY, ''),
+            'access type': lift.get(self.ACCESS_TYPE_KEY, ''),
+            'accessible rooms yes': lift_record_at(self.user_inputs, col - 2).accessible_rooms_yes,
+            'speed': lift.get(self.SPEED_KEY, ''),
+        }
+
         _blocked = []
-        for r in _rows_written:
+        for r in self._DERIVED_NODE_ROWS.values():
             w = self.layout_table.cellWidget(r, col)
             if w is not None and hasattr(w, 'blockSignals'):
                 w.blockSignals(True)
                 _blocked.append(w)
         try:
-            self._sync_derived_fields_core(col, prof)
+            ev.update(inputs, touched=(changed,) if changed else ())
         finally:
             for w in _blocked:
                 w.blockSignals(False)
 
-    def _sync_derived_fields_core(self, col, prof):
-        lift = self._lift_at_column(col)
-        if lift is None:
-            return
-
-        cw = self.layout_table.cellWidget(self.ROW_CABIN_WIDTH, col)
-        clad_w = self.layout_table.cellWidget(self.ROW_CLADDING, col)
-        depth_w = self.layout_table.cellWidget(self.ROW_CABIN_DEPTH, col)
-        clear_w = self.layout_table.cellWidget(self.ROW_CLEAR_CABIN_HEIGHT, col)
-        struct_w = self.layout_table.cellWidget(self.ROW_STRUCTURAL_CABIN_HEIGHT, col)
-        door_w = self.layout_table.cellWidget(self.ROW_DOOR_WIDTH, col)
-        door_sw = self.layout_table.cellWidget(self.ROW_DOOR_STRUCTURAL_WIDTH, col)
-        door_h = self.layout_table.cellWidget(self.ROW_DOOR_HEIGHT, col)
-        door_sh = self.layout_table.cellWidget(self.ROW_DOOR_STRUCTURAL_HEIGHT, col)
-        door_type_w = self.layout_table.cellWidget(self.ROW_DOOR_TYPE, col)
-        shaft_w = self.layout_table.cellWidget(self.ROW_SHAFT_WIDTH_SUGG, col)
-        shaft_d = self.layout_table.cellWidget(self.ROW_SHAFT_DEPTH_SUGG, col)
-        shaft_head_w = self.layout_table.cellWidget(self.ROW_SHAFT_HEAD_SUGG, col)
-        shaft_pit_w = self.layout_table.cellWidget(self.ROW_SHAFT_PIT_SUGG, col)
-
-        cabin_txt = cw.text() if isinstance(cw, QLineEdit) else ''
-
-        c_thick = prof.cladding_thickness_mm()
-        if c_thick is not None and isinstance(clad_w, QLineEdit):
-            apply_formula_value(clad_w, c_thick)
-        clad = self._cladding_mm(col)
-
-        acc_yes = self._accessible_rooms_yes(lift)
-        access = lift.get(self.ACCESS_TYPE_KEY, '')
-        cwt = lift.get(self.CWT_KEY, '')
-
-        ch = prof.clear_cabin_height_mm(cabin_txt)
-        if isinstance(clear_w, QLineEdit):
-            apply_formula_value(clear_w, ch)
-
-        clear_txt = clear_w.text() if isinstance(clear_w, QLineEdit) else ''
-        sh = prof.structural_cabin_height_mm(clear_txt)
-        if isinstance(struct_w, QLineEdit):
-            apply_formula_value(struct_w, sh)
-
-        dw_i = prof.door_width_mm(cabin_txt)
-        if isinstance(door_w, QLineEdit):
-            apply_formula_value(door_w, dw_i)
-
-        door_sw_computed: Optional[str] = None
-        if isinstance(door_w, QLineEdit):
-            odw = door_w.text().strip()
-            try:
-                dv = float(odw.replace(',', '.'))
-                door_sw_computed = (
-                    str(int(dv + 280)) if dv == int(dv) else str(dv + 280)
-                )
-            except ValueError:
-                door_sw_computed = None
-        if isinstance(door_sw, QLineEdit):
-            apply_formula_value(door_sw, door_sw_computed)
-
-        dhi = prof.door_height_mm(clear_txt)
-        if isinstance(door_h, QLineEdit):
-            apply_formula_value(door_h, dhi)
-
-        door_ht_txt = door_h.text() if isinstance(door_h, QLineEdit) else ''
-        dsh = prof.door_structural_opening_height_mm(door_ht_txt)
-        if isinstance(door_sh, QLineEdit):
-            apply_formula_value(door_sh, dsh)
-
-        dt = prof.door_type_code(cabin_txt, cwt)
-        if isinstance(door_type_w, QLineEdit):
-            apply_formula_value(door_type_w, dt)
-
-        sw = prof.shaft_width_suggested_mm(cabin_txt, clad, acc_yes)
-        if isinstance(shaft_w, QLineEdit):
-            apply_formula_value(shaft_w, sw)
-
-        depth_txt = depth_w.text() if isinstance(depth_w, QLineEdit) else ''
-        sd = prof.shaft_depth_suggested_mm(depth_txt, clad, access)
-        if isinstance(shaft_d, QLineEdit):
-            apply_formula_value(shaft_d, sd)
-
-        struct_txt = struct_w.text() if isinstance(struct_w, QLineEdit) else ''
-        door_w_txt = door_w.text() if isinstance(door_w, QLineEdit) else ''
-        door_type_txt = (
-            door_type_w.text() if isinstance(door_type_w, QLineEdit) else ''
-        ).strip()
-        speed_raw = lift.get(self.SPEED_KEY, '')
-
-        head_s = prof.shaft_head_suggested_mm(
-            struct_txt,
-            speed_raw,
-            cabin_txt,
-            door_w_txt,
-            door_type_txt,
-            clad,
-            acc_yes,
-        )
-        if isinstance(shaft_head_w, QLineEdit):
-            apply_formula_value(shaft_head_w, head_s)
-
-        pit_s = prof.shaft_pit_suggested_mm(speed_raw)
-        if isinstance(shaft_pit_w, QLineEdit):
-            apply_formula_value(shaft_pit_w, pit_s)
+    def _apply_derived_node(self, col, name, computed):
+        """Push one graph result into its cell; returns what the cell now shows."""
+        row = self._DERIVED_NODE_ROWS.get(name)
+        if row is None:
+            return computed if computed is not None else ''
+        w = self.layout_table.cellWidget(row, col)
+        if not isinstance(w, QLineEdit):
+            return ''
+        # Cladding has no default for unknown loads; leave whatever the user typed.
+        if computed is not None or row != self.ROW_CLADDING:
+            apply_formula_value(w, computed)
+        return w.text()
 
     def initUI(self):
         self.setMinimumSize(800, 600)
@@ -478,6 +397,7 @@ class LayoutInformationPage(QWidget):
                 self._apply_cabin_width_for_column(col)
 
         # Refresh formula-driven cells: manual values are preserved and flagged when they differ.
+        self._derived_evaluators.clear()
         for col in range(2, self.layout_table.columnCount()):
             self._sync_derived_fields(col)
 
@@ -491,6 +411,7 @@ class LayoutInformationPage(QWidget):
         self.layout_table.setHorizontalHeaderItem(
             col_position, QTableWidgetItem(f'Lift {col_position - 1}')
         )
+        self._derived_evaluators.pop(col_position, None)
 
         for row in range(len(self.LAYOUT_ROWS)):
             if row == self.ROW_CABIN_TYPE:
@@ -513,17 +434,21 @@ class LayoutInformationPage(QWidget):
             elif row == self.ROW_CLADDING:
                 widget = QLineEdit()
                 widget.setValidator(QDoubleValidator())
-                widget.textChanged.connect(lambda *_a, cp=col_position: self._sync_derived_fields(cp))
+                widget.textChanged.connect(
+                    lambda *_a, cp=col_position, n=self._DERIVED_ROW_NODES[row]: self._sync_derived_fields(cp, n)
+                )
             elif row == self.ROW_CLEAR_CABIN_HEIGHT:
                 widget = QLineEdit()
                 widget.setValidator(QDoubleValidator())
-                widget.textChanged.connect(lambda *_a, cp=col_position: self._sync_derived_fields(cp))
+                widget.textChanged.connect(
+                    lambda *_a, cp=col_position, n=self._DERIVED_ROW_NODES[row]: self._sync_derived_fields(cp, n)
+                )
                 
             elif row == self.ROW_STRUCTURAL_CABIN_HEIGHT:
                 widget = QLineEdit()
                 widget.setValidator(QDoubleValidator())
                 widget.textChanged.connect(
-                    lambda *_a, cp=col_position: self._sync_derived_fields(cp)
+                    lambda *_a, cp=col_position, n=self._DERIVED_ROW_NODES[row]: self._sync_derived_fields(cp, n)
                 )
             elif row in (
                 self.ROW_DOOR_WIDTH,
@@ -533,12 +458,12 @@ class LayoutInformationPage(QWidget):
             ):
                 widget = QLineEdit()
                 widget.textChanged.connect(
-                    lambda *_a, cp=col_position: self._sync_derived_fields(cp)
+                    lambda *_a, cp=col_position, n=self._DERIVED_ROW_NODES[row]: self._sync_derived_fields(cp, n)
                 )
             elif row == self.ROW_DOOR_TYPE:
                 widget = QLineEdit()
                 widget.textChanged.connect(
-                    lambda *_a, cp=col_position: self._sync_derived_fields(cp)
+                    lambda *_a, cp=col_position, n=self._DERIVED_ROW_NODES[row]: self._sync_derived_fields(cp, n)
                 )
             elif row in (
                 self.ROW_SHAFT_WIDTH_SUGG,
@@ -548,7 +473,7 @@ class LayoutInformationPage(QWidget):
             ):
                 widget = QLineEdit()
                 widget.textChanged.connect(
-                    lambda *_a, cp=col_position: self._sync_derived_fields(cp)
+                    lambda *_a, cp=col_position, n=self._DERIVED_ROW_NODES[row]: self._sync_derived_fields(cp, n)
                 )
             elif row in self._COMBO_OPTIONS:
                 w = OverrideComboBox()
@@ -0,0 +1,224 @@
+"""
+Typed, parse-once view of one lift's UI inputs.
+
+:func:`~gui.project_lift_schema.merged_lift_view` and the ``LiftDrive`` / ``Forces`` rows hold
+raw UI text (``"1600"``, ``"1,6"``, ``" CWT-Left "``). Derivation
+(:func:`lift_designer_vt_derived.compute_derived`), the LD export resolvers and the Layout /
+Electrical / Mechanical pages all need the same handful of those cells, most of them as
+numbers. :class:`LiftRecord` reads each one once — alias keys resolved, text stripped,
+numbers parsed, dropdown values normalized — and lists cells holding text where a number is
+expected in :attr:`LiftRecord.parse_errors`, so inputs are validated in one place.
+
+Build one with :func:`lift_record_at` (from ``user_inputs``) or :func:`lift_record` (from
+already-merged dicts). The record keeps references to the source dicts for the fields it
+does not type; treat them as read-only.
+"""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from .lift_types import _norm_access, _parse_int, _parse_number
+from .project_lift_schema import merged_lift_view
+
+__all__ = [
+    "LiftRecord",
+    "lift_record",
+    "lift_record_at",
+]
+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# (attribute, section, UI keys). Section is ``"lift"`` (general spec + layout), ``"drive"``
+# or ``"forces"``; the first key holding a non-blank value wins.
+_TEXT_FIELDS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("load_capacity", "lift", ("Load capacity", "Load capacity (kg)")),
+    ("persons", "lift", ("Permissible number of persons", "Permissible number of persons (Pers.)")),
+    ("speed", "lift", ("Speed", "Speed (m/s)")),
+    ("cabin_shape", "lift", ("Cabin type/shape",)),
+    ("cwt_location", "lift", ("Counterweight location",)),
+    ("access_type", "lift", ("Access type",)),
+    ("accessible_rooms", "lift", ("Accessible rooms/cwt safety", "Accessible rooms / cwt safety")),
+    ("cladding", "lift", ("Cladding thickness each wall", "Cladding thickness each wall (mm)")),
+    ("clear_height", "lift", ("Clear cabin height", "Clear cabin height (mm)")),
+    ("travel_height", "lift", ("Travel height", "Travel height (m)")),
+    ("door_width", "lift", ("Door width", "Door width (mm)")),
+    ("cabin_width", "lift", ("Cabin width", "Cabin width (mm)")),
+    ("cabin_depth", "lift", ("Cabin depth", "Cabin depth (mm)")),
+    ("structural_height", "lift", ("Structural cabin height", "Structural cabin height (mm)")),
+    ("door_height", "lift", ("Door height", "Door height (mm)")),
+    ("door_type", "lift", ("Door type", "door type")),
+    ("door_fixation", "lift", ("door fixation type", "Door fixation type")),
+    ("shaft_fixation", "lift", ("Shaft equipment fixation type",)),
+    ("lop_location", "lift", ("LOP type and location", "LOP type and locaion")),
+    ("lip_location", "lift", ("LIP type and location",)),
+    ("duty_cycle", "drive", ("Duty cycle (motor)", "Duty cycle (motor) (%)")),
+    ("car_buffers", "forces", (
+        "Number of car buffers", "Number of car buffers (St.)", "number of car buffers (kg/m)",
+    )),
+    ("cwt_buffers", "forces", ("Number of cwt buffers", "Number of cwt buffers (St.)")),
+    ("cwt_safety_gear", "forces", ("Counterweight safety gear",)),
+)
+
+# (number attribute, text attribute, rounded to int?)
+_NUMBER_FIELDS: Tuple[Tuple[str, str, bool], ...] = (
+    ("load_kg", "load_capacity", True),
+    ("persons_count", "persons", False),
+    ("speed_m_s", "speed", False),
+    ("cladding_mm", "cladding", False),
+    ("clear_height_mm", "clear_height", False),
+    ("travel_m", "travel_height", False),
+    ("door_width_mm", "door_width", True),
+    ("cabin_width_mm", "cabin_width", True),
+    ("cabin_depth_mm", "cabin_depth", True),
+    ("structural_height_mm", "structural_height", False),
+    ("door_height_mm", "door_height", False),
+    ("duty_cycle_pct", "duty_cycle", False),
+    ("car_buffer_count", "car_buffers", False),
+    ("cwt_buffer_count", "cwt_buffers", False),
+)
+
+# Text attribute → UI label reported in ``parse_errors``.
+_FIELD_LABELS: Dict[str, str] = {attr: keys[0] for attr, _section, keys in _TEXT_FIELDS}
+
+# Lowercased Yes/No cell text read as "yes".
+_YES: FrozenSet[str] = frozenset({"yes", "y", "true", "1"})
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class LiftRecord:
+    """
+    One lift's inputs, read once. Text attributes hold the stripped UI value (``""`` when
+    blank); number attributes hold the parsed value (``None`` when blank or not numeric).
+    """
+
+    lift: Mapping[str, Any] = field(default_factory=dict)
+    drive: Mapping[str, Any] = field(default_factory=dict)
+    forces: Mapping[str, Any] = field(default_factory=dict)
+
+    # --- stripped UI text
+    load_capacity: str = ""
+    persons: str = ""
+    speed: str = ""
+    cabin_shape: str = ""
+    cwt_location: str = ""
+    access_type: str = ""
+    accessible_rooms: str = ""
+    cladding: str = ""
+    clear_height: str = ""
+    travel_height: str = ""
+    door_width: str = ""
+    cabin_width: str = ""
+    cabin_depth: str = ""
+    structural_height: str = ""
+    door_height: str = ""
+    door_type: str = ""
+    door_fixation: str = ""
+    shaft_fixation: str = ""
+    lop_location: str = ""
+    lip_location: str = ""
+    duty_cycle: str = ""
+    car_buffers: str = ""
+    cwt_buffers: str = ""
+    cwt_safety_gear: str = ""
+
+    # --- parsed numbers
+    load_kg: Optional[int] = None
+    persons_count: Optional[float] = None
+    speed_m_s: Optional[float] = None
+    cladding_mm: Optional[float] = None
+    clear_height_mm: Optional[float] = None
+    travel_m: Optional[float] = None
+    door_width_mm: Optional[int] = None
+    cabin_width_mm: Optional[int] = None
+    cabin_depth_mm: Optional[int] = None
+    structural_height_mm: Optional[float] = None
+    door_height_mm: Optional[float] = None
+    duty_cycle_pct: Optional[float] = None
+    car_buffer_count: Optional[float] = None
+    cwt_buffer_count: Optional[float] = None
+
+    # --- normalized dropdowns
+    # Lowercase, whitespace-collapsed access type (``"front + rear"``, ``"adjacent"`` …).
+    access: str = ""
+    # ``"left"`` / ``"right"`` for ``CWT-Left`` / ``CWT-Right`` (any case), else ``None``.
+    cwt_side: Optional[str] = None
+    # Lowercase cabin shape (``"deep"`` / ``"wide"``).
+    shape: str = ""
+    # ``yes`` / ``y`` / ``true`` / ``1`` (any case) — the one parse of both Yes/No fields.
+    accessible_rooms_yes: bool = False
+    cwt_safety_gear_yes: bool = False
+
+    # ``(UI label, text)`` for every non-blank cell that should be numeric but is not.
+    parse_errors: Tuple[Tuple[str, str], ...] = ()
+
+
+def _text(v: Any) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "yes" if v else "no"
+    return str(v).strip()
+
+
+def _first_text(d: Mapping[str, Any], keys: Tuple[str, ...]) -> str:
+    for k in keys:
+        t = _text(d.get(k))
+        if t:
+            return t
+    return ""
+
+
+def lift_record(
+    lift: Mapping[str, Any],
+    drive: Optional[Mapping[str, Any]] = None,
+    forces: Optional[Mapping[str, Any]] = None,
+) -> LiftRecord:
+    """Build the record from a merged lift dict and that lift's drive / forces rows."""
+    sections: Dict[str, Mapping[str, Any]] = {
+        "lift": lift if isinstance(lift, Mapping) else {},
+        "drive": drive if isinstance(drive, Mapping) else {},
+        "forces": forces if isinstance(forces, Mapping) else {},
+    }
+    values: Dict[str, Any] = dict(sections)
+    for attr, section, keys in _TEXT_FIELDS:
+        values[attr] = _first_text(sections[section], keys)
+
+    errors = []
+    for attr, text_attr, as_int in _NUMBER_FIELDS:
+        text = values[text_attr]
+        if not text:
+            continue
+        num = _parse_int(text) if as_int else _parse_number(text)
+        if num is None:
+            errors.append((_FIELD_LABELS[text_attr], text))
+        values[attr] = num
+
+    cwt = values["cwt_location"].lower()
+    values["access"] = _norm_access(values["access_type"])
+    values["cwt_side"] = "left" if cwt == "cwt-left" else "right" if cwt == "cwt-right" else None
+    values["shape"] = values["cabin_shape"].lower()
+    values["accessible_rooms_yes"] = values["accessible_rooms"].lower() in _YES
+    values["cwt_safety_gear_yes"] = values["cwt_safety_gear"].lower() in _YES
+    values["parse_errors"] = tuple(errors)
+    return LiftRecord(**values)
+
+
+def _section_row(ui: Mapping[str, Any], key: str, idx: int) -> Mapping[str, Any]:
+    rows = ui.get(key) or []
+    if 0 <= idx < len(rows) and isinstance(rows[idx], dict):
+        return rows[idx]
+    return {}
+
+
+def lift_record_at(user_inputs: Mapping[str, Any], idx: int) -> LiftRecord:
+    """Record for lift ``idx`` of a project (general spec + layout, ``LiftDrive``, ``Forces``)."""
+    if not isinstance(user_inputs, dict):
+        return LiftRecord()
+    return lift_record(
+        merged_lift_view(user_inputs, idx),
+        _section_row(user_inputs, "LiftDrive", idx),
+        _section_row(user_inputs, "Forces", idx),
+    )
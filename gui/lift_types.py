@@ -3,34 +3,59 @@ Lift system types and per-capacity rules mirroring ``VT standard configurations`
 (columns M–U ↔ loads 630 … 3500 kg).
 
 Use ``load_profile_for_capacity(load_kg)`` for the profile instance; methods return
-``None`` when the UI should not overwrite the cell.
+``None`` when the UI should not overwrite the cell. Profiles are shared, stateless
+singletons — one per capacity. ``load_profile_constants(load_kg, shape, cwt)`` serves
+the outputs that only depend on capacity, cabin shape and CWT side from a lookup table.
 """
 from __future__ import annotations
 
-from typing import Optional, Tuple, Type
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
 
 
-def _parse_width_mm(text: str) -> Optional[int]:
-    t = (text or "").strip()
+def _parse_number(raw: object) -> Optional[float]:
+    """
+    Float value of a UI cell (``"1,6"`` → ``1.6``); ``None`` when blank or not numeric.
+
+    Numbers pass straight through, so callers holding pre-parsed values (see
+    :class:`gui.lift_record.LiftRecord`) skip the strip / comma-replace / ``float`` step.
+    """
+    if isinstance(raw, float):
+        return raw
+    if isinstance(raw, int) and not isinstance(raw, bool):
+        return float(raw)
+    t = str(raw if raw is not None else "").strip()
     if not t:
         return None
     try:
-        return int(round(float(t.replace(",", "."))))
+        return float(t.replace(",", "."))
     except (ValueError, TypeError, OverflowError):
         return None
 
 
-def _parse_height_mm(text: str) -> Optional[float]:
-    """Numeric cabin/door height (mm); fails on status messages."""
-    t = (text or "").strip()
-    if not t:
+def _parse_int(raw: object) -> Optional[int]:
+    """:func:`_parse_number` rounded to the nearest integer (``None`` for inf / NaN)."""
+    if isinstance(raw, int) and not isinstance(raw, bool):
+        return raw
+    v = _parse_number(raw)
+    if v is None:
         return None
     try:
-        return float(t.replace(",", "."))
-    except (ValueError, TypeError, OverflowError):
+        return int(round(v))
+    except (ValueError, OverflowError):
         return None
 
 
+def _parse_width_mm(text: str) -> Optional[int]:
+    return _parse_int(text)
+
+
+def _parse_height_mm(text: str) -> Optional[float]:
+    """Numeric cabin/door height (mm); fails on status messages."""
+    return _parse_number(text)
+
+
 def _fmt_dim_str(x: float) -> str:
     if abs(x - round(x)) < 1e-6:
         return str(int(round(x)))
@@ -72,18 +97,8 @@ def _cwt_side_code(cwt_location: str) -> Optional[str]:
     return None
 
 
-def _accessible_rooms_yes(value: object) -> bool:
-    return str(value or "").strip().lower() == "yes"
-
-
 def _parse_speed_m_s(raw: object) -> Optional[float]:
-    t = str(raw or "").strip().replace(",", ".")
-    if not t:
-        return None
-    try:
-        return float(t)
-    except (ValueError, TypeError, OverflowError):
-        return None
+    return _parse_number(raw)
 
 
 def _speed_eq(speed: float, target: float) -> bool:
@@ -198,22 +213,31 @@ PERMISSIBLE_PERSONS_BY_CAPACITY_KG: dict[int, int] = {
 
 def permissible_persons_for_capacity(load_kg: object) -> Optional[str]:
     """Standard permissible persons string for a nominal load (kg), or ``None`` if unknown."""
-    try:
-        raw = str(load_kg).strip().replace(",", ".")
-        if not raw:
-            return None
-        n = int(round(float(raw)))
-    except (ValueError, TypeError, OverflowError):
+    n = _parse_int(load_kg)
+    if n is None:
         return None
     v = PERMISSIBLE_PERSONS_BY_CAPACITY_KG.get(n)
     return str(v) if v is not None else None
 
 
 class LiftLoadProfile:
-    """Base profile for one nominal load capacity (kg)."""
+    """
+    Base profile for one nominal load capacity (kg).
+
+    Profiles are shared per capacity (see :func:`load_profile_for_capacity`), so instances
+    are read-only: assigning an attribute raises :class:`AttributeError`.
+    """
+
+    __slots__ = ()
 
     capacity_kg: int = 0
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is a shared, read-only load profile")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is a shared, read-only load profile")
+
     def cabin_width_mm(self, cabin_shape: str) -> Optional[str]:
         return None
 
@@ -391,12 +415,8 @@ def electrical_hvac_derived_for_lift(
     future capacity uses a different expression.
     """
     prof = load_profile_for_capacity(load_kg)
-    try:
-        raw_p = str(permissible_persons or "").strip().replace(",", ".")
-        if not raw_p:
-            return {}
-        persons = float(raw_p)
-    except (ValueError, TypeError, OverflowError):
+    persons = _parse_number(permissible_persons)
+    if persons is None:
         return {}
 
     p_kw = prof.motor_power_kw_from_persons(persons)
@@ -411,16 +431,15 @@ def electrical_hvac_derived_for_lift(
         "Starting current (factor ≈ 2)": _fmt_electrical_num(i_s, 2),
     }
 
-    try:
-        raw_d = str(duty_cycle_pct or "").strip().replace(",", ".")
-        if raw_d:
-            dc = float(raw_d)
+    dc = _parse_number(duty_cycle_pct)
+    if dc is not None:
+        try:
             e85 = prof.energy_consumption_kwh(p_kw, dc)
             h86 = prof.heat_dissipation_motor_kj(e85)
             out["Energy consumption"] = _fmt_electrical_num(e85, 4)
             out["Heat dissipation motor"] = _fmt_electrical_num(h86, 2)
-    except (ValueError, TypeError, OverflowError):
-        pass
+        except (ValueError, TypeError, OverflowError):
+            pass
 
     return out
 
@@ -453,26 +472,14 @@ MECHANICAL_RAIL_WEIGHT_CWT_KG_M: dict[int, int] = {
 
 
 def _mechanical_load_capacity_int(load_kg: object) -> Optional[int]:
-    try:
-        raw = str(load_kg).strip().replace(",", ".")
-        if not raw:
-            return None
-        return int(round(float(raw)))
-    except (ValueError, TypeError, OverflowError):
-        return None
+    return _parse_int(load_kg)
 
 
 def _mechanical_positive_float(raw: object) -> Optional[float]:
-    try:
-        t = str(raw or "").strip().replace(",", ".")
-        if not t:
-            return None
-        v = float(t)
-        if v <= 0.0:
-            return None
-        return v
-    except (ValueError, TypeError, OverflowError):
+    v = _parse_number(raw)
+    if v is None or v <= 0.0:
         return None
+    return v
 
 
 def mechanical_rail_weight_car_kg_m(load_kg: object) -> Optional[str]:
@@ -1349,8 +1356,13 @@ class LiftLoad3500(LiftLoadProfile):
 class LiftLoadDefault(LiftLoadProfile):
     """Any capacity without dedicated rules."""
 
+    __slots__ = ("capacity_kg",)
+
     def __init__(self, capacity_kg: int = 0) -> None:
-        self.capacity_kg = capacity_kg
+        object.__setattr__(self, "capacity_kg", capacity_kg)
+
+    def __reduce__(self):
+        return LiftLoadDefault, (self.capacity_kg,)
 
     def shaft_head_suggested_mm(
         self,
@@ -1382,23 +1394,99 @@ _REGISTRY: dict[int, Type[LiftLoadProfile]] = {
 }
 
 
+# One shared instance per capacity (registered class, else ``LiftLoadDefault``).
+_PROFILES: Dict[int, LiftLoadProfile] = {}
+# Bumped by :func:`register_load_profile`; caches of profile-derived values key on it.
+_registry_generation = 0
+
+
+def _capacity_key(load_kg: object) -> int:
+    n = _parse_int(load_kg)
+    return 0 if n is None else n
+
+
+def _profile_for_key(n: int) -> LiftLoadProfile:
+    prof = _PROFILES.get(n)
+    if prof is None:
+        cls = _REGISTRY.get(n) if n else None
+        prof = _PROFILES[n] = cls() if cls is not None else LiftLoadDefault(n)
+    return prof
+
+
 def load_profile_for_capacity(load_kg: object) -> LiftLoadProfile:
-    try:
-        raw = str(load_kg).strip().replace(",", ".")
-        if not raw:
-            return LiftLoadDefault(0)
-        n = int(round(float(raw)))
-    except (ValueError, TypeError, OverflowError):
-        return LiftLoadDefault(0)
+    return _profile_for_key(_capacity_key(load_kg))
+
+
+@dataclass(frozen=True)
+class LoadProfileConstants:
+    """
+    Outputs fixed by capacity, cabin shape and CWT side (Excel rows 21, 33–36, 40, 44,
+    90, 96), with the width-dependent rows read at the standard width for the shape.
+    Values are the strings the profile methods return (``None`` = do not overwrite).
+    """
+
+    capacity_kg: int
+    cabin_shape: str
+    cwt_side: Optional[str]
+    cabin_width_mm: Optional[str]
+    cabin_depth_mm: Optional[str]
+    clear_cabin_height_mm: Optional[str]
+    door_width_mm: Optional[str]
+    door_type_code: Optional[str]
+    cladding_thickness_mm: Optional[str]
+    permissible_persons: Optional[str]
+    rail_weight_car_kg_m: Optional[str]
+    rail_weight_cwt_kg_m: Optional[str]
+
+
+_CWT_LOCATION_FOR_SIDE: Dict[Optional[str], str] = {"2L": "CWT-Left", "2R": "CWT-Right", None: ""}
+# Shapes the profiles distinguish (exact, after stripping); any other text reads as "".
+_CABIN_SHAPES = frozenset({"Deep", "Wide"})
+
+
+@lru_cache(maxsize=1024)
+def _build_profile_constants(n: int, shape: str, side: Optional[str]) -> LoadProfileConstants:
+    prof = _profile_for_key(n)
+    cw = prof.cabin_width_mm(shape)
+    cw_used = cw if cw is not None else ""
+    return LoadProfileConstants(
+        capacity_kg=n,
+        cabin_shape=shape,
+        cwt_side=side,
+        cabin_width_mm=cw,
+        cabin_depth_mm=prof.cabin_depth_mm(cw_used),
+        clear_cabin_height_mm=prof.clear_cabin_height_mm(cw_used),
+        door_width_mm=prof.door_width_mm(cw_used),
+        door_type_code=prof.door_type_code(cw_used, _CWT_LOCATION_FOR_SIDE[side]),
+        cladding_thickness_mm=prof.cladding_thickness_mm(),
+        permissible_persons=prof.permissible_number_of_persons(),
+        rail_weight_car_kg_m=mechanical_rail_weight_car_kg_m(n),
+        rail_weight_cwt_kg_m=mechanical_rail_weight_cwt_kg_m(n),
+    )
+
+
+def load_profile_constants(
+    load_kg: object, cabin_shape: str = "", cwt_location: str = ""
+) -> LoadProfileConstants:
+    """
+    Table row for ``(capacity, cabin shape, CWT side)``; rows are computed from the
+    capacity's profile, kept in a bounded LRU table and dropped when
+    :func:`register_load_profile` replaces a profile. Shapes other than ``"Deep"`` /
+    ``"Wide"`` share the ``""`` row.
+    """
+    shape = (cabin_shape or "").strip()
+    if shape not in _CABIN_SHAPES:
+        shape = ""
+    return _build_profile_constants(_capacity_key(load_kg), shape, _cwt_side_code(cwt_location))
+
 
-    cls = _REGISTRY.get(n)
-    if cls is not None:
-        return cls()
-    return LiftLoadDefault(n)
+def load_profile_generation() -> int:
+    """Changes whenever :func:`register_load_profile` swaps a profile (for cache keys)."""
+    return _registry_generation
 
 
 def cabin_width_for_load_and_shape(load_kg: object, cabin_shape: str) -> Optional[str]:
-    return load_profile_for_capacity(load_kg).cabin_width_mm(cabin_shape)
+    return load_profile_constants(load_kg, cabin_shape).cabin_width_mm
 
 
 def cabin_depth_for_load_and_width(load_kg: object, cabin_width: str) -> Optional[str]:
@@ -1406,4 +1494,9 @@ def cabin_depth_for_load_and_width(load_kg: object, cabin_width: str) -> Optiona
 
 
 def register_load_profile(capacity_kg: int, profile_cls: Type[LiftLoadProfile]) -> None:
-    _REGISTRY[int(capacity_kg)] = profile_cls
+    global _registry_generation
+    n = int(capacity_kg)
+    _REGISTRY[n] = profile_cls
+    _PROFILES.pop(n, None)
+    _build_profile_constants.cache_clear()
+    _registry_generation += 1
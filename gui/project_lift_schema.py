@@ -9,12 +9,14 @@ New projects use:
 - ``LayoutInformation`` — Layout Information page fields only (one dict per lift). Keys are
   unit-free (e.g. ``Cabin width``); units appear only in the UI Unit column.
 
-:func:`normalize_project_lift_data` splits legacy ``LiftSystems`` on load; :func:`merged_lift_at`
-combines both dicts for code that needs a single merged view (export, derived calculations).
+:func:`normalize_project_lift_data` splits legacy ``LiftSystems`` on load. :func:`merged_lift_view`
+combines both dicts for code that needs a single merged view (export, derived calculations)
+without copying them; :func:`merged_lift_at` returns the same merge as a new dict.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Mapping, MutableMapping, Sequence
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Sequence
 
 # Building System page: consecutive lift columns merged under group headers; sums to ``len(BuildingSystems)``.
 KEY_LIFT_COLUMN_GROUPS = "LiftColumnGroups"
@@ -481,16 +483,80 @@ def finalize_project_json_for_save(data: MutableMapping[str, Any]) -> None:
         data.pop(KEY_LIFT_SYSTEMS_LEGACY, None)
 
 
-def merged_lift_at(data: Mapping[str, Any], idx: int) -> Dict[str, Any]:
-    """Single merged dict for lift ``idx`` (general + layout). Read-only merge."""
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+_MISSING = object()
+
+
+class MergedLiftView(Mapping[str, Any]):
+    """
+    Read-only ``{**general, **layout}`` over one lift's two section dicts, without copying.
+
+    Layout wins for every key it holds (even blank values); iteration order matches the
+    dict merge — general keys first, then layout-only keys. The view reads the live
+    dicts, so in-place edits show through; a page that replaces a section dict or list
+    needs a fresh view from :func:`merged_lift_view`.
+    """
+
+    __slots__ = ("general", "layout")
+
+    def __init__(self, general: Mapping[str, Any], layout: Mapping[str, Any]) -> None:
+        self.general = general
+        self.layout = layout
+
+    def __getitem__(self, key: str) -> Any:
+        v = self.layout.get(key, _MISSING)
+        if v is _MISSING:
+            return self.general[key]
+        return v
+
+    def get(self, key: str, default: Any = None) -> Any:
+        v = self.layout.get(key, _MISSING)
+        if v is _MISSING:
+            return self.general.get(key, default)
+        return v
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.layout or key in self.general
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.general
+        general = self.general
+        for k in self.layout:
+            if k not in general:
+                yield k
+
+    def __len__(self) -> int:
+        general = self.general
+        return len(general) + sum(1 for k in self.layout if k not in general)
+
+    def __repr__(self) -> str:
+        return f"MergedLiftView({dict(self)!r})"
+
+    def __reduce__(self):
+        # Pickles (process-pool exports) carry a plain dict snapshot.
+        return (dict, (dict(self),))
+
+
+def _section_at(data: Mapping[str, Any], key: str, idx: int) -> Mapping[str, Any]:
+    rows = data.get(key) or []
+    if 0 <= idx < len(rows) and isinstance(rows[idx], dict):
+        return rows[idx]
+    return _EMPTY_SECTION
+
+
+def merged_lift_view(data: Mapping[str, Any], idx: int) -> MergedLiftView:
+    """Zero-copy merged view of lift ``idx`` (general + layout); see :class:`MergedLiftView`."""
     if not isinstance(data, dict):
-        return {}
-    gen = data.get(KEY_GENERAL_SPECIFICATION) or []
-    lay = data.get(KEY_LAYOUT_INFORMATION) or []
-    g: Dict[str, Any] = dict(gen[idx]) if 0 <= idx < len(gen) and isinstance(gen[idx], dict) else {}
-    l: Dict[str, Any] = dict(lay[idx]) if 0 <= idx < len(lay) and isinstance(lay[idx], dict) else {}
-    out = {**g, **l}
-    return out
+        return MergedLiftView(_EMPTY_SECTION, _EMPTY_SECTION)
+    return MergedLiftView(
+        _section_at(data, KEY_GENERAL_SPECIFICATION, idx),
+        _section_at(data, KEY_LAYOUT_INFORMATION, idx),
+    )
+
+
+def merged_lift_at(data: Mapping[str, Any], idx: int) -> Dict[str, Any]:
+    """Single merged dict for lift ``idx`` (general + layout); a copy the caller may edit."""
+    return dict(merged_lift_view(data, idx))
 
 
 def ensure_lift_section_slots(user_inputs: MutableMapping[str, Any], n_lifts: int) -> None:
@@ -0,0 +1,541 @@
+"""
+NumPy batch evaluation of the ``VT standard configurations`` load-profile formulas.
+
+:func:`evaluate_load_profiles_batch` takes equal-length arrays (or scalars, broadcast)
+of lift inputs and returns one array per output — cabin dimensions, door type, shaft
+width / depth / head / pit, electrical values and mechanical forces — for thousands of
+configurations at once. Results match the scalar path
+(:class:`gui.lift_types.LiftLoadProfile` through :data:`lift_designer_vt_graph.LAYOUT_GRAPH`,
+:func:`gui.lift_types.electrical_hvac_derived_for_lift` and
+:func:`gui.lift_types.mechanical_loading_derived_for_lift`) exactly; :func:`format_batch`
+turns a row back into the scalar path's strings.
+
+How it stays exact:
+
+- The per-class layout formulas are branchy lookups on a handful of discrete inputs
+  (capacity, shape, speed, clear height, cladding, access, CWT side). Rows are grouped
+  with :func:`numpy.unique` and each distinct configuration is evaluated once through
+  the scalar profile, then broadcast back.
+- Electrical and mechanical formulas are plain arithmetic and are evaluated as NumPy
+  expressions in the same operation order as the scalar code; ``round(x, n)`` ties are
+  re-checked with Python's ``round``.
+
+Missing numeric inputs are ``NaN``; missing outputs are ``None`` (object arrays) or
+``NaN`` (float arrays). NumPy is optional for the rest of the app and imported lazily.
+
+Run ``python lift_designer_batch.py`` for the 10k / 1M-row benchmark.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from gui.lift_types import (
+    LiftLoadProfile,
+    _fmt_electrical_num,
+    electrical_hvac_derived_for_lift,
+    load_profile_for_capacity,
+    mechanical_loading_derived_for_lift,
+)
+from lift_designer_vt_graph import LAYOUT_GRAPH, VTGraphEvaluator
+
+
+__all__ = [
+    "LAYOUT_OUTPUTS",
+    "ELECTRICAL_OUTPUTS",
+    "MECHANICAL_OUTPUTS",
+    "evaluate_load_profiles_batch",
+    "evaluate_load_profile_scalar",
+    "format_batch",
+    "benchmark_batch",
+]
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("pip install numpy") from e
+    return np
+
+
+# Scalar cascade with clear cabin height and cladding as inputs (as in a portfolio sweep).
+_BATCH_GRAPH = LAYOUT_GRAPH.with_inputs("clear cabin height", "cladding thickness each wall")
+
+# Output label -> graph node. Labels follow the Layout / General Specification pages.
+LAYOUT_OUTPUTS: Dict[str, str] = {
+    "Cabin width": "cabin width (clear)",
+    "Cabin depth": "cabin depth (clear)",
+    "Structural cabin height": "structural cabin height",
+    "Door width": "door width",
+    "Door height": "door height",
+    "Door structural opening height": "door structural opening height",
+    "door type": "door type",
+    "Shaft width suggested": "shaft width suggested",
+    "Shaft depth suggested": "shaft depth suggested",
+    "Shaft head suggested": "shaft head suggested",
+    "Shaft pit suggested": "shaft pit suggested",
+}
+
+# Output label -> decimals used by ``_fmt_electrical_num`` in the scalar path.
+ELECTRICAL_OUTPUTS: Dict[str, int] = {
+    "Drive/Motor Power": 2,
+    "Connected load": 2,
+    "Rated current": 2,
+    "Starting current (factor ≈ 2)": 2,
+    "Energy consumption": 4,
+    "Heat dissipation motor": 2,
+}
+
+# Output label -> decimals (``0`` = integer kN).
+MECHANICAL_OUTPUTS: Dict[str, int] = {
+    "Force F1, F2 elevator rail segment": 0,
+    "Force F4, per counterweight rail segment": 0,
+    "Force F3, each buffer": 0,
+    "Force F5, per counterweight buffer": 0,
+    "Force F6, static shaft door": 0,
+    "Force F7, static counterweight": 0,
+    "Force F8, static cabin": 0,
+    "Force Fx, cabin rail": 1,
+    "Force Fy, cabin rail": 1,
+    "Force Fx, counterweight rail": 1,
+    "Force Fy, counterweight rail": 1,
+}
+
+_ELECTRICAL_METHODS = (
+    "motor_power_kw_from_persons",
+    "connected_load_kva",
+    "rated_current_a",
+    "starting_current_a",
+    "energy_consumption_kwh",
+    "heat_dissipation_motor_kj",
+)
+
+
+def _num_arg(x: float) -> str:
+    """Scalar-path text for a numeric input (``NaN`` → empty cell)."""
+    return "" if x != x else str(x)
+
+
+def _layout_scalar(
+    capacity: float,
+    shape: str,
+    speed: float,
+    clear_height: float,
+    cladding: float,
+    access_type: str,
+    cwt_location: str,
+    accessible: bool,
+) -> Dict[str, Any]:
+    ev = VTGraphEvaluator(_BATCH_GRAPH)
+    ev.update(
+        {
+            "load capacity": _num_arg(capacity),
+            "cabin type/shape": shape,
+            "speed": _num_arg(speed),
+            "clear cabin height": _num_arg(clear_height),
+            "cladding thickness each wall": _num_arg(cladding),
+            "access type": access_type,
+            "counterweight location": cwt_location,
+            "accessible rooms yes": bool(accessible),
+        }
+    )
+    return ev.values
+
+
+def evaluate_load_profile_scalar(
+    capacity: float,
+    shape: str = "",
+    speed: float = float("nan"),
+    clear_height: float = float("nan"),
+    cladding: float = float("nan"),
+    access_type: str = "",
+    cwt_location: str = "",
+    accessible: bool = False,
+    persons: float = float("nan"),
+    duty_cycle: float = float("nan"),
+    travel_height: float = float("nan"),
+    cwt_safety_gear: bool = False,
+    num_car_buffers: float = 2.0,
+    num_cwt_buffers: float = 2.0,
+) -> Dict[str, str]:
+    """
+    One row through the existing scalar path; keys as in :data:`LAYOUT_OUTPUTS`,
+    :data:`ELECTRICAL_OUTPUTS` and :data:`MECHANICAL_OUTPUTS`. Reference for
+    :func:`evaluate_load_profiles_batch` and the benchmark.
+    """
+    values = _layout_scalar(capacity, shape, speed, clear_height, cladding, access_type, cwt_location, accessible)
+    out: Dict[str, str] = {}
+    for label, node in LAYOUT_OUTPUTS.items():
+        v = values.get(node)
+        if v:
+            out[label] = v
+    cap = _num_arg(capacity)
+    out.update(electrical_hvac_derived_for_lift(cap, _num_arg(persons), _num_arg(duty_cycle)))
+    mech = mechanical_loading_derived_for_lift(
+        cap,
+        _num_arg(travel_height),
+        values.get("cabin width (clear)") or "",
+        values.get("cabin depth (clear)") or "",
+        cwt_safety_gear,
+        _num_arg(num_car_buffers),
+        _num_arg(num_cwt_buffers),
+    )
+    for label in MECHANICAL_OUTPUTS:
+        if label in mech:
+            out[label] = mech[label]
+    return out
+
+
+def _round_like_python(x, decimals: int):
+    """``numpy.round`` with the (rare) near-tie elements redone by Python's ``round``."""
+    np = _numpy()
+    r = np.round(x, decimals)
+    scaled = x * (10.0 ** decimals)
+    frac = scaled - np.floor(scaled)
+    tie = np.isfinite(x) & (np.abs(frac - 0.5) < 1e-6)
+    for i in np.flatnonzero(tie):
+        r[i] = round(float(x[i]), decimals)
+    return r
+
+
+def _int_round(x):
+    """``int(round(x))`` as floats (``numpy.rint`` rounds half to even like ``round``)."""
+    return _numpy().rint(x)
+
+
+def _parse_mm(value: Any) -> float:
+    """``gui.lift_types._parse_width_mm`` as a float (``NaN`` = ``None``)."""
+    t = (value or "").strip()
+    if not t:
+        return float("nan")
+    try:
+        return float(int(round(float(t.replace(",", ".")))))
+    except (ValueError, TypeError, OverflowError):
+        return float("nan")
+
+
+# A batch column is ``(codes, table)``: ``table[codes[i]]`` is row ``i``'s value.
+_Column = Tuple[Any, List[Any]]
+
+# Below this many key combinations, grouping uses a dense lookup instead of a sort.
+_DENSE_KEY_LIMIT = 1 << 22
+
+
+def _encode(np, values, to_python: Callable[[Any], Any]) -> _Column:
+    uniq, inv = np.unique(values, return_inverse=True)
+    return inv.reshape(-1), [to_python(u) for u in uniq]
+
+
+def _group(np, deps: Sequence[_Column]) -> Tuple[Any, List[Tuple[int, ...]]]:
+    """Row → combination index, and the dependency codes of each distinct combination."""
+    sizes = [max(len(t), 1) for _, t in deps]
+    space = 1
+    for k in sizes:
+        space *= k
+    if space > 2 ** 62:
+        stacked = np.stack([c for c, _ in deps], axis=1)
+        combos, inv = np.unique(stacked, axis=0, return_inverse=True)
+        return inv.reshape(-1), [tuple(int(x) for x in row) for row in combos]
+    key = np.zeros(len(deps[0][0]), dtype=np.int64)
+    for (codes, _), k in zip(deps, sizes):
+        key = key * k + codes
+    if space <= _DENSE_KEY_LIMIT:
+        present = np.zeros(space, dtype=bool)
+        present[key] = True
+        uniq = np.flatnonzero(present)
+        remap = np.empty(space, dtype=np.int64)
+        remap[uniq] = np.arange(len(uniq))
+        inv = remap[key]
+    else:
+        uniq, inv = np.unique(key, return_inverse=True)
+        inv = inv.reshape(-1)
+    combos: List[Tuple[int, ...]] = []
+    for u in uniq.tolist():
+        parts = []
+        for k in reversed(sizes):
+            u, r = divmod(u, k)
+            parts.append(r)
+        combos.append(tuple(reversed(parts)))
+    return inv, combos
+
+
+def _layout_batch(np, inputs: Mapping[str, _Column]) -> Dict[str, _Column]:
+    """
+    Evaluate :data:`_BATCH_GRAPH` column-wise: each node's formula runs once per distinct
+    combination of its direct dependencies' values, then results are re-coded.
+    """
+    state: Dict[str, _Column] = dict(inputs)
+    for name in _BATCH_GRAPH.order:
+        node = _BATCH_GRAPH.nodes[name]
+        deps = [state[d] for d in node.deps]
+        inv, combos = _group(np, deps)
+        index: Dict[Tuple[type, Any], int] = {}
+        table: List[Any] = []
+        remap = np.empty(len(combos), dtype=np.int64)
+        for j, combo in enumerate(combos):
+            v = node.formula(*(t[c] for (_, t), c in zip(deps, combo)))
+            if v is None:
+                v = ""
+            k = index.get((type(v), v))
+            if k is None:
+                k = index[(type(v), v)] = len(table)
+                table.append(v)
+            remap[j] = k
+        state[name] = (remap[inv], table)
+    return state
+
+
+def evaluate_load_profiles_batch(
+    capacity: Any,
+    shape: Any = "",
+    speed: Any = float("nan"),
+    clear_height: Any = float("nan"),
+    cladding: Any = float("nan"),
+    access_type: Any = "",
+    cwt_location: Any = "",
+    accessible: Any = False,
+    persons: Any = float("nan"),
+    duty_cycle: Any = float("nan"),
+    travel_height: Any = float("nan"),
+    cwt_safety_gear: Any = False,
+    num_car_buffers: Any = 2.0,
+    num_cwt_buffers: Any = 2.0,
+) -> Dict[str, Any]:
+    """
+    Evaluate the load-profile formulas for many lifts at once.
+
+    Numeric arguments accept float arrays (``NaN`` = empty cell), text arguments string
+    arrays and flags bool arrays; scalars are broadcast. Returns ``{label: array}``:
+    object arrays of strings (``None`` = no value) for :data:`LAYOUT_OUTPUTS`, float
+    arrays (``NaN`` = no value) for :data:`ELECTRICAL_OUTPUTS` (unrounded, as the scalar
+    path computes them before formatting) and :data:`MECHANICAL_OUTPUTS` (rounded).
+    """
+    np = _numpy()
+    arrays = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (capacity,)),
+        np.asarray(shape, dtype=str),
+        *(np.asarray(a, dtype=float) for a in (speed, clear_height, cladding)),
+        np.asarray(access_type, dtype=str),
+        np.asarray(cwt_location, dtype=str),
+        np.asarray(accessible, dtype=bool),
+        *(np.asarray(a, dtype=float) for a in (persons, duty_cycle, travel_height)),
+        np.asarray(cwt_safety_gear, dtype=bool),
+        *(np.asarray(a, dtype=float) for a in (num_car_buffers, num_cwt_buffers)),
+    )
+    (cap, shp, spd, clear, clad, acc_t, cwt, acc, pers, duty, travel, safety, n_car, n_cwt) = (
+        np.ravel(a) for a in arrays
+    )
+    n = len(cap)
+    out: Dict[str, Any] = {}
+
+    # --- layout cascade: each formula once per distinct combination of its inputs
+    layout = _layout_batch(
+        np,
+        {
+            "load capacity": _encode(np, cap, _num_arg),
+            "cabin type/shape": _encode(np, shp, str),
+            "speed": _encode(np, spd, _num_arg),
+            "clear cabin height": _encode(np, clear, _num_arg),
+            "cladding thickness each wall": _encode(np, clad, _num_arg),
+            "access type": _encode(np, acc_t, str),
+            "counterweight location": _encode(np, cwt, str),
+            "accessible rooms yes": _encode(np, acc, bool),
+        },
+    )
+    for label, node in LAYOUT_OUTPUTS.items():
+        codes, table = layout[node]
+        out[label] = np.array([v or None for v in table], dtype=object)[codes]
+
+    # --- per-capacity profile facts
+    cap_uniq, cap_inv = np.unique(cap, return_inverse=True)
+    cap_inv = cap_inv.reshape(-1)
+    profiles = [load_profile_for_capacity(_num_arg(float(c))) for c in cap_uniq]
+    profile_kg = np.array([float(p.capacity_kg) for p in profiles])[cap_inv]
+    base_elec = np.array(
+        [all(getattr(type(p), m) is getattr(LiftLoadProfile, m) for m in _ELECTRICAL_METHODS) for p in profiles]
+    )[cap_inv]
+    base_f12 = np.array(
+        [
+            type(p).force_f1_f2_elevator_rail_segment_kn is LiftLoadProfile.force_f1_f2_elevator_rail_segment_kn
+            for p in profiles
+        ]
+    )[cap_inv]
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        # --- electrical (rows 79–86)
+        e_ok = np.isfinite(pers)
+        p_kw = 1.5 * pers
+        kva = p_kw + 1.5
+        i_r = p_kw * 1000.0 / LiftLoadProfile._ELEC_V_LINE_V
+        i_s = i_r * 2.0
+        d_ok = e_ok & np.isfinite(duty)
+        e85 = p_kw / 100.0 * duty
+        h86 = 0.5 * e85 * 3600.0
+        elec = {
+            "Drive/Motor Power": (p_kw, e_ok),
+            "Connected load": (kva, e_ok),
+            "Rated current": (i_r, e_ok),
+            "Starting current (factor ≈ 2)": (i_s, e_ok),
+            "Energy consumption": (e85, d_ok),
+            "Heat dissipation motor": (h86, d_ok),
+        }
+        for label, (vals, ok) in elec.items():
+            out[label] = np.where(ok, vals, np.nan)
+
+        # --- mechanical (rows 90–105)
+        load = _int_round(cap)
+        car_ok = np.isfinite(n_car) & (n_car > 0)
+        cwt_ok = np.isfinite(n_cwt) & (n_cwt > 0)
+        m_ok = np.isfinite(cap) & car_ok & cwt_ok
+        th_ok = m_ok & np.isfinite(travel) & (travel > 0)
+        g = 9.81
+        m_kg = load
+        cwt_no = ~safety
+
+        f1f2 = _int_round((travel / 2.0 * 600.0 + 2.3 * profile_kg * g) / 1000.0) + 1
+        f4 = np.where(
+            cwt_no,
+            _int_round((travel / 2.5 * 600.0) / 1000.0) + 1,
+            _int_round((travel / 2.5 * 600.0 + 1.7 * m_kg * g) / 1000.0) + 1,
+        )
+        f3 = _int_round(2.3 * m_kg * g / 1000.0 * 4.0 / n_car) + 1
+        f5 = _int_round(1.7 * m_kg * g / 1000.0 * 4.0 / n_cwt)
+        f6 = np.full(n, 20.0)
+        f7 = _int_round(1.7 * m_kg * g / 1000.0) + 1
+        f8 = _int_round(2.3 * m_kg * g / 1000.0) + 1
+
+        codes, table = layout["cabin width (clear)"]
+        cw = np.array([_parse_mm(v) for v in table])[codes]
+        codes, table = layout["cabin depth (clear)"]
+        cd = np.array([_parse_mm(v) for v in table])[codes]
+        dims_ok = m_ok & np.isfinite(cw) & np.isfinite(cd)
+        fx_cab = _round_like_python((2.0 * g * m_kg * 0.2 * cd / 2.0 / 2500.0 / 1000.0) + 0.1, 1)
+        fy_cab = _round_like_python((2.0 * g * m_kg * 0.2 * cw / 2500.0 / 1000.0) + 0.1, 1)
+        k = np.where(cwt_no, 1.2, 2.0)
+        fx_cwt = _round_like_python(k * g * 1.5 * m_kg * 30.0 / 2.0 / 2000.0 / 1000.0 + 0.1, 1)
+        fy_cwt = _round_like_python(k * g * 1.5 * m_kg * 41.0 / 2000.0 / 1000.0 + 0.1, 1)
+
+        mech = {
+            "Force F1, F2 elevator rail segment": (f1f2, th_ok),
+            "Force F4, per counterweight rail segment": (f4, th_ok),
+            "Force F3, each buffer": (f3, m_ok),
+            "Force F5, per counterweight buffer": (f5, m_ok),
+            "Force F6, static shaft door": (f6, m_ok),
+            "Force F7, static counterweight": (f7, m_ok),
+            "Force F8, static cabin": (f8, m_ok),
+            "Force Fx, cabin rail": (fx_cab, dims_ok),
+            "Force Fy, cabin rail": (fy_cab, dims_ok),
+            "Force Fx, counterweight rail": (fx_cwt, dims_ok),
+            "Force Fy, counterweight rail": (fy_cwt, dims_ok),
+        }
+        for label, (vals, ok) in mech.items():
+            out[label] = np.where(ok, vals, np.nan)
+
+    # Capacities whose profile class overrides the shared formulas: use its methods per row.
+    for i in np.flatnonzero(~(base_elec & base_f12)):
+        prof = profiles[cap_inv[i]]
+        if e_ok[i]:
+            p = prof.motor_power_kw_from_persons(float(pers[i]))
+            i_rated = prof.rated_current_a(p)
+            out["Drive/Motor Power"][i] = p
+            out["Connected load"][i] = prof.connected_load_kva(p)
+            out["Rated current"][i] = i_rated
+            out["Starting current (factor ≈ 2)"][i] = prof.starting_current_a(i_rated)
+            if d_ok[i]:
+                e = prof.energy_consumption_kwh(p, float(duty[i]))
+                out["Energy consumption"][i] = e
+                out["Heat dissipation motor"][i] = prof.heat_dissipation_motor_kj(e)
+        if th_ok[i]:
+            v = prof.force_f1_f2_elevator_rail_segment_kn(float(travel[i]))
+            out["Force F1, F2 elevator rail segment"][i] = np.nan if v is None else v
+    return out
+
+
+def format_batch(result: Mapping[str, Any], index: int) -> Dict[str, str]:
+    """Row ``index`` of a batch result as the scalar path's ``{label: text}`` dict."""
+    row: Dict[str, str] = {}
+    for label in LAYOUT_OUTPUTS:
+        v = result[label][index]
+        if v:
+            row[label] = v
+    for table in (ELECTRICAL_OUTPUTS, MECHANICAL_OUTPUTS):
+        for label, decimals in table.items():
+            v = float(result[label][index])
+            if v == v:
+                row[label] = _fmt_electrical_num(v, decimals)
+    return row
+
+
+def _random_inputs(n: int, seed: int = 0) -> Dict[str, Any]:
+    np = _numpy()
+    from gui.lift_types import LOAD_CAPACITY_KG
+
+    rng = np.random.default_rng(seed)
+    return {
+        "capacity": rng.choice(np.array(LOAD_CAPACITY_KG + (800,), dtype=float), n),
+        "shape": rng.choice(np.array(["Deep", "Wide", ""]), n),
+        "speed": rng.choice(np.array([0.63, 1.0, 1.6, 2.0, 2.5, np.nan]), n),
+        "clear_height": rng.choice(np.array([2100.0, 2200.0, 2300.0, 2400.0]), n),
+        "cladding": rng.choice(np.array([0.0, 10.0, 25.0, np.nan]), n),
+        "access_type": rng.choice(np.array(["Front", "Front + Rear", "Rear", "Open through", "Adjacent"]), n),
+        "cwt_location": rng.choice(np.array(["CWT-Left", "CWT-Right", ""]), n),
+        "accessible": rng.random(n) < 0.5,
+        "persons": rng.choice(np.array([0.0, 8.0, 13.0, 17.0, 21.0, 26.5, np.nan]), n),
+        "duty_cycle": rng.choice(np.array([0.0, 40.0, 50.0, 60.0, np.nan]), n),
+        "travel_height": np.round(rng.uniform(-5.0, 120.0, n), 1),
+        "cwt_safety_gear": rng.random(n) < 0.3,
+    }
+
+
+def benchmark_batch(
+    sizes: Sequence[int] = (10_000, 1_000_000),
+    scalar_rows: Optional[int] = None,
+    seed: int = 0,
+    log: Callable[[str], None] = print,
+) -> List[Dict[str, float]]:
+    """
+    Time the batch path against the row-by-row scalar path on random inputs and check
+    that every compared row matches. ``scalar_rows`` caps how many rows the scalar path
+    runs per size (its time is extrapolated linearly); ``None`` runs it on every row.
+    """
+    inputs_max = _random_inputs(max(sizes), seed)
+    report: List[Dict[str, float]] = []
+    for n in sizes:
+        inputs = {k: v[:n] for k, v in inputs_max.items()}
+        t0 = time.perf_counter()
+        batch = evaluate_load_profiles_batch(**inputs)
+        t_batch = time.perf_counter() - t0
+
+        m = n if scalar_rows is None else min(n, scalar_rows)
+        t0 = time.perf_counter()
+        rows = [
+            evaluate_load_profile_scalar(**{k: v[i].item() for k, v in inputs.items()})
+            for i in range(m)
+        ]
+        t_scalar = (time.perf_counter() - t0) * (n / m)
+        mismatches = sum(1 for i, r in enumerate(rows) if format_batch(batch, i) != r)
+        report.append(
+            {"rows": n, "batch_s": t_batch, "scalar_s": t_scalar, "compared": m, "mismatches": mismatches}
+        )
+        log(
+            f"{n:>9,} rows: batch {t_batch:8.3f} s | scalar {t_scalar:8.3f} s"
+            f"{' (extrapolated)' if m < n else ''} | x{t_scalar / t_batch if t_batch else float('inf'):,.0f}"
+            f" | {m:,} rows compared, {mismatches} mismatches"
+        )
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Benchmark batch vs scalar load-profile evaluation.")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    ap.add_argument(
+        "--scalar-rows",
+        type=int,
+        default=None,
+        help="run the scalar path on at most this many rows per size and extrapolate",
+    )
+    args = ap.parse_args()
+    benchmark_batch(args.sizes, scalar_rows=args.scalar_rows)
@@ -0,0 +1,557 @@
+"""
+Door-manufacturer catalogue (non-UI): product RIDs, door depths and wall clearance per supplier.
+
+Each manufacturer is one JSON file in the ``door_catalogue`` folder shipped next to the
+sources (see ``common_component.json`` / ``meiller.json``, ported from the VT ``selection``
+sheet)::
+
+    {
+      "format": 1,
+      "manufacturer": "Meiller",          # name shown in the Cost page combo
+      "order": 1,                         # position in DOOR_MANUFACTURER_OPTIONS
+      "default": false,                   # exactly one file may set true
+      "aliases": ["meiller"],             # lowercase substrings for free-form input
+      "match_priority": 1,                # higher priorities are matched first
+      "wall_clearance_mm": 0,
+      "entrance_depth_mm": {"2C": 120, ...},
+      "cabin_depth_mm": {"2C": 91, ...},
+      "products": [{"kind": "entrance", "door_type": "2C", "width_mm": 700, "rid": 1400072}, ...]
+    }
+
+Adding a supplier means dropping another file into the folder. :func:`load_door_catalogue`
+validates every file, builds the in-memory :class:`DoorCatalogue` — RIDs are one dict keyed
+by ``(manufacturer, kind, door type, width)``, so a lookup costs the same for ten products
+or ten thousand — and persists the validated data as ``door_catalogue.doorcat.json`` next
+to the folder, stamped like the VT rule snapshots (:mod:`lift_designer_vt_rules`): reused
+while every file's name + mtime + size match, re-stamped when only the stamps changed but the
+content hash did not, rebuilt otherwise. A read-only folder simply skips persisting.
+
+A file that fails validation is left out with a logged warning (the message names the file
+and the offending entry and is kept in :attr:`DoorCatalogue.problems`), so one bad supplier
+file never stops the app or drops the others; ``strict=True`` raises
+:class:`DoorCatalogueError` instead.
+
+Run this module as a script to time RID lookups against synthetic catalogues of growing size.
+The returned catalogue is shared between callers — treat it as read-only.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+__all__ = [
+    "DOOR_TYPES",
+    "DOOR_KINDS",
+    "DOOR_CATALOGUE_FORMAT",
+    "DoorCatalogueError",
+    "DoorProduct",
+    "DoorManufacturer",
+    "DoorCatalogue",
+    "default_door_catalogue_dir",
+    "door_catalogue_snapshot_path",
+    "load_door_catalogue",
+    "clear_door_catalogue_cache",
+    "benchmark_door_catalogue",
+]
+
+# Canonical door-type order of the VT selection sheet.
+DOOR_TYPES: Tuple[str, ...] = ("2C", "4C", "6C", "2L", "2R")
+DOOR_KINDS: Tuple[str, ...] = ("entrance", "cabin")
+
+# Version of the per-manufacturer file layout.
+DOOR_CATALOGUE_FORMAT: int = 1
+# Bump whenever validation or the serialized layout change so stale snapshots rebuild.
+_SNAPSHOT_VERSION: int = 2
+_SNAPSHOT_SUFFIX = ".doorcat.json"
+_CATALOGUE_DIR_NAME = "door_catalogue"
+
+_log = logging.getLogger(__name__)
+
+
+class DoorCatalogueError(ValueError):
+    """A catalogue file is missing, unreadable or fails validation."""
+
+
+@dataclass(frozen=True)
+class DoorProduct:
+    """One door product row: ``rid`` for ``kind`` doors of ``door_type`` at ``width_mm``."""
+
+    manufacturer: str
+    kind: str
+    door_type: str
+    width_mm: int
+    rid: int
+
+
+@dataclass
+class DoorManufacturer:
+    """Per-supplier constants (everything in a catalogue file except ``products``)."""
+
+    name: str
+    order: int = 0
+    default: bool = False
+    aliases: Tuple[str, ...] = ()
+    match_priority: int = 0
+    wall_clearance_mm: Optional[float] = None
+    entrance_depth_mm: Dict[str, float] = field(default_factory=dict)
+    cabin_depth_mm: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class DoorCatalogue:
+    """Validated manufacturers + products, with the lookup indexes built on construction."""
+
+    manufacturers: List[DoorManufacturer] = field(default_factory=list)
+    products: List[DoorProduct] = field(default_factory=list)
+    source_dir: str = ""
+    source_stamps: List[Tuple[str, int, int]] = field(default_factory=list)
+    source_sha256: str = ""
+    # Validation messages for the files that were skipped (non-strict loads).
+    problems: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.manufacturers.sort(key=lambda m: (m.order, m.name))
+        self._by_name: Dict[str, DoorManufacturer] = {m.name: m for m in self.manufacturers}
+        self._by_lower: Dict[str, str] = {m.name.lower(): m.name for m in self.manufacturers}
+        ranked = sorted(self.manufacturers, key=lambda m: -m.match_priority)
+        self._aliases: Tuple[Tuple[str, str], ...] = tuple(
+            (alias, m.name) for m in ranked for alias in m.aliases
+        )
+        self._rids: Dict[Tuple[str, str, str, int], int] = {
+            (p.manufacturer, p.kind, p.door_type, p.width_mm): p.rid for p in self.products
+        }
+        defaults = [m.name for m in self.manufacturers if m.default]
+        self._default = defaults[0] if defaults else (self.manufacturers[0].name if self.manufacturers else "")
+
+    @property
+    def options(self) -> Tuple[str, ...]:
+        """Manufacturer names in display order."""
+        return tuple(m.name for m in self.manufacturers)
+
+    @property
+    def default_manufacturer(self) -> str:
+        return self._default
+
+    def manufacturer(self, name: str) -> Optional[DoorManufacturer]:
+        return self._by_name.get(name)
+
+    def normalize(self, value: Any) -> str:
+        """Map free-form input to a manufacturer name (exact name, then aliases, then the default)."""
+        s = ("" if value is None else str(value)).strip().lower()
+        if not s:
+            return self._default
+        hit = self._by_lower.get(s)
+        if hit is not None:
+            return hit
+        for alias, name in self._aliases:
+            if alias in s:
+                return name
+        return self._default
+
+    def rid(self, manufacturer: str, kind: str, door_type: str, width_mm: Optional[int]) -> Optional[int]:
+        """RID of the matching product; ``None`` when the catalogue has none."""
+        return self._rids.get((manufacturer, kind, door_type, width_mm))
+
+    def entrance_depth_mm(self, manufacturer: str) -> Mapping[str, float]:
+        m = self._by_name.get(manufacturer)
+        return m.entrance_depth_mm if m is not None else {}
+
+    def cabin_depth_mm(self, manufacturer: str) -> Mapping[str, float]:
+        m = self._by_name.get(manufacturer)
+        return m.cabin_depth_mm if m is not None else {}
+
+    def wall_clearance_mm(self, manufacturer: str) -> Optional[float]:
+        m = self._by_name.get(manufacturer)
+        return m.wall_clearance_mm if m is not None else None
+
+
+# In-process memo: (normalized dir, file stamps) → catalogue.
+_MEMO: Dict[Tuple[str, Tuple[Tuple[str, int, int], ...]], DoorCatalogue] = {}
+
+
+def default_door_catalogue_dir() -> str:
+    """
+    ``door_catalogue`` next to the sources, or inside :attr:`sys._MEIPASS` when frozen — the
+    rule of :func:`lift_designer_ld_export.project_resource_dir`, which cannot be imported
+    here because that module imports :mod:`lift_designer_vt_derived`.
+    """
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        base = sys._MEIPASS
+    else:
+        base = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base, _CATALOGUE_DIR_NAME)
+
+
+def door_catalogue_snapshot_path(catalogue_dir: str) -> str:
+    """Snapshot file stored next to ``catalogue_dir`` (``door_catalogue.doorcat.json``)."""
+    return os.path.normpath(catalogue_dir) + _SNAPSHOT_SUFFIX
+
+
+def clear_door_catalogue_cache() -> None:
+    """Forget every in-memory catalogue (on-disk snapshots are left alone)."""
+    _MEMO.clear()
+
+
+def _norm_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _catalogue_files(catalogue_dir: str) -> List[str]:
+    try:
+        names = sorted(n for n in os.listdir(catalogue_dir) if n.lower().endswith(".json"))
+    except OSError as e:
+        raise DoorCatalogueError(f"Door catalogue folder not readable: {catalogue_dir} ({e})") from e
+    if not names:
+        raise DoorCatalogueError(f"Door catalogue folder has no .json files: {catalogue_dir}")
+    return [os.path.join(catalogue_dir, n) for n in names]
+
+
+def _stamps(paths: Sequence[str]) -> List[Tuple[str, int, int]]:
+    out = []
+    for p in paths:
+        st = os.stat(p)
+        out.append((os.path.basename(p), st.st_mtime_ns, st.st_size))
+    return out
+
+
+def _sha256_of_files(paths: Sequence[str]) -> str:
+    h = hashlib.sha256()
+    for p in paths:
+        h.update(os.path.basename(p).encode("utf-8") + b"\0")
+        with open(p, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# --- validation --------------------------------------------------------------
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _depth_table(where: str, key: str, raw: Any) -> Dict[str, float]:
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise DoorCatalogueError(f"{where}: {key!r} must be an object of door type → mm")
+    for dt, mm in raw.items():
+        if dt not in DOOR_TYPES:
+            raise DoorCatalogueError(f"{where}: {key!r} has unknown door type {dt!r}")
+        if not _is_number(mm) or mm < 0:
+            raise DoorCatalogueError(f"{where}: {key!r}[{dt!r}] must be a non-negative number")
+    return dict(raw)
+
+
+def _parse_manufacturer_file(path: str) -> Tuple[DoorManufacturer, List[DoorProduct]]:
+    where = os.path.basename(path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise DoorCatalogueError(f"{where}: not readable as JSON ({e})") from e
+    if not isinstance(data, dict):
+        raise DoorCatalogueError(f"{where}: top level must be an object")
+    if data.get("format") != DOOR_CATALOGUE_FORMAT:
+        raise DoorCatalogueError(f"{where}: unsupported format {data.get('format')!r}")
+
+    name = data.get("manufacturer")
+    if not isinstance(name, str) or not name.strip():
+        raise DoorCatalogueError(f"{where}: 'manufacturer' must be a non-empty string")
+    name = name.strip()
+    aliases = data.get("aliases", [])
+    if not isinstance(aliases, list) or not all(isinstance(a, str) and a.strip() for a in aliases):
+        raise DoorCatalogueError(f"{where}: 'aliases' must be a list of non-empty strings")
+    for key in ("order", "match_priority"):
+        if not _is_int(data.get(key, 0)):
+            raise DoorCatalogueError(f"{where}: {key!r} must be an integer")
+    if not isinstance(data.get("default", False), bool):
+        raise DoorCatalogueError(f"{where}: 'default' must be true or false")
+    clearance = data.get("wall_clearance_mm")
+    if clearance is not None and (not _is_number(clearance) or clearance < 0):
+        raise DoorCatalogueError(f"{where}: 'wall_clearance_mm' must be a non-negative number")
+
+    maker = DoorManufacturer(
+        name=name,
+        order=data.get("order", 0),
+        default=data.get("default", False),
+        aliases=tuple(a.strip().lower() for a in aliases),
+        match_priority=data.get("match_priority", 0),
+        wall_clearance_mm=clearance,
+        entrance_depth_mm=_depth_table(where, "entrance_depth_mm", data.get("entrance_depth_mm")),
+        cabin_depth_mm=_depth_table(where, "cabin_depth_mm", data.get("cabin_depth_mm")),
+    )
+
+    rows = data.get("products", [])
+    if not isinstance(rows, list):
+        raise DoorCatalogueError(f"{where}: 'products' must be a list")
+    products: List[DoorProduct] = []
+    seen: Dict[Tuple[str, str, int], int] = {}
+    for i, row in enumerate(rows):
+        at = f"{where}: products[{i}]"
+        if not isinstance(row, dict):
+            raise DoorCatalogueError(f"{at} must be an object")
+        kind, dt, width, rid = row.get("kind"), row.get("door_type"), row.get("width_mm"), row.get("rid")
+        if kind not in DOOR_KINDS:
+            raise DoorCatalogueError(f"{at}: 'kind' must be one of {DOOR_KINDS}, not {kind!r}")
+        if dt not in DOOR_TYPES:
+            raise DoorCatalogueError(f"{at}: 'door_type' must be one of {DOOR_TYPES}, not {dt!r}")
+        if not _is_int(width) or width <= 0:
+            raise DoorCatalogueError(f"{at}: 'width_mm' must be a positive integer")
+        if not _is_int(rid):
+            raise DoorCatalogueError(f"{at}: 'rid' must be an integer")
+        key = (kind, dt, width)
+        if key in seen and seen[key] != rid:
+            raise DoorCatalogueError(f"{at}: conflicting RIDs {seen[key]} / {rid} for {kind} {dt} {width} mm")
+        seen[key] = rid
+        products.append(DoorProduct(name, kind, dt, width, rid))
+    return maker, products
+
+
+def _compile_catalogue(paths: Sequence[str]) -> DoorCatalogue:
+    """
+    Parse and validate every manufacturer file (the slow path). A failing file is left out,
+    a repeated manufacturer keeps its first file and only the first ``"default": true``
+    counts; each case is listed in ``problems``.
+    """
+    manufacturers: List[DoorManufacturer] = []
+    products: List[DoorProduct] = []
+    problems: List[str] = []
+    names: Dict[str, str] = {}
+    for path in paths:
+        try:
+            maker, rows = _parse_manufacturer_file(path)
+        except DoorCatalogueError as e:
+            problems.append(str(e))
+            continue
+        other = names.get(maker.name.lower())
+        if other is not None:
+            problems.append(
+                f"{os.path.basename(path)}: manufacturer {maker.name!r} is already defined in {other}"
+            )
+            continue
+        names[maker.name.lower()] = os.path.basename(path)
+        manufacturers.append(maker)
+        products.extend(rows)
+    defaults = [m for m in sorted(manufacturers, key=lambda m: (m.order, m.name)) if m.default]
+    if len(defaults) > 1:
+        problems.append(
+            f"More than one default door manufacturer: {', '.join(m.name for m in defaults)}"
+            f" — using {defaults[0].name!r}"
+        )
+        for m in defaults[1:]:
+            m.default = False
+    return DoorCatalogue(manufacturers=manufacturers, products=products, problems=problems)
+
+
+# --- snapshot ----------------------------------------------------------------
+
+def _catalogue_to_json(cat: DoorCatalogue) -> Dict[str, Any]:
+    return {
+        "version": _SNAPSHOT_VERSION,
+        "source_dir": cat.source_dir,
+        "source_stamps": [list(s) for s in cat.source_stamps],
+        "source_sha256": cat.source_sha256,
+        "problems": list(cat.problems),
+        "manufacturers": [
+            {
+                "name": m.name,
+                "order": m.order,
+                "default": m.default,
+                "aliases": list(m.aliases),
+                "match_priority": m.match_priority,
+                "wall_clearance_mm": m.wall_clearance_mm,
+                "entrance_depth_mm": m.entrance_depth_mm,
+                "cabin_depth_mm": m.cabin_depth_mm,
+            }
+            for m in cat.manufacturers
+        ],
+        # Columnar rows: [manufacturer, kind, door type, width, rid].
+        "products": [[p.manufacturer, p.kind, p.door_type, p.width_mm, p.rid] for p in cat.products],
+    }
+
+
+def _catalogue_from_json(data: Any) -> Optional[DoorCatalogue]:
+    """Rebuild a :class:`DoorCatalogue` from snapshot JSON; ``None`` if the layout is not understood."""
+    if not isinstance(data, dict) or data.get("version") != _SNAPSHOT_VERSION:
+        return None
+    try:
+        manufacturers = [
+            DoorManufacturer(
+                name=str(m["name"]),
+                order=int(m.get("order", 0)),
+                default=bool(m.get("default", False)),
+                aliases=tuple(str(a) for a in m.get("aliases", [])),
+                match_priority=int(m.get("match_priority", 0)),
+                wall_clearance_mm=m.get("wall_clearance_mm"),
+                entrance_depth_mm=dict(m.get("entrance_depth_mm") or {}),
+                cabin_depth_mm=dict(m.get("cabin_depth_mm") or {}),
+            )
+            for m in data["manufacturers"]
+        ]
+        products = [
+            DoorProduct(str(maker), str(kind), str(dt), int(width), int(rid))
+            for maker, kind, dt, width, rid in data["products"]
+        ]
+        return DoorCatalogue(
+            manufacturers=manufacturers,
+            products=products,
+            source_dir=str(data.get("source_dir", "")),
+            source_stamps=[(str(n), int(m), int(s)) for n, m, s in data.get("source_stamps", [])],
+            source_sha256=str(data.get("source_sha256", "")),
+            problems=[str(p) for p in data.get("problems", [])],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _read_snapshot(snap_path: str) -> Optional[DoorCatalogue]:
+    try:
+        with open(snap_path, "r", encoding="utf-8") as f:
+            return _catalogue_from_json(json.load(f))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_snapshot(snap_path: str, cat: DoorCatalogue) -> None:
+    """Atomically replace the snapshot; failures (read-only folder, …) are ignored."""
+    tmp = f"{snap_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_catalogue_to_json(cat), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, snap_path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def load_door_catalogue(
+    catalogue_dir: Optional[str] = None,
+    *,
+    use_disk_cache: bool = True,
+    strict: bool = False,
+) -> DoorCatalogue:
+    """
+    Return the compiled catalogue for ``catalogue_dir`` (default:
+    :func:`default_door_catalogue_dir`).
+
+    Lookup order: in-process memo → on-disk snapshot → parse and validate the files. Pass
+    ``use_disk_cache=False`` to neither read nor write the snapshot file (the in-process memo
+    is still used). Files that fail validation — or a missing / empty folder — are logged and
+    listed in :attr:`DoorCatalogue.problems`; with ``strict=True`` they raise
+    :class:`DoorCatalogueError` instead.
+    """
+    catalogue_dir = catalogue_dir or default_door_catalogue_dir()
+    norm = _norm_path(catalogue_dir)
+    try:
+        paths = _catalogue_files(catalogue_dir)
+        stamps = _stamps(paths)
+    except (DoorCatalogueError, OSError) as e:
+        if strict:
+            raise DoorCatalogueError(str(e)) from e
+        _log.warning("%s", e)
+        return DoorCatalogue(source_dir=norm, problems=[str(e)])
+    memo_key = (norm, tuple(stamps))
+    hit = _MEMO.get(memo_key)
+    if hit is not None:
+        if strict and hit.problems:
+            raise DoorCatalogueError("; ".join(hit.problems))
+        return hit
+
+    snap_path = door_catalogue_snapshot_path(catalogue_dir)
+    snap = _read_snapshot(snap_path) if use_disk_cache else None
+
+    if snap is not None and snap.source_dir == norm and snap.source_stamps == stamps:
+        cat = snap
+    else:
+        digest = _sha256_of_files(paths)
+        if snap is not None and snap.source_sha256 == digest:
+            # Same bytes under a new path / mtime — re-stamp instead of re-validating.
+            cat = snap
+        else:
+            cat = _compile_catalogue(paths)
+        cat.source_dir = norm
+        cat.source_stamps = stamps
+        cat.source_sha256 = digest
+        if use_disk_cache:
+            _write_snapshot(snap_path, cat)
+
+    for k in [k for k in _MEMO if k[0] == norm]:
+        del _MEMO[k]
+    _MEMO[memo_key] = cat
+    if strict and cat.problems:
+        raise DoorCatalogueError("; ".join(cat.problems))
+    for problem in cat.problems:
+        _log.warning("Door catalogue: skipped %s", problem)
+    return cat
+
+
+# --- lookup micro-benchmark --------------------------------------------------
+
+def benchmark_door_catalogue(
+    sizes: Sequence[int] = (100, 1_000, 10_000, 100_000),
+    lookups: int = 100_000,
+    repeat: int = 3,
+    log=print,
+) -> Dict[int, float]:
+    """
+    Best-of-``repeat`` time (nanoseconds per lookup) for ``lookups`` RID lookups (hits and
+    misses) against synthetic catalogues of ``sizes`` products spread over 10 manufacturers.
+    """
+    out: Dict[int, float] = {}
+    for size in sizes:
+        makers = [f"Supplier {i}" for i in range(10)]
+        products = [
+            DoorProduct(
+                makers[i % 10],
+                DOOR_KINDS[(i // 10) % 2],
+                DOOR_TYPES[(i // 20) % 5],
+                100 + (i // 100) * 10,
+                i,
+            )
+            for i in range(size)
+        ]
+        cat = DoorCatalogue(manufacturers=[DoorManufacturer(m) for m in makers], products=products)
+        step = max(1, size // 997)
+        probe = [
+            (p.manufacturer, p.kind, p.door_type, p.width_mm + (0 if j % 2 else 5))
+            for j, p in enumerate(products[::step])
+        ]
+        args = (probe * (lookups // len(probe) + 1))[:lookups]
+        rid = cat.rid
+        best = float("inf")
+        for _ in range(max(1, int(repeat))):
+            t0 = time.perf_counter()
+            for a in args:
+                rid(*a)
+            best = min(best, time.perf_counter() - t0)
+        out[size] = best / len(args) * 1e9
+        log(f"{size:>8} products: {out[size]:6.1f} ns / lookup")
+    return out
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Validate the door catalogue and time RID lookups by catalogue size.")
+    ap.add_argument("catalogue_dir", nargs="?", default=None, help="Catalogue folder (default: shipped one).")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    args = ap.parse_args()
+    cat = load_door_catalogue(args.catalogue_dir)
+    print(f"{len(cat.manufacturers)} manufacturers, {len(cat.products)} products: {', '.join(cat.options)}")
+    for problem in cat.problems:
+        print(f"skipped: {problem}")
+    benchmark_door_catalogue(args.sizes)
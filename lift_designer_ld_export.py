@@ -18,17 +18,25 @@ Default output file: ``LD data import test.xlsx``.
 Use :func:`write_ld_workbook_multi` with the rows for one or more lifts to produce one workbook
 (**Shaft *n*** between lifts in that file). Use :func:`write_ld_exports_per_group` to write **one
 file per Building System group** (from ``LiftColumnGroups``), each file containing only that group’s lifts.
+Every stage also has a generator form — :func:`iter_ld_rows_per_lift` →
+:func:`iter_ld_workbook_rows` → writer — so a workbook can be streamed without building
+row lists or matrices.
 """
 from __future__ import annotations
 
 import csv
 import os
+import pickle
 import re
 import sys
+import tempfile
+import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
-from gui.project_lift_schema import merged_lift_at
+from gui.lift_record import LiftRecord, lift_record
+from gui.project_lift_schema import merged_lift_view
 from lift_designer_vt_derived import compute_derived
 
 __all__ = [
@@ -37,10 +45,16 @@ __all__ = [
     "load_vt_export_rules",
     "build_ld_rows_from_user_inputs",
     "build_ld_rows_per_lift",
+    "iter_ld_rows_from_user_inputs",
+    "iter_ld_rows_per_lift",
+    "LiftBuildTiming",
     "matrix_for_ld_workbook",
+    "iter_ld_workbook_rows",
     "write_ld_workbook",
     "write_ld_workbook_multi",
     "write_ld_exports_per_group",
+    "write_ld_group_exports",
+    "LDGroupExportResult",
     "write_ld_csv",
     "export_ld_data_import_test",
     "project_resource_dir",
@@ -48,6 +62,8 @@ __all__ = [
     "default_ld_empty_template_path",
     "default_ld_example_path",
     "remap_varname_for_lift",
+    "compile_varname_template",
+    "benchmark_varname_remap",
 ]
 
 Number = Union[int, float]
@@ -75,7 +91,12 @@ def _default_ld_test_output_path() -> str:
     return os.path.join(base, "LD data import test.xlsx")
 
 
-@dataclass(frozen=True)
+# ``slots=True`` (Python 3.10+) drops the per-instance ``__dict__`` of the row and rule
+# records, which exist once per lift × VT row in large exports.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class LDExportRow:
     varname: str
     value: str = ""
@@ -86,7 +107,7 @@ class LDExportRow:
     vt_row: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VTExportRule:
     """One logical rule from the VT sheet (row order preserved)."""
 
@@ -94,6 +115,21 @@ class VTExportRule:
     varnames: List[str] = field(default_factory=list)
     param_label: str = ""
     vt_row: int = 0
+    # Per-varname format strings (see compile_varname_template) and the compiled
+    # parameter label (see _ParamPlan), built once at rule load; not part of rule
+    # snapshots.
+    varname_templates: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    param_plan: _ParamPlan = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Every lift's rows reference these strings; intern them once per rule set.
+        self.kind = sys.intern(self.kind)
+        self.param_label = sys.intern(self.param_label)
+        self.varnames = [sys.intern(vn) for vn in self.varnames]
+        self.varname_templates = tuple(
+            compile_varname_template(vn, self.param_label) for vn in self.varnames
+        )
+        self.param_plan = _compile_param_plan(self.param_label)
 
 
 def default_vt_workbook_path() -> str:
@@ -202,88 +238,133 @@ def remap_varname_for_lift(varname: str, param_label: str, lift_index: int) -> s
     return re.sub(r"\bShaft0\b", f"Shaft{lift_index}", vn)
 
 
+# ``L_Projects.PROJ_USER_*`` slot in :func:`_proj_user_triple_indices` per parameter label.
+_PROJ_USER_SLOTS: Dict[str, int] = {
+    "connected load": 0,
+    "rated current": 1,
+    "heat dissipation motor": 2,
+}
+_SHAFT0_RE = re.compile(r"\bShaft0\b")
+
+
+def compile_varname_template(varname: str, param_label: str) -> str:
+    """
+    Precompiled :func:`remap_varname_for_lift`: a format string with ``{shaft}`` (lift
+    index) and ``{proj[k]}`` (``PROJ_USER`` triple) fields, so that
+    ``template.format(shaft=i, proj=_proj_user_triple_indices(i))`` equals
+    ``remap_varname_for_lift(varname, param_label, i)``.
+    """
+    vn = varname.strip()
+    literal = vn.replace("{", "{{").replace("}", "}}")
+    if vn.startswith("L_Projects.PROJ_USER_"):
+        slot = _PROJ_USER_SLOTS.get(_norm_param(param_label))
+        return literal if slot is None else f"L_Projects.PROJ_USER_{{proj[{slot}]}}"
+    return _SHAFT0_RE.sub("Shaft{shaft}", literal)
+
+
+def _export_rule_from_row(r: int, param: Any, fcell: Any) -> Optional[VTExportRule]:
+    """
+    Classify one VT row (column A ``param``, column F ``fcell``) as an LD export rule.
+
+    Returns ``None`` for rows that must not be exported. Floor rows come back as
+    ``floors_z`` / ``floors_desc`` every time — callers keep only the first of each kind.
+    """
+    if not param and not fcell:
+        return None
+    plab = _s(param)
+    if not plab:
+        return None
+    if fcell is None or str(fcell).strip() == "":
+        return None
+    fs = str(fcell).strip()
+    # Only rows whose column F resolves to an explicit DTV path are exported.
+    # ``no`` / ``-`` / ``yes`` / ``yes, info`` (and any other free-text marker
+    # without an LD variable) are dropped entirely: they must never produce a
+    # row in the LD export workbook, even as a description-only placeholder.
+    if fs.lower() in ("yes, info", "yes,info"):
+        return None
+    if _is_no_export(fs):
+        return None
+    if fs == "-":
+        return None
+    lines = _parse_ld_path_lines(fs)
+    if not lines:
+        return None
+    paths = [ln.strip() for ln in lines if _looks_like_ld_path(ln.strip())]
+    if not paths:
+        return None
+    if any(re.match(r"^FLL\.Level\d+\.Z_POT$", x) for x in paths):
+        return VTExportRule("floors_z", [], plab, r)
+    if any(re.match(r"^FLL\.Level\d+\.DESC$", x) for x in paths):
+        return VTExportRule("floors_desc", [], plab, r)
+    return VTExportRule("static", paths, plab, r)
+
+
 def load_vt_export_rules(
     path_vt: Optional[str] = None,
 ) -> List[VTExportRule]:
     """
     Scan ``VT Standard configs`` column A (parameter) and F (LD export).
-    """
-    path_vt = path_vt or default_vt_workbook_path()
 
-    try:
-        from openpyxl import load_workbook
-    except ImportError as e:
-        raise ImportError("pip install openpyxl") from e
-
-    wb = load_workbook(path_vt, data_only=True)
-    if "VT Standard configs" not in wb.sheetnames:
-        wb.close()
-        return []
-    ws = wb["VT Standard configs"]
-    rules: List[VTExportRule] = []
-    seen_z = False
-    seen_desc = False
-
-    for r in range(3, ws.max_row + 1):
-        param = ws.cell(r, 1).value
-        fcell = ws.cell(r, 6).value
-        if not param and not fcell:
-            continue
-        plab = _s(param)
-        if not plab:
-            continue
-        if fcell is None or str(fcell).strip() == "":
-            continue
-        fs = str(fcell).strip()
-        # Only rows whose column F resolves to an explicit DTV path are exported.
-        # ``no`` / ``-`` / ``yes`` / ``yes, info`` (and any other free-text marker
-        # without an LD variable) are dropped entirely: they must never produce a
-        # row in the LD export workbook, even as a description-only placeholder.
-        if fs.lower() in ("yes, info", "yes,info"):
-            continue
-        if _is_no_export(fs):
-            continue
-        if fs == "-":
-            continue
-        lines = _parse_ld_path_lines(fs)
-        if not lines:
-            continue
-        paths = [ln.strip() for ln in lines if _looks_like_ld_path(ln.strip())]
-        if not paths:
-            continue
-        if any(re.match(r"^FLL\.Level\d+\.Z_POT$", x) for x in paths):
-            if not seen_z:
-                rules.append(VTExportRule("floors_z", [], plab, r))
-                seen_z = True
-            continue
-        if any(re.match(r"^FLL\.Level\d+\.DESC$", x) for x in paths):
-            if not seen_desc:
-                rules.append(VTExportRule("floors_desc", [], plab, r))
-                seen_desc = True
-            continue
-        rules.append(VTExportRule("static", paths, plab, r))
+    Always parses the workbook (single read-only pass, see
+    :func:`lift_designer_vt_rules.scan_vt_workbook`); exports go through the compiled
+    snapshot in :func:`lift_designer_vt_rules.load_vt_rule_set` instead.
+    """
+    from lift_designer_vt_rules import scan_vt_workbook
 
-    wb.close()
-    return rules
+    return scan_vt_workbook(path_vt).export_rules
 
 
 @dataclass
 class _ExportCtx:
     user_inputs: Mapping[str, Any]
     lift_index: int
-    lift: Dict[str, Any]
+    lift: Mapping[str, Any]
     forces: Dict[str, Any]
     drive: Dict[str, Any]
     compliance: Dict[str, Any]
     emergency: Dict[str, Any]
     cost: Dict[str, Any]
+    # Parsed / normalized view of ``lift``, ``drive`` and ``forces``, shared with
+    # :func:`compute_derived` so each lift's inputs are read once per export.
+    record: LiftRecord
     # VT-formula derived values keyed by normalized parameter label (lowercase, whitespace-
     # collapsed). Used as a fallback when the UI field is empty — see :func:`_value_for_param`.
     derived: Dict[str, str] = field(default_factory=dict)
+    # ``(exact, loose)`` normalized-key → value index over the UI dicts, built on first
+    # lookup — see :meth:`ui_key_index`.
+    _ui_index: Optional[Tuple[Dict[str, str], Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-
-def _lift(ui: Mapping[str, Any], i: int) -> Dict[str, Any]:
-    return merged_lift_at(ui, i) if isinstance(ui, dict) else {}
+    def ui_key_index(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Map every exact-normalized and qualifier-stripped key of the UI dicts (``lift``,
+        ``forces``, ``drive``, ``compliance``, ``emergency``, ``cost`` — in that
+        precedence order) to its first non-empty value. Built once per lift so each
+        unresolved parameter is two dict lookups rather than a scan of every key.
+        """
+        if self._ui_index is None:
+            exact: Dict[str, str] = {}
+            loose: Dict[str, str] = {}
+            for d in (self.lift, self.forces, self.drive, self.compliance, self.emergency, self.cost):
+                if not isinstance(d, Mapping):
+                    continue
+                for dk, dv in d.items():
+                    if not isinstance(dk, str):
+                        continue
+                    v = _s(dv)
+                    if not v:
+                        continue
+                    ek, lk = _key_forms(dk)
+                    exact.setdefault(ek, v)
+                    loose.setdefault(lk, v)
+            self._ui_index = (exact, loose)
+        return self._ui_index
+
+
+def _lift(ui: Mapping[str, Any], i: int) -> Mapping[str, Any]:
+    return merged_lift_view(ui, i)
 
 
 def _forces(ui: Mapping[str, Any], i: int) -> Dict[str, Any]:
@@ -321,6 +402,33 @@ def _cost(ui: Mapping[str, Any], i: int) -> Dict[str, Any]:
     return {}
 
 
+def _build_export_ctx(
+    user_inputs: Mapping[str, Any],
+    lift_index: int,
+    door_manufacturer: Optional[str] = None,
+) -> _ExportCtx:
+    """Assemble the per-lift resolver context used by :func:`_value_for_param`."""
+    record = lift_record(
+        _lift(user_inputs, lift_index),
+        _drive(user_inputs, lift_index),
+        _forces(user_inputs, lift_index),
+    )
+    return _ExportCtx(
+        user_inputs=user_inputs,
+        lift_index=lift_index,
+        lift=record.lift,
+        forces=record.forces,
+        drive=record.drive,
+        compliance=_compliance(user_inputs, lift_index),
+        emergency=_emergency(user_inputs, lift_index),
+        cost=_cost(user_inputs, lift_index),
+        record=record,
+        derived=compute_derived(
+            user_inputs, lift_index, door_manufacturer=door_manufacturer, record=record
+        ),
+    )
+
+
 def _floors_list(ui: Mapping[str, Any], i: int) -> List[MutableMapping[str, Any]]:
     floors = ui.get("Floors") or []
     if i >= len(floors) or not isinstance(floors[i], dict):
@@ -331,7 +439,7 @@ def _floors_list(ui: Mapping[str, Any], i: int) -> List[MutableMapping[str, Any]
     return list(raw) if isinstance(raw, list) else []
 
 
-def _get_lift_field(lift: Dict[str, Any], *keys: str) -> str:
+def _get_lift_field(lift: Mapping[str, Any], *keys: str) -> str:
     for k in keys:
         v = lift.get(k)
         if v is not None and str(v).strip() != "":
@@ -455,19 +563,19 @@ def _val_configuration_short(ctx: _ExportCtx) -> str:
 
 
 def _val_counterweight(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Counterweight location")
+    return ctx.record.cwt_location
 
 
 def _val_load(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Load capacity", "Load capacity (kg)")
+    return ctx.record.load_capacity
 
 
 def _val_persons(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Permissible number of persons", "Permissible number of persons (Pers.)")
+    return ctx.record.persons
 
 
 def _val_speed(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Speed", "Speed (m/s)")
+    return ctx.record.speed
 
 
 def _val_num_floors_fll(ctx: _ExportCtx) -> str:
@@ -479,15 +587,15 @@ def _val_stops(ctx: _ExportCtx) -> str:
 
 
 def _val_cw(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Cabin width", "Cabin width (mm)")
+    return ctx.record.cabin_width
 
 
 def _val_cd(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Cabin depth", "Cabin depth (mm)")
+    return ctx.record.cabin_depth
 
 
 def _val_height(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Structural cabin height", "Structural cabin height (mm)")
+    return ctx.record.structural_height
 
 
 def _val_door_open_b(ctx: _ExportCtx) -> str:
@@ -515,7 +623,7 @@ def _val_heat(ctx: _ExportCtx) -> str:
 
 
 def _val_clad(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Cladding thickness each wall", "Cladding thickness each wall (mm)")
+    return ctx.record.cladding
 
 
 def _val_force_f12(ctx: _ExportCtx) -> str:
@@ -579,15 +687,15 @@ def _val_std_desc(ctx: _ExportCtx) -> str:
 
 
 def _val_lop(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "LOP type and location", "LOP type and locaion")
+    return ctx.record.lop_location
 
 
 def _val_lip(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "LIP type and location")
+    return ctx.record.lip_location
 
 
 def _val_door_h(ctx: _ExportCtx) -> str:
-    return _get_lift_field(ctx.lift, "Door height", "Door height (mm)")
+    return ctx.record.door_height
 
 
 def _val_door_type(ctx: _ExportCtx) -> str:
@@ -638,7 +746,7 @@ PARAM_RESOLVERS: Dict[str, Callable[[_ExportCtx], str]] = {
     "cladding thickness each wall": _val_clad,
     "lop type and location": _val_lop,
     "lip type and location": _val_lip,
-    "door width": lambda c: _get_lift_field(c.lift, "Door width", "Door width (mm)"),
+    "door width": lambda c: c.record.door_width,
     "door height": _val_door_h,
     "door type": _val_door_type,
     "shaft width suggested": _val_shaft_width,
@@ -670,88 +778,108 @@ def _strip_qualifier(label: str) -> str:
     return _norm_param(s)
 
 
-def _lookup_value_in_ctx_dicts(param_key: str, ctx: _ExportCtx) -> str:
+# Normalized forms of UI dict keys, ``key -> (exact, loose)``. UI keys are a small, fixed
+# vocabulary, so each one is run through ``_norm_param`` / ``_strip_qualifier`` once
+# instead of once per VT row per lift; the cache is bounded in case callers feed it
+# free-form keys.
+@lru_cache(maxsize=1024)
+def _key_forms(dk: str) -> Tuple[str, str]:
+    return _norm_param(dk), _strip_qualifier(dk)
+
+
+def _lookup_value_in_ctx_dicts(param_key: str, ctx: _ExportCtx, loose_target: Optional[str] = None) -> str:
     """
-    Scan every UI-backed dict on ``ctx`` for a key that matches ``param_key`` under
-    normal or loose normalization. Returns the first non-empty match, or ``""``.
+    Look ``param_key`` up across every UI-backed dict on ``ctx`` under normal or loose
+    normalization. Returns the first non-empty match, or ``""``.
 
     The loose form tolerates the common VT / UI mismatch where VT labels carry a
     parenthetical qualifier (e.g. ``"Cabin width (clear)"``) while the UI stores the
     value under the plain name (``"Cabin width"``). Exact-normalized matches are
     preferred over loose ones so a UI that does write ``"Cabin width (clear)"`` still
     wins over one that writes ``"Cabin width"``.
-    """
-    loose_target = _strip_qualifier(param_key)
-    dicts = (ctx.lift, ctx.forces, ctx.drive, ctx.compliance, ctx.emergency, ctx.cost)
 
-    # First pass: exact normalized match.
-    for d in dicts:
-        if not isinstance(d, Mapping):
-            continue
-        for dk, dv in d.items():
-            if not isinstance(dk, str):
-                continue
-            if _norm_param(dk) == param_key:
-                v = _s(dv)
-                if v:
-                    return v
-    # Second pass: qualifier-stripped match (both sides).
-    for d in dicts:
-        if not isinstance(d, Mapping):
-            continue
-        for dk, dv in d.items():
-            if not isinstance(dk, str):
-                continue
-            if _strip_qualifier(dk) == loose_target:
-                v = _s(dv)
-                if v:
-                    return v
-    return ""
+    ``loose_target`` is the precomputed ``_strip_qualifier(param_key)`` (see
+    :class:`_ParamPlan`); it is derived here when omitted. Lookups go through the
+    per-lift :meth:`_ExportCtx.ui_key_index`.
+    """
+    if loose_target is None:
+        loose_target = _strip_qualifier(param_key)
+    exact, loose = ctx.ui_key_index()
+    return exact.get(param_key) or loose.get(loose_target) or ""
 
 
-def _value_for_param(param_label: str, ctx: _ExportCtx) -> str:
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class _ParamPlan:
+    """
+    A VT parameter label bound up front to everything :func:`_value_for_param` needs:
+    its normalized key, the qualifier-stripped key used for loose UI / derived matches
+    and whether the *Applied codes* special case applies. Rules carry their plan (see
+    :class:`VTExportRule`), so resolving a label per lift is a handful of dict lookups.
+
+    The :data:`PARAM_RESOLVERS` entry is looked up at resolve time rather than stored,
+    so plans never go stale when resolvers are registered at runtime and stay picklable
+    for the process-pool export.
     """
-    Resolve a VT parameter label to an LD export value.
 
-    Order of precedence (UI always wins):
+    key: str
+    loose_key: str
+    applied_codes: bool
 
-    1. UI-backed resolver in :data:`PARAM_RESOLVERS`.
-    2. Exact / loose-qualifier match across every UI-backed context dict
-       (``ctx.lift``, ``ctx.forces``, ``ctx.drive``, …). This catches values the UI
-       writes under labels that differ from the VT column-A label only by a trailing
-       parenthetical qualifier — e.g. UI ``"Cabin width"`` vs VT ``"Cabin width (clear)"``.
-    3. VT-formula fallback in ``ctx.derived`` — only used when the UI has nothing to
-       contribute, so manually entered values are never overridden by a computed default.
-    """
-    key = _norm_param(param_label)
 
-    fn = PARAM_RESOLVERS.get(key)
+def _compile_param_plan(param_label: str) -> _ParamPlan:
+    """Compile ``param_label`` to the :class:`_ParamPlan` rules and template rows carry."""
+    key = sys.intern(_norm_param(param_label))
+    return _ParamPlan(
+        key=key,
+        loose_key=sys.intern(_strip_qualifier(key)),
+        applied_codes="applied codes" in key,
+    )
+
+
+def _resolve_param_plan(plan: _ParamPlan, ctx: _ExportCtx) -> str:
+    fn = PARAM_RESOLVERS.get(plan.key)
     if fn:
         val = fn(ctx)
         if val:
             return val
 
     # Special: L_StandardTab.STD_DESC description "Applied codes"
-    if "applied codes" in key:
+    if plan.applied_codes:
         std = _val_std_desc(ctx)
         if std:
             return std
 
-    ui_val = _lookup_value_in_ctx_dicts(key, ctx)
+    ui_val = _lookup_value_in_ctx_dicts(plan.key, ctx, plan.loose_key)
     if ui_val:
         return ui_val
 
-    derived = ctx.derived.get(key, "")
+    derived = ctx.derived.get(plan.key, "")
     if derived:
         return derived
     # Derived also exposes an alias under the qualifier-stripped label (see
     # :mod:`lift_designer_vt_derived`). Try that as a last resort so e.g. a VT row
     # labelled plainly "Cabin width" still picks up the profile's computed width.
-    derived_loose = ctx.derived.get(_strip_qualifier(key), "")
-    if derived_loose:
-        return derived_loose
+    return ctx.derived.get(plan.loose_key, "") or ""
 
-    return ""
+
+def _value_for_param(param_label: str, ctx: _ExportCtx) -> str:
+    """
+    Resolve a VT parameter label to an LD export value.
+
+    Order of precedence (UI always wins):
+
+    1. UI-backed resolver in :data:`PARAM_RESOLVERS`.
+    2. Exact / loose-qualifier match across every UI-backed context dict
+       (``ctx.lift``, ``ctx.forces``, ``ctx.drive``, …). This catches values the UI
+       writes under labels that differ from the VT column-A label only by a trailing
+       parenthetical qualifier — e.g. UI ``"Cabin width"`` vs VT ``"Cabin width (clear)"``.
+    3. VT-formula fallback in ``ctx.derived`` — only used when the UI has nothing to
+       contribute, so manually entered values are never overridden by a computed default.
+
+    The label is compiled on every call; per-lift loops resolve the
+    :class:`_ParamPlan` their rule (or template row) already carries instead.
+    """
+    return _resolve_param_plan(_compile_param_plan(param_label), ctx)
 
 
 def _coerce_cell_value(val: str) -> Union[str, Number]:
@@ -788,87 +916,107 @@ def _floor_elevation_mm(floor: Mapping[str, Any]) -> int:
         return 0
 
 
-def _rows_for_floors_z(ctx: _ExportCtx, vt_row: int = 0) -> List[LDExportRow]:
+@lru_cache(maxsize=None)
+def _level_varname(idx: int, prop: str) -> str:
+    """``FLL.Level{idx}.{prop}`` — one shared string per level across all lifts."""
+    return f"FLL.Level{idx}.{prop}"
+
+
+def _iter_rows_for_floors_z(ctx: _ExportCtx, vt_row: int = 0) -> Iterator[LDExportRow]:
     """
     Emit ``FLL.Level{i}.Z_POT`` rows. The value is each floor's **absolute elevation**
     (UI field *Elevation (m)*) converted to millimetres — one direct mapping per row, no
     cumulative summing. The description carries the floor name (same text that the
     matching ``.DESC`` row uses for its value).
     """
-    out: List[LDExportRow] = []
     floors = _floors_list(ctx.user_inputs, ctx.lift_index)
     for idx, floor in enumerate(floors):
         z_mm = _floor_elevation_mm(floor)
         fname = _s(floor.get("Floor Name", floor.get("Floor", "")))
         label = fname if fname else f"Level {idx}"
-        out.append(
-            LDExportRow(
-                f"FLL.Level{idx}.Z_POT",
-                str(z_mm),
-                label,
-                vt_row=vt_row,
-            )
+        yield LDExportRow(
+            _level_varname(idx, "Z_POT"),
+            sys.intern(str(z_mm)),
+            sys.intern(label),
+            vt_row=vt_row,
         )
-    return out
 
 
-def _rows_for_floors_desc(ctx: _ExportCtx, vt_row: int = 0) -> List[LDExportRow]:
+def _iter_rows_for_floors_desc(ctx: _ExportCtx, vt_row: int = 0) -> Iterator[LDExportRow]:
     """
     Emit ``FLL.Level{i}.DESC`` rows. The value is the UI *Floor Name*; the description
     falls back to the numeric *Floor* if the name is blank so the LD workbook always
     has a readable label in column F.
     """
-    out: List[LDExportRow] = []
     floors = _floors_list(ctx.user_inputs, ctx.lift_index)
     for idx, floor in enumerate(floors):
         fn = _s(floor.get("Floor Name", ""))
         fl = _s(floor.get("Floor", ""))
-        out.append(LDExportRow(f"FLL.Level{idx}.DESC", fn, fl or fn, vt_row=vt_row))
-    return out
+        yield LDExportRow(_level_varname(idx, "DESC"), sys.intern(fn), sys.intern(fl or fn), vt_row=vt_row)
 
 
-def build_ld_rows_from_user_inputs(
+def iter_ld_rows_from_user_inputs(
     user_inputs: Mapping[str, Any],
     lift_index: int = 0,
     vt_path: Optional[str] = None,
     door_manufacturer: Optional[str] = None,
-) -> List[LDExportRow]:
+    rules: Optional[Iterable[VTExportRule]] = None,
+) -> Iterator[LDExportRow]:
     """
-    Build export rows using ``VT standard configurations`` LD export column.
-
-    ``door_manufacturer`` selects the VT R277 manufacturer cell (drives door RID,
-    door depth and door/wall clearance lookups). When omitted, the value is taken
-    from ``user_inputs["DoorManufacturer"]`` (or the project default).
+    Yield one lift's export rows, rule by rule, resolving each value as it is reached
+    (streaming form of :func:`build_ld_rows_from_user_inputs`, same arguments).
     """
-    ctx = _ExportCtx(
-        user_inputs=user_inputs,
-        lift_index=lift_index,
-        lift=_lift(user_inputs, lift_index),
-        forces=_forces(user_inputs, lift_index),
-        drive=_drive(user_inputs, lift_index),
-        compliance=_compliance(user_inputs, lift_index),
-        emergency=_emergency(user_inputs, lift_index),
-        cost=_cost(user_inputs, lift_index),
-        derived=compute_derived(user_inputs, lift_index, door_manufacturer=door_manufacturer),
-    )
-    rules = load_vt_export_rules(vt_path)
-    rows: List[LDExportRow] = []
+    ctx = _build_export_ctx(user_inputs, lift_index, door_manufacturer=door_manufacturer)
+    if rules is None:
+        from lift_designer_vt_rules import load_vt_rule_set
+
+        rules = load_vt_rule_set(vt_path).export_rules
+    proj_user = _proj_user_triple_indices(ctx.lift_index)
 
     for rule in rules:
         if rule.kind == "floors_z":
-            rows.extend(_rows_for_floors_z(ctx, vt_row=rule.vt_row))
+            yield from _iter_rows_for_floors_z(ctx, vt_row=rule.vt_row)
             continue
         if rule.kind == "floors_desc":
-            rows.extend(_rows_for_floors_desc(ctx, vt_row=rule.vt_row))
+            yield from _iter_rows_for_floors_desc(ctx, vt_row=rule.vt_row)
             continue
 
-        val = _value_for_param(rule.param_label, ctx)
+        val = _resolve_param_plan(rule.param_plan, ctx)
+        if isinstance(val, str):
+            val = sys.intern(val)  # "yes" / "1000" / … repeat across lifts
+
+        for template in rule.varname_templates:
+            tv = template.format(shaft=ctx.lift_index, proj=proj_user)
+            yield LDExportRow(tv, val, rule.param_label, vt_row=rule.vt_row)
 
-        for vn in rule.varnames:
-            tv = remap_varname_for_lift(vn, rule.param_label, ctx.lift_index)
-            rows.append(LDExportRow(tv, val, rule.param_label, vt_row=rule.vt_row))
 
-    return rows
+def build_ld_rows_from_user_inputs(
+    user_inputs: Mapping[str, Any],
+    lift_index: int = 0,
+    vt_path: Optional[str] = None,
+    door_manufacturer: Optional[str] = None,
+    rules: Optional[Sequence[VTExportRule]] = None,
+) -> List[LDExportRow]:
+    """
+    Build export rows using ``VT standard configurations`` LD export column.
+
+    ``door_manufacturer`` selects the VT R277 manufacturer cell (drives door RID,
+    door depth and door/wall clearance lookups). When omitted, the value is taken
+    from ``user_inputs["DoorManufacturer"]`` (or the project default).
+
+    ``rules`` lets callers that build several lifts pass an already-loaded rule list so
+    the VT workbook is not touched per lift. When omitted, the compiled snapshot from
+    :func:`lift_designer_vt_rules.load_vt_rule_set` is used.
+    """
+    return list(
+        iter_ld_rows_from_user_inputs(
+            user_inputs,
+            lift_index=lift_index,
+            vt_path=vt_path,
+            door_manufacturer=door_manufacturer,
+            rules=rules,
+        )
+    )
 
 
 def _section_row_f(title: str) -> List[Any]:
@@ -944,6 +1092,43 @@ def _apply_ld_mode_legend_to_rows_g234(matrix: List[List[Any]]) -> None:
         row[6] = _LD_MODE_LEGEND_G234[i]
 
 
+def _iter_ld_lift_block(rows: Iterable[LDExportRow]) -> Iterator[Tuple[List[Any], bool]]:
+    """
+    Body of one lift in the LD workbook (no preamble), as ``(row, is_section_header)``.
+    See :func:`matrix_for_ld_workbook` for the section-header anchoring rules.
+    """
+    headers = _LD_SECTION_HEADERS  # consumed in order
+    next_header = 0
+    seen_titles: set = set()
+
+    for r in rows:
+        if not str(r.varname).strip() and not str(r.value).strip():
+            continue
+
+        if r.vt_row:
+            while next_header < len(headers) and headers[next_header][0] <= r.vt_row:
+                _, title = headers[next_header]
+                next_header += 1
+                # The VT sheet lists "Level name" twice (Z_POT and DESC groups). Keep both
+                # occurrences (they anchor to different VT rows) but drop accidental
+                # re-adds if the table is ever extended with real duplicates.
+                key = (title, r.vt_row)
+                if key in seen_titles:
+                    continue
+                seen_titles.add(key)
+                yield _section_row_f(title), True
+
+        yield [
+            r.varname,
+            _coerce_cell_value(r.value) if isinstance(r.value, str) else r.value,
+            0,
+            2,
+            None,
+            r.description or None,
+            None,
+        ], False
+
+
 def matrix_for_ld_workbook(
     rows: Sequence[LDExportRow],
     *,
@@ -972,63 +1157,181 @@ def matrix_for_ld_workbook(
     """
     matrix: List[List[Any]] = list(_ld_workbook_preamble())
     section_rows_1based: List[int] = []
-    pending = list(_LD_SECTION_HEADERS)  # consumed in order
-    seen_titles: set = set()
-
-    def _flush_headers_up_to(target_row: int) -> None:
-        while pending and pending[0][0] <= target_row:
-            _, title = pending.pop(0)
-            # The VT sheet lists "Level name" twice (Z_POT and DESC groups). Keep both
-            # occurrences (they anchor to different VT rows) but drop accidental
-            # re-adds if the table is ever extended with real duplicates.
-            key = (title, target_row)
-            if key in seen_titles:
-                continue
-            seen_titles.add(key)
-            matrix.append(_section_row_f(title))
+    for line, is_section in _iter_ld_lift_block(rows):
+        matrix.append(line)
+        if is_section:
             section_rows_1based.append(len(matrix))
 
-    for r in rows:
-        if not str(r.varname).strip() and not str(r.value).strip():
-            continue
-
-        if r.vt_row:
-            _flush_headers_up_to(r.vt_row)
-
-        matrix.append(
-            [
-                r.varname,
-                _coerce_cell_value(r.value) if isinstance(r.value, str) else r.value,
-                0,
-                2,
-                None,
-                r.description or None,
-                None,
-            ]
-        )
-
     if with_mode_legend:
         _apply_ld_mode_legend_to_rows_g234(matrix)
     return matrix, section_rows_1based
 
 
+@dataclass(frozen=True)
+class LiftBuildTiming:
+    """Wall time spent building one lift's rows in :func:`build_ld_rows_per_lift`."""
+
+    lift_index: int
+    seconds: float
+    rows: int
+
+
+# Per-process arguments for process-pool workers (set once by the pool initializer).
+_WORKER_ARGS: Dict[str, Any] = {}
+
+
+def _init_ld_worker(
+    user_inputs: Mapping[str, Any],
+    vt_path: Optional[str],
+    door_manufacturer: Optional[str],
+    rules: Sequence[VTExportRule],
+) -> None:
+    _WORKER_ARGS.update(
+        user_inputs=user_inputs,
+        vt_path=vt_path,
+        door_manufacturer=door_manufacturer,
+        rules=rules,
+    )
+
+
+def _build_lift_rows_timed(
+    lift_index: int,
+    user_inputs: Optional[Mapping[str, Any]] = None,
+    vt_path: Optional[str] = None,
+    door_manufacturer: Optional[str] = None,
+    rules: Optional[Sequence[VTExportRule]] = None,
+) -> Tuple[List[LDExportRow], float]:
+    if user_inputs is None:
+        user_inputs = _WORKER_ARGS["user_inputs"]
+        vt_path = _WORKER_ARGS["vt_path"]
+        door_manufacturer = _WORKER_ARGS["door_manufacturer"]
+        rules = _WORKER_ARGS["rules"]
+    t0 = time.perf_counter()
+    rows = build_ld_rows_from_user_inputs(
+        user_inputs,
+        lift_index=lift_index,
+        vt_path=vt_path,
+        door_manufacturer=door_manufacturer,
+        rules=rules,
+    )
+    return rows, time.perf_counter() - t0
+
+
 def build_ld_rows_per_lift(
     user_inputs: Mapping[str, Any],
     num_lifts: int,
     vt_path: Optional[str] = None,
     door_manufacturer: Optional[str] = None,
+    rules: Optional[Sequence[VTExportRule]] = None,
+    workers: Optional[int] = None,
+    executor: str = "process",
+    timings: Optional[List[LiftBuildTiming]] = None,
 ) -> List[List[LDExportRow]]:
-    """Return ``num_lifts`` row lists: index ``i`` is ``build_ld_rows_from_user_inputs(..., lift_index=i)``."""
+    """
+    Return ``num_lifts`` row lists: index ``i`` is ``build_ld_rows_from_user_inputs(..., lift_index=i)``.
+
+    The VT rules are loaded once (or taken from ``rules``) and shared by every lift.
+
+    ``workers > 1`` fans the lifts out over a pool — ``executor="process"`` (default) or
+    ``"thread"``; results keep lift order either way. Process workers receive the project
+    and rules once, at pool start, so the pool only pays off for large projects or slow
+    machines: a single lift takes about a millisecond. When ``timings`` is a list, one
+    :class:`LiftBuildTiming` per lift is appended to it (in lift order).
+    """
     n = max(0, int(num_lifts))
-    return [
-        build_ld_rows_from_user_inputs(
+    if rules is None and n:
+        from lift_designer_vt_rules import load_vt_rule_set
+
+        rules = load_vt_rule_set(vt_path).export_rules
+    n_workers = min(int(workers or 1), n)
+    if n_workers <= 1:
+        results = [
+            _build_lift_rows_timed(i, user_inputs, vt_path, door_manufacturer, rules)
+            for i in range(n)
+        ]
+    elif executor == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            results = list(
+                pool.map(
+                    lambda i: _build_lift_rows_timed(i, user_inputs, vt_path, door_manufacturer, rules),
+                    range(n),
+                )
+            )
+    elif executor == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_ld_worker,
+            initargs=(dict(user_inputs), vt_path, door_manufacturer, list(rules or ())),
+        ) as pool:
+            results = list(pool.map(_build_lift_rows_timed, range(n)))
+    else:
+        raise ValueError(f"executor must be 'process' or 'thread', not {executor!r}")
+    if timings is not None:
+        timings.extend(
+            LiftBuildTiming(lift_index=i, seconds=sec, rows=len(rows))
+            for i, (rows, sec) in enumerate(results)
+        )
+    return [rows for rows, _ in results]
+
+
+def iter_ld_rows_per_lift(
+    user_inputs: Mapping[str, Any],
+    lift_indices: Iterable[int],
+    vt_path: Optional[str] = None,
+    door_manufacturer: Optional[str] = None,
+    rules: Optional[Sequence[VTExportRule]] = None,
+) -> Iterator[Iterator[LDExportRow]]:
+    """
+    One lazy row stream per lift index (see :func:`iter_ld_rows_from_user_inputs`), with
+    the VT rules loaded once. Feeding this to :func:`write_ld_workbook_multi` streams a
+    workbook from rule iteration to the writer without materializing any stage::
+
+        write_ld_workbook_multi(path, iter_ld_rows_per_lift(user_inputs, range(n)))
+
+    Each lift's stream must be consumed before the next one is started.
+    """
+    if rules is None:
+        from lift_designer_vt_rules import load_vt_rule_set
+
+        rules = load_vt_rule_set(vt_path).export_rules
+    for i in lift_indices:
+        yield iter_ld_rows_from_user_inputs(
             user_inputs,
             lift_index=i,
             vt_path=vt_path,
             door_manufacturer=door_manufacturer,
+            rules=rules,
         )
-        for i in range(n)
-    ]
+
+
+def iter_ld_workbook_rows(
+    rows_by_lift: Iterable[Iterable[LDExportRow]],
+) -> Iterator[Tuple[List[Any], bool]]:
+    """
+    Stream the rows of :func:`matrix_for_ld_workbook_multi` as ``(row, is_section_header)``
+    without building the matrix; ``rows_by_lift`` may be a generator (of generators, e.g.
+    :func:`iter_ld_rows_per_lift`) and is consumed one lift at a time.
+    """
+
+    def _raw() -> Iterator[Tuple[List[Any], bool]]:
+        for line in _ld_workbook_preamble():
+            yield line, False
+        for i, rows in enumerate(rows_by_lift):
+            if i > 0:
+                yield _section_row_f(f"Shaft {i}"), True
+            yield from _iter_ld_lift_block(rows)
+
+    for idx, (line, is_section) in enumerate(_raw()):
+        if 1 <= idx <= 3:
+            # Same as _apply_ld_mode_legend_to_rows_g234 on the finished matrix.
+            while len(line) < 7:
+                line.append(None)
+            line[6] = _LD_MODE_LEGEND_G234[idx - 1]
+        yield line, is_section
 
 
 def matrix_for_ld_workbook_multi(
@@ -1039,23 +1342,15 @@ def matrix_for_ld_workbook_multi(
     insert a bold **Shaft *i*** row in column **F** (same style as other section titles).
 
     Each lift uses a fresh copy of the internal section headers (Electrical & HVAC, …).
-    The mode-declaration legend is applied **once** at the end (to the global rows 2–4)
-    so the three description lines never appear on the first data rows of shafts 2+.
+    The mode-declaration legend is applied **once** (to the global rows 2–4) so the three
+    description lines never appear on the first data rows of shafts 2+.
     """
-    matrix: List[List[Any]] = list(_ld_workbook_preamble())
+    matrix: List[List[Any]] = []
     section_row_nums: List[int] = []
-    for i, rows in enumerate(rows_by_lift):
-        if i > 0:
-            matrix.append(_section_row_f(f"Shaft {i}"))
+    for line, is_section in iter_ld_workbook_rows(rows_by_lift):
+        matrix.append(line)
+        if is_section:
             section_row_nums.append(len(matrix))
-        sub_m, sub_sec = matrix_for_ld_workbook(list(rows), with_mode_legend=False)
-        body = sub_m[1:]
-        offset = len(matrix)
-        matrix.extend(body)
-        for s in sub_sec:
-            if s > 1:
-                section_row_nums.append(offset + (s - 1))
-    _apply_ld_mode_legend_to_rows_g234(matrix)
     return matrix, section_row_nums
 
 
@@ -1066,23 +1361,56 @@ def _safe_ld_group_filename_segment(name: str, index_1based: int) -> str:
     return s[:80]
 
 
-def write_ld_exports_per_group(
+@dataclass(frozen=True)
+class LDGroupExportResult:
+    """Outcome of writing one group's workbook in :func:`write_ld_group_exports`."""
+
+    group_name: str
+    path: str
+    lift_count: int
+    ok: bool
+    error: str = ""
+    matrix_seconds: float = 0.0
+    save_seconds: float = 0.0
+
+
+def _write_ld_group_workbook(
+    group_name: str,
+    path: str,
+    rows_by_lift: Sequence[Sequence[LDExportRow]],
+    sheet_title: str,
+) -> LDGroupExportResult:
+    """
+    Stream and save one group's workbook; errors are returned, not raised (pool worker).
+    ``matrix_seconds`` covers producing the rows, ``save_seconds`` the workbook itself.
+    """
+    t0 = time.perf_counter()
+    t1 = t0
+    try:
+        t1 = t0 + _write_ld_row_stream(path, iter_ld_workbook_rows(rows_by_lift), sheet_title=sheet_title)
+    except Exception as e:
+        t2 = time.perf_counter()
+        return LDGroupExportResult(
+            group_name, path, len(rows_by_lift), False, f"{type(e).__name__}: {e}", t1 - t0, t2 - t1
+        )
+    return LDGroupExportResult(group_name, path, len(rows_by_lift), True, "", t1 - t0, time.perf_counter() - t1)
+
+
+def write_ld_group_exports(
     base_save_path: str,
     rows_by_lift: Sequence[Sequence[LDExportRow]],
     lift_groups_raw: Optional[Sequence[Mapping[str, Any]]],
     *,
     sheet_title: str = "SyncWithLD",
-) -> List[str]:
+    workers: Optional[int] = None,
+) -> List[LDGroupExportResult]:
     """
-    Write **one** ``SyncWithLD`` workbook per Building System group.
+    Write **one** ``SyncWithLD`` workbook per Building System group and report each one.
 
-    ``base_save_path`` is the path chosen in the save dialog. With a single group, the workbook
-    is written exactly there. With multiple groups, files are
-    ``{stem}_{sanitized_group_title}.xlsx`` in the same directory (one suffix from the group name).
-
-    Row lists must align with ``LiftColumnGroups`` counts (normalized via
-    :func:`gui.project_lift_schema.parse_lift_column_groups`).
-    Returns all paths written.
+    File naming is that of :func:`write_ld_exports_per_group`. With ``workers > 1`` and
+    several groups, each group's matrix is built and saved in a worker process. Results
+    come back in group order; a group that fails to write is reported with ``ok=False``
+    and its ``error`` text while the other groups are still written.
     """
     from gui.project_lift_schema import merge_consecutive_lift_groups_same_name, parse_lift_column_groups
 
@@ -1103,27 +1431,79 @@ def write_ld_exports_per_group(
     if not pairs:
         return []
 
+    jobs: List[Tuple[str, str, List[Sequence[LDExportRow]]]] = []
     if len(pairs) == 1:
-        write_ld_workbook_multi(base_save_path, pairs[0][1], sheet_title=sheet_title)
-        return [base_save_path]
-
-    parent = os.path.dirname(base_save_path)
-    stem = os.path.splitext(os.path.basename(base_save_path))[0]
-    written: List[str] = []
-    used_lower: set[str] = set()
-    for gi, (g, chunk) in enumerate(pairs):
-        safe = _safe_ld_group_filename_segment(str(g.get("name", "")), gi + 1)
-        fname = f"{stem}_{safe}.xlsx"
-        out_path = os.path.join(parent, fname)
-        key = out_path.lower()
-        if key in used_lower:
-            fname = f"{stem}_{safe}_{gi + 1}.xlsx"
+        jobs.append((str(pairs[0][0].get("name", "")), base_save_path, pairs[0][1]))
+    else:
+        parent = os.path.dirname(base_save_path)
+        stem = os.path.splitext(os.path.basename(base_save_path))[0]
+        used_lower: set[str] = set()
+        for gi, (g, chunk) in enumerate(pairs):
+            safe = _safe_ld_group_filename_segment(str(g.get("name", "")), gi + 1)
+            fname = f"{stem}_{safe}.xlsx"
             out_path = os.path.join(parent, fname)
             key = out_path.lower()
-        used_lower.add(key)
-        write_ld_workbook_multi(out_path, chunk, sheet_title=sheet_title)
-        written.append(out_path)
-    return written
+            if key in used_lower:
+                fname = f"{stem}_{safe}_{gi + 1}.xlsx"
+                out_path = os.path.join(parent, fname)
+                key = out_path.lower()
+            used_lower.add(key)
+            jobs.append((str(g.get("name", "")), out_path, chunk))
+
+    n_workers = min(int(workers or 1), len(jobs))
+    if n_workers <= 1:
+        return [_write_ld_group_workbook(name, path, chunk, sheet_title) for name, path, chunk in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [
+            pool.submit(_write_ld_group_workbook, name, path, chunk, sheet_title)
+            for name, path, chunk in jobs
+        ]
+        results: List[LDGroupExportResult] = []
+        for (name, path, chunk), fut in zip(jobs, futures):
+            try:
+                results.append(fut.result())
+            except Exception as e:  # worker process died (e.g. BrokenProcessPool)
+                results.append(LDGroupExportResult(name, path, len(chunk), False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def write_ld_exports_per_group(
+    base_save_path: str,
+    rows_by_lift: Sequence[Sequence[LDExportRow]],
+    lift_groups_raw: Optional[Sequence[Mapping[str, Any]]],
+    *,
+    sheet_title: str = "SyncWithLD",
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Write **one** ``SyncWithLD`` workbook per Building System group.
+
+    ``base_save_path`` is the path chosen in the save dialog. With a single group, the workbook
+    is written exactly there. With multiple groups, files are
+    ``{stem}_{sanitized_group_title}.xlsx`` in the same directory (one suffix from the group name).
+
+    Row lists must align with ``LiftColumnGroups`` counts (normalized via
+    :func:`gui.project_lift_schema.parse_lift_column_groups`).
+    Returns all paths written. ``workers`` is passed to :func:`write_ld_group_exports`; if any
+    group fails, the remaining groups are still written and a ``RuntimeError`` then lists
+    the failures.
+    """
+    results = write_ld_group_exports(
+        base_save_path,
+        rows_by_lift,
+        lift_groups_raw,
+        sheet_title=sheet_title,
+        workers=workers,
+    )
+    failed = [r for r in results if not r.ok]
+    if failed:
+        raise RuntimeError(
+            "\n".join(f"{r.group_name or 'group'} ({r.path}): {r.error}" for r in failed)
+        )
+    return [r.path for r in results]
 
 
 def _matrix_for_workbook(rows: Sequence[LDExportRow]) -> List[List[Any]]:
@@ -1152,68 +1532,110 @@ def write_ld_csv(path: str, rows: Sequence[LDExportRow]) -> None:
             w.writerow(line)
 
 
-def _write_ld_matrix_to_path(
+# Shared named styles of the SyncWithLD sheet: (bold, centered) -> style name.
+_LD_CELL_STYLES: Dict[Tuple[bool, bool], str] = {
+    (False, False): "LD left",
+    (False, True): "LD center",
+    (True, False): "LD left bold",
+    (True, True): "LD center bold",
+}
+
+
+def _write_ld_row_stream(
     path: str,
-    matrix: List[List[Any]],
-    section_row_nums: Sequence[int],
+    row_stream: Iterable[Tuple[Sequence[Any], bool]],
     sheet_title: str = "SyncWithLD",
-) -> None:
+) -> float:
+    """
+    Write ``(row, is_section_header)`` pairs to a write-only ``SyncWithLD`` workbook.
+
+    Column widths are tracked while the rows are spooled to a temporary file (a
+    write-only sheet needs them before its first row); the rows are then replayed into
+    the sheet through a fixed set of pre-styled cells, one named style per
+    bold/alignment combination, so memory stays flat as lifts and floors are added.
+
+    Returns the seconds spent consuming ``row_stream`` (the spooling pass).
+    """
     try:
         from openpyxl import Workbook
-        from openpyxl.styles import Alignment, Font
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font, NamedStyle
         from openpyxl.utils import get_column_letter
     except ImportError as e:
         raise ImportError("pip install openpyxl") from e
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet_title
-    font_header = Font(bold=True)
-    font_section = Font(bold=True)
-    align_left = Alignment(horizontal="left", vertical="center")
-    align_center = Alignment(horizontal="center", vertical="center")
-
-    def _alignment_for_column(c_idx: int) -> Alignment:
+
+    max_len = [0] * 7
+    n_rows = 0
+    t0 = time.perf_counter()
+    with tempfile.TemporaryFile() as spool:
+        for line, is_section in row_stream:
+            line = list(line[:7])
+            for c_idx, v in enumerate(line):
+                if v is not None:
+                    n = len(str(v))
+                    if n > max_len[c_idx]:
+                        max_len[c_idx] = n
+            pickle.dump((line, is_section), spool, pickle.HIGHEST_PROTOCOL)
+            n_rows += 1
+        spool_seconds = time.perf_counter() - t0
+        spool.seek(0)
+
+        wb = Workbook(write_only=True)
+        for (bold, centered), name in _LD_CELL_STYLES.items():
+            wb.add_named_style(
+                NamedStyle(
+                    name=name,
+                    font=Font(bold=bold),
+                    alignment=Alignment(horizontal="center" if centered else "left", vertical="center"),
+                )
+            )
+        ws = wb.create_sheet(sheet_title)
+        for c_idx in range(7):
+            ws.column_dimensions[get_column_letter(c_idx + 1)].width = min(max(max_len[c_idx] + 2.5, 12), 85)
+
         # A, F, G: left; B, C, D: center; E: left (unused spacer)
-        if c_idx in (1, 5, 6, 7):
-            return align_left
-        return align_center
-
-    for r_idx, line in enumerate(matrix, start=1):
-        for c_idx, cell in enumerate(line, start=1):
-            if c_idx > 7:
-                continue
-            cl = ws.cell(row=r_idx, column=c_idx, value=cell)
-            cl.alignment = _alignment_for_column(c_idx)
-            if r_idx == 1 and cell is not None:
-                cl.font = font_header
-            if r_idx in section_row_nums and c_idx == 6 and cell is not None:
-                cl.font = font_section
-
-    for col in range(1, 8):
-        letter = get_column_letter(col)
-        max_len = 0
-        for r in range(1, ws.max_row + 1):
-            v = ws.cell(row=r, column=col).value
-            if v is not None:
-                max_len = max(max_len, len(str(v)))
-        ws.column_dimensions[letter].width = min(max(max_len + 2.5, 12), 85)
-
-    wb.save(path)
+        centered_cols = (False, True, True, True, False, False, False)
+
+        def _styled(c_idx: int, bold: bool) -> Any:
+            cell = WriteOnlyCell(ws)
+            cell.style = _LD_CELL_STYLES[(bold, centered_cols[c_idx])]
+            return cell
+
+        # Each cell object is written out as soon as its row is appended, so one set of
+        # styled cells per style is reused for every row.
+        plain = [_styled(c, False) for c in range(7)]
+        bold_cells = [_styled(c, True) for c in range(7)]
+        unpickler = pickle.Unpickler(spool)
+        for r_idx in range(1, n_rows + 1):
+            line, is_section = unpickler.load()
+            out: List[Any] = []
+            for c_idx, v in enumerate(line):
+                if v is None:
+                    out.append(None)
+                    continue
+                cell = bold_cells[c_idx] if r_idx == 1 or (is_section and c_idx == 5) else plain[c_idx]
+                cell.value = v
+                out.append(cell)
+            ws.append(out)
+        wb.save(path)
+    return spool_seconds
 
 
 def write_ld_workbook_multi(
     path: str,
-    rows_by_lift: Sequence[Sequence[LDExportRow]],
+    rows_by_lift: Iterable[Iterable[LDExportRow]],
     sheet_title: str = "SyncWithLD",
 ) -> None:
-    """Write one ``SyncWithLD`` sheet: preamble once, then each lift block (**Shaft *n*** between lifts)."""
-    matrix, section_row_nums = matrix_for_ld_workbook_multi(rows_by_lift)
-    _write_ld_matrix_to_path(path, matrix, section_row_nums, sheet_title=sheet_title)
+    """
+    Write one ``SyncWithLD`` sheet: preamble once, then each lift block (**Shaft *n*** between lifts).
+    ``rows_by_lift`` may be a generator; rows are streamed (see :func:`iter_ld_workbook_rows`).
+    """
+    _write_ld_row_stream(path, iter_ld_workbook_rows(rows_by_lift), sheet_title=sheet_title)
 
 
 def write_ld_workbook(
     path: str,
-    rows: Sequence[LDExportRow],
+    rows: Iterable[LDExportRow],
     sheet_title: str = "SyncWithLD",
 ) -> None:
     write_ld_workbook_multi(path, [rows], sheet_title=sheet_title)
@@ -1230,12 +1652,60 @@ def export_ld_data_import_test(
     Returns the path written.
     """
     out = output_path or _default_ld_test_output_path()
-    rows = build_ld_rows_from_user_inputs(
-        user_inputs,
-        lift_index=lift_index,
-        vt_path=vt_path,
-    )
-    write_ld_workbook(out, rows)
+    write_ld_workbook(out, iter_ld_rows_from_user_inputs(user_inputs, lift_index=lift_index, vt_path=vt_path))
+    return out
+
+
+def benchmark_varname_remap(
+    num_lifts: int = 50,
+    rules: Optional[Sequence[VTExportRule]] = None,
+    repeat: int = 5,
+    log=print,
+) -> Dict[str, float]:
+    """
+    Best-of-``repeat`` time (seconds) to produce every export varname of ``rules``
+    (default: the shipped VT rule set) for ``num_lifts`` lifts, via the per-row regex
+    path (``"regex"``, :func:`remap_varname_for_lift`) and the precompiled templates
+    (``"template"``). Raises ``ValueError`` if the two paths disagree on any varname.
+    """
+    if rules is None:
+        from lift_designer_vt_rules import load_vt_rule_set
+
+        rules = load_vt_rule_set().export_rules
+    static = [r for r in rules if r.kind == "static"]
+
+    def _regex() -> List[str]:
+        return [
+            remap_varname_for_lift(vn, r.param_label, i)
+            for i in range(num_lifts)
+            for r in static
+            for vn in r.varnames
+        ]
+
+    def _template() -> List[str]:
+        out: List[str] = []
+        for i in range(num_lifts):
+            proj_user = _proj_user_triple_indices(i)
+            out.extend(t.format(shaft=i, proj=proj_user) for r in static for t in r.varname_templates)
+        return out
+
+    expected, got = _regex(), _template()
+    for a, b in zip(expected, got):
+        if a != b:
+            raise ValueError(f"Varname template mismatch: {b!r} != {a!r}")
+    if len(expected) != len(got):
+        raise ValueError("Varname template mismatch: row counts differ")
+
+    out: Dict[str, float] = {}
+    for name, fn in (("regex", _regex), ("template", _template)):
+        best = float("inf")
+        for _ in range(max(1, int(repeat))):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        out[name] = best
+        log(f"{name:>8}: {best * 1000:7.2f} ms ({len(expected)} varnames, {num_lifts} lifts)")
+    log(f" speedup: {out['regex'] / out['template']:.1f}x")
     return out
 
 
@@ -1268,8 +1738,25 @@ if __name__ == "__main__":
         action="store_true",
         help="Write LD workbook(s): one file per lift group (LiftColumnGroups), or one file if there is a single group.",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="With --all-lifts: build lifts in this many worker processes and print per-lift timings.",
+    )
+    p.add_argument(
+        "--benchmark-varnames",
+        type=int,
+        default=None,
+        metavar="LIFTS",
+        help="Check and time the varname remap for this many lifts, then exit.",
+    )
     args = p.parse_args()
 
+    if args.benchmark_varnames:
+        benchmark_varname_remap(args.benchmark_varnames)
+        raise SystemExit(0)
+
     if args.project_json:
         try:
             from gui.project_json import load_project_json
@@ -1309,7 +1796,11 @@ if __name__ == "__main__":
             print("Import error: run from the project root so the gui package is found.", file=sys.stderr)
             raise SystemExit(1) from None
         n = len(data.get("BuildingSystems") or [])
-        rows_by_lift = build_ld_rows_per_lift(data, n)
+        timings: List[LiftBuildTiming] = []
+        rows_by_lift = build_ld_rows_per_lift(data, n, workers=args.workers, timings=timings)
+        if args.workers:
+            for t in timings:
+                print(f"lift {t.lift_index + 1}: {t.rows} rows in {t.seconds * 1000:.1f} ms")
         paths = write_ld_exports_per_group(out, rows_by_lift, data.get(KEY_LIFT_COLUMN_GROUPS))
         for p in paths:
             print(p)
@@ -24,8 +24,10 @@ from __future__ import annotations
 
 import os
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 
 # Yellow/amber fill used to highlight cells whose value came from a non-standard
@@ -40,19 +42,17 @@ def _normalize_override_label(label: Any) -> str:
     return " ".join(str(label).split()).lower()
 
 from lift_designer_ld_export import (
+    _DATACLASS_SLOTS,
     _ExportCtx,
+    _ParamPlan,
+    _build_export_ctx,
     _coerce_cell_value,
-    _compliance,
-    _cost,
-    _drive,
-    _emergency,
-    _forces,
-    _lift,
-    _value_for_param,
-    default_vt_workbook_path,
+    _compile_param_plan,
+    _resolve_param_plan,
     project_resource_dir,
 )
-from lift_designer_vt_derived import compute_derived
+from lift_designer_vt_rules import baked_template_label_rows, load_vt_rule_set, scan_vt_workbook
+from lift_designer_xlsx_patch import load_template_sheet
 
 
 __all__ = [
@@ -86,7 +86,7 @@ __all__ = [
 # Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VTScheduleRule:
     """One row pulled from the VT sheet for the schedules export.
 
@@ -98,9 +98,18 @@ class VTScheduleRule:
     param_label: str = ""
     unit: str = ""
     vt_row: int = 0
+    # Compiled parameter label, built once at rule load; not part of rule snapshots.
+    param_plan: _ParamPlan = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Shared by every lift's rows; intern once per rule set.
+        self.kind = sys.intern(self.kind)
+        self.param_label = sys.intern(self.param_label)
+        self.unit = sys.intern(self.unit)
+        self.param_plan = _compile_param_plan(self.param_label)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ScheduleRow:
     """Resolved schedule row ready for the output workbook."""
 
@@ -177,84 +186,79 @@ _FORCE_DATA_ROWS = {
 }
 
 
-def load_vt_schedule_rules(path_vt: Optional[str] = None) -> List[VTScheduleRule]:
+def _schedule_rule_from_row(r: int, a: Any, d: Any, e: Any, f: Any) -> Optional[VTScheduleRule]:
     """
-    Scan ``VT Standard configs`` and return an ordered list of rules:
-
-    - Every row where column **E** is ``yes`` becomes a ``data`` rule carrying the
-      parameter label (column A), unit (column D, brackets stripped), and VT row.
-    - Rows that look like section headers (see :func:`_looks_like_section_header`)
-      become ``section`` rules so the output workbook can emit bold group titles in
-      the same order they appear in VT.
+    Classify one VT row (columns A, D, E, F) for the schedules export:
+
+    - column **E** is ``yes`` → ``data`` rule carrying the parameter label (column A),
+      unit (column D, brackets stripped), and VT row;
+    - rows that look like section headers (see :func:`_looks_like_section_header`)
+      → ``section`` rule, unless curated in :data:`_EXCLUDED_SECTION_TITLES` /
+      :data:`_FORCE_DATA_ROWS`;
+    - anything else → ``None``.
     """
-    path_vt = path_vt or default_vt_workbook_path()
-    try:
-        from openpyxl import load_workbook
-    except ImportError as e:
-        raise ImportError("pip install openpyxl") from e
+    a_s = "" if a is None else str(a).strip()
+    if not a_s:
+        return None
+    d_s = "" if d is None else str(d).strip()
+    e_s = "" if e is None else str(e).strip()
+    f_s = "" if f is None else str(f).strip()
+
+    label_key = _norm(a_s)
+
+    if e_s.lower() == "yes":
+        return VTScheduleRule(
+            kind="data",
+            param_label=a_s,
+            unit=_strip_unit_brackets(d_s),
+            vt_row=r,
+        )
 
-    wb = load_workbook(path_vt, data_only=True)
-    if "VT Standard configs" not in wb.sheetnames:
-        wb.close()
-        return []
-    ws = wb["VT Standard configs"]
-
-    rules: List[VTScheduleRule] = []
-    for r in range(3, ws.max_row + 1):
-        a = ws.cell(r, 1).value
-        d = ws.cell(r, 4).value
-        e = ws.cell(r, 5).value
-        f = ws.cell(r, 6).value
-        a_s = "" if a is None else str(a).strip()
-        if not a_s:
-            continue
-        d_s = "" if d is None else str(d).strip()
-        e_s = "" if e is None else str(e).strip()
-        f_s = "" if f is None else str(f).strip()
-
-        label_key = _norm(a_s)
-
-        if e_s.lower() == "yes":
-            rules.append(
-                VTScheduleRule(
-                    kind="data",
-                    param_label=a_s,
-                    unit=_strip_unit_brackets(d_s),
-                    vt_row=r,
-                )
+    if _looks_like_section_header(a_s, d_s, e_s, f_s):
+        # User-curated overrides for rows that structurally look like section
+        # headers but shouldn't be rendered as bold titles.
+        if label_key in _EXCLUDED_SECTION_TITLES:
+            return None
+        if label_key in _FORCE_DATA_ROWS:
+            return VTScheduleRule(
+                kind="data",
+                param_label=a_s,
+                unit=_strip_unit_brackets(d_s),
+                vt_row=r,
             )
-            continue
+        return VTScheduleRule(kind="section", param_label=a_s, vt_row=r)
+    return None
 
-        if _looks_like_section_header(a_s, d_s, e_s, f_s):
-            # User-curated overrides for rows that structurally look like section
-            # headers but shouldn't be rendered as bold titles.
-            if label_key in _EXCLUDED_SECTION_TITLES:
-                continue
-            if label_key in _FORCE_DATA_ROWS:
-                rules.append(
-                    VTScheduleRule(
-                        kind="data",
-                        param_label=a_s,
-                        unit=_strip_unit_brackets(d_s),
-                        vt_row=r,
-                    )
-                )
-                continue
-            rules.append(VTScheduleRule(kind="section", param_label=a_s, vt_row=r))
 
-    wb.close()
-    return rules
+def load_vt_schedule_rules(path_vt: Optional[str] = None) -> List[VTScheduleRule]:
+    """
+    Scan ``VT Standard configs`` and return an ordered list of rules (one per row
+    accepted by :func:`_schedule_rule_from_row`), so the output workbook can emit bold
+    group titles in the same order they appear in VT.
+
+    Always parses the workbook (single read-only pass, see
+    :func:`lift_designer_vt_rules.scan_vt_workbook`); exports go through the compiled
+    snapshot in :func:`lift_designer_vt_rules.load_vt_rule_set` instead.
+    """
+    return scan_vt_workbook(path_vt).schedule_rules
 
 
 # ---------------------------------------------------------------------------
 # Row building — reuses the LD export's value resolver
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _section_schedule_row(param_label: str, vt_row: int) -> ScheduleRow:
+    """Section marker rows are identical for every lift; build each one once."""
+    return ScheduleRow(param_label=param_label, vt_row=vt_row, is_section=True)
+
+
 def build_schedule_rows_from_user_inputs(
     user_inputs: Mapping[str, Any],
     lift_index: int = 0,
     vt_path: Optional[str] = None,
     door_manufacturer: Optional[str] = None,
+    rules: Optional[Sequence[VTScheduleRule]] = None,
 ) -> List[ScheduleRow]:
     """
     Build the ordered schedule rows for one lift by resolving every ``yes`` parameter
@@ -263,36 +267,25 @@ def build_schedule_rows_from_user_inputs(
 
     ``door_manufacturer`` selects the VT R277 manufacturer cell. See
     :func:`lift_designer_vt_derived.compute_derived` for the resolution rules.
+
+    ``rules`` takes an already-loaded rule list (see :func:`build_schedule_rows_per_lift`);
+    when omitted the compiled snapshot from :func:`lift_designer_vt_rules.load_vt_rule_set`
+    is used.
     """
-    ctx = _ExportCtx(
-        user_inputs=user_inputs,
-        lift_index=lift_index,
-        lift=_lift(user_inputs, lift_index),
-        forces=_forces(user_inputs, lift_index),
-        drive=_drive(user_inputs, lift_index),
-        compliance=_compliance(user_inputs, lift_index),
-        emergency=_emergency(user_inputs, lift_index),
-        cost=_cost(user_inputs, lift_index),
-        derived=compute_derived(user_inputs, lift_index, door_manufacturer=door_manufacturer),
-    )
-    rules = load_vt_schedule_rules(vt_path)
+    ctx = _build_ctx(user_inputs, lift_index, door_manufacturer=door_manufacturer)
+    if rules is None:
+        rules = load_vt_rule_set(vt_path).schedule_rules
     rows: List[ScheduleRow] = []
     for rule in rules:
         if rule.kind == "section":
-            rows.append(
-                ScheduleRow(
-                    param_label=rule.param_label,
-                    vt_row=rule.vt_row,
-                    is_section=True,
-                )
-            )
+            rows.append(_section_schedule_row(rule.param_label, rule.vt_row))
             continue
-        val = _value_for_param(rule.param_label, ctx)
+        val = _resolve_param_plan(rule.param_plan, ctx)
         rows.append(
             ScheduleRow(
                 param_label=rule.param_label,
                 unit=rule.unit,
-                value=val,
+                value=sys.intern(val) if isinstance(val, str) else val,
                 vt_row=rule.vt_row,
             )
         )
@@ -304,15 +297,19 @@ def build_schedule_rows_per_lift(
     num_lifts: int,
     vt_path: Optional[str] = None,
     door_manufacturer: Optional[str] = None,
+    rules: Optional[Sequence[VTScheduleRule]] = None,
 ) -> List[List[ScheduleRow]]:
-    """Return ``num_lifts`` row lists — one per lift index."""
+    """Return ``num_lifts`` row lists — one per lift index (VT rules loaded once)."""
     n = max(0, int(num_lifts))
+    if rules is None and n:
+        rules = load_vt_rule_set(vt_path).schedule_rules
     return [
         build_schedule_rows_from_user_inputs(
             user_inputs,
             lift_index=i,
             vt_path=vt_path,
             door_manufacturer=door_manufacturer,
+            rules=rules,
         )
         for i in range(n)
     ]
@@ -330,42 +327,31 @@ def _row_section(title: str) -> List[Any]:
     return [title, None, None]
 
 
-def _prune_trailing_sections(matrix: List[List[Any]], bold_rows: List[int]) -> None:
-    """
-    Drop any tail of section-only rows (section header immediately followed by another
-    section header / end of block) so the workbook never ends with orphan bold titles.
-    Runs in place on ``matrix`` and ``bold_rows``.
-    """
-    # Scan from the end: if the last non-preamble row is a section header (bold row
-    # with empty B and C) whose next item is another section header or EOF, drop it.
-    changed = True
-    while changed:
-        changed = False
-        i = len(matrix) - 1
-        while i >= 1:
-            row = matrix[i]
-            is_bold = (i + 1) in bold_rows
-            is_pure_label = is_bold and (row[1] is None) and (row[2] is None)
-            if not is_pure_label:
-                break
-            # Look at next row (below). If there is no next data row before another
-            # bold row or EOF, this header is orphaned.
-            has_child = False
-            for j in range(i + 1, len(matrix)):
-                nxt = matrix[j]
-                if (j + 1) in bold_rows:
-                    break
-                if any(c not in (None, "") for c in nxt):
-                    has_child = True
-                    break
-            if has_child:
-                i -= 1
-                continue
-            # Drop this row
-            matrix.pop(i)
-            bold_rows[:] = [b if b < i + 1 else b - 1 for b in bold_rows if b != i + 1]
-            changed = True
-            break
+def _append_schedule_block(
+    matrix: List[List[Any]],
+    bold_rows: List[int],
+    rows: Iterable[ScheduleRow],
+) -> None:
+    """
+    Append one lift block to ``matrix`` / ``bold_rows`` (1-based bold Excel rows) in a
+    single pass. Section headers left without a data row at the end of the block are
+    dropped so the workbook never ends with orphan bold titles.
+    """
+    start = len(matrix)
+    last_data = start  # matrix length right after the block's last data row
+    for r in rows:
+        if r.is_section:
+            matrix.append(_row_section(r.param_label))
+            bold_rows.append(len(matrix))
+            continue
+        matrix.append([r.param_label, r.unit or None, r.value or None])
+        last_data = len(matrix)
+    if last_data < len(matrix):
+        # Only section rows follow the last data row, and their bold indices are the
+        # newest entries of bold_rows.
+        del matrix[last_data:]
+        while bold_rows and bold_rows[-1] > last_data:
+            bold_rows.pop()
 
 
 def matrix_for_schedule_workbook(
@@ -376,20 +362,12 @@ def matrix_for_schedule_workbook(
     where ``bold_row_indices`` are 1-based Excel rows to render in bold (header row
     and section-title rows).
 
-    Section headers that have no data row following them inside this block are
+    Section headers that have no data row following them at the end of the block are
     pruned so the workbook doesn't carry empty bold titles.
     """
     matrix: List[List[Any]] = [list(_SCHEDULE_HEADERS)]
     bold_rows: List[int] = [1]  # header row
-
-    for r in rows:
-        if r.is_section:
-            matrix.append(_row_section(r.param_label))
-            bold_rows.append(len(matrix))
-            continue
-        matrix.append([r.param_label, r.unit or None, r.value or None])
-
-    _prune_trailing_sections(matrix, bold_rows)
+    _append_schedule_block(matrix, bold_rows, rows)
     return matrix, bold_rows
 
 
@@ -407,13 +385,7 @@ def matrix_for_schedule_workbook_multi(
     for i, rows in enumerate(rows_by_lift):
         matrix.append(_row_section(f"Shaft {i + 1}"))
         bold_rows.append(len(matrix))
-        sub_m, sub_bold = matrix_for_schedule_workbook(list(rows))
-        body = sub_m[1:]  # drop sub-preamble
-        offset = len(matrix)
-        matrix.extend(body)
-        for b in sub_bold:
-            if b > 1:
-                bold_rows.append(offset + (b - 1))
+        _append_schedule_block(matrix, bold_rows, rows)  # never prunes the shaft row
 
     return matrix, bold_rows
 
@@ -496,7 +468,9 @@ TEMPLATE_LIFT_HEADER_ROW: int = 8           # Row whose column A is "Lift Number
 TEMPLATE_PARAM_FIRST_ROW: int = 9           # First parameter row below the header.
 TEMPLATE_FIRST_LIFT_COL: int = 8            # Column H → lift 1.
 TEMPLATE_LIFT_COL_STRIDE: int = 4           # H, L, P, T, X, AB, AF, AJ.
-TEMPLATE_MAX_LIFTS: int = 8                 # Template has 8 pre-laid-out lift columns.
+TEMPLATE_MAX_LIFTS: int = 8                 # Lift columns per template sheet.
+# Lifts beyond the first TEMPLATE_MAX_LIFTS continue on copies of the template sheet
+# ("VT General Schedules (2)", …) with the lift numbers in the header row continued.
 
 # --- Revision title block layout -----------------------------------------
 # Row 1 is the header (Revision / Issue Purpose / Date / Design Eng. / Checked);
@@ -529,16 +503,25 @@ _TEMPLATE_FILENAMES: Tuple[str, ...] = (
 )
 
 
+# Resource folder -> template path found there (re-checked with one ``isfile`` per call).
+_TEMPLATE_PATH_CACHE: Dict[str, str] = {}
+
+
 def default_schedule_template_path() -> str:
     """
     Return the absolute path to the VT Schedules template workbook that ships
     next to this module. Raises :class:`FileNotFoundError` if none of the known
-    template filenames can be located.
+    template filenames can be located. The result is remembered while the file
+    exists, so the folder is not searched again on every export.
     """
     base_dir = project_resource_dir()
+    cached = _TEMPLATE_PATH_CACHE.get(base_dir)
+    if cached is not None and os.path.isfile(cached):
+        return cached
     for name in _TEMPLATE_FILENAMES:
         p = os.path.join(base_dir, name)
         if os.path.isfile(p):
+            _TEMPLATE_PATH_CACHE[base_dir] = p
             return p
     # Last-resort: any ``*template*VT*Schedules*.xlsx`` in the same folder.
     try:
@@ -550,7 +533,9 @@ def default_schedule_template_path() -> str:
                 and "vt" in lo
                 and "schedule" in lo
             ):
-                return os.path.join(base_dir, fn)
+                p = os.path.join(base_dir, fn)
+                _TEMPLATE_PATH_CACHE[base_dir] = p
+                return p
     except OSError:
         pass
     raise FileNotFoundError(
@@ -625,23 +610,133 @@ def _write_revision_block(ws, revisions: Sequence[Mapping[str, Any]]) -> int:
     return len(trimmed)
 
 
+def _template_label_rows(ws, template_path: str) -> List[Tuple[int, str]]:
+    """
+    ``(row, label)`` for every non-empty column-A cell from
+    :data:`TEMPLATE_PARAM_FIRST_ROW` down. Frozen builds ship this map pre-baked (see
+    :func:`lift_designer_vt_rules.baked_template_label_rows`); otherwise it is read once
+    from ``ws``.
+    """
+    baked = baked_template_label_rows(template_path)
+    if baked is not None:
+        return baked
+    out: List[Tuple[int, str]] = []
+    for r in range(TEMPLATE_PARAM_FIRST_ROW, ws.max_row + 1):
+        label_cell = ws.cell(r, 1).value
+        if label_cell is None:
+            continue
+        label = str(label_cell).strip()
+        if label:
+            out.append((r, label))
+    return out
+
+
+@dataclass(frozen=True)
+class _TemplateRowPlan:
+    """One parameter row of the schedules template (see :func:`_template_row_plan`)."""
+
+    row: int
+    label: str
+    override_key: str  # _normalize_override_label(label)
+    formula_lifts: FrozenSet[int]  # 1-based lifts whose target cell holds a template formula
+    param_plan: _ParamPlan  # _compile_param_plan(label)
+
+
+# (absolute template path, sheet title) -> ((mtime_ns, size), row plan)
+_ROW_PLAN_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], Tuple[_TemplateRowPlan, ...]]] = {}
+
+
+def _is_template_formula(value: Any) -> bool:
+    # Preserve template-authored Excel formulas (V3.0 introduced cascading
+    # formulas like =H82+1.5 / =ROUND(...) / =H53). The template's formula
+    # is authoritative for those cells — overwriting them with a static
+    # value would break the user's interactive recalc when they edit a
+    # dependency cell in Excel. Leave the formula in place.
+    return isinstance(value, str) and value.startswith("=")
+
+
+def _template_row_plan(ws, template_path: str) -> Tuple[_TemplateRowPlan, ...]:
+    """
+    Row plan of the template's parameter rows — label, override key and which lift
+    columns hold formulas — built once per template file (re-built when its
+    modification time or size changes).
+    """
+    st = os.stat(template_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (os.path.abspath(template_path), str(ws.title))
+    hit = _ROW_PLAN_CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    plan = tuple(
+        _TemplateRowPlan(
+            row=r,
+            label=label,
+            override_key=_normalize_override_label(label),
+            param_plan=_compile_param_plan(label),
+            formula_lifts=frozenset(
+                n
+                for n in range(1, TEMPLATE_MAX_LIFTS + 1)
+                if _is_template_formula(ws.cell(r, _lift_column_index(n)).value)
+            ),
+        )
+        for r, label in _template_label_rows(ws, template_path)
+    )
+    _ROW_PLAN_CACHE[key] = (stamp, plan)
+    return plan
+
+
+def _template_value_matrix(
+    row_plan: Sequence[_TemplateRowPlan],
+    user_inputs: Mapping[str, Any],
+    num_lifts: int,
+    door_manufacturer: Optional[str] = None,
+) -> List[List[Any]]:
+    """
+    ``rows × lifts`` matrix of coerced cell values for ``row_plan``; ``None`` marks a
+    cell to leave untouched (empty resolver result, or a template formula). Lift ``N``
+    lands in column ``(N - 1) % TEMPLATE_MAX_LIFTS + 1`` of its sheet.
+    """
+    columns: List[List[Any]] = []
+    for n in range(1, num_lifts + 1):
+        ctx = _build_ctx(user_inputs, n - 1, door_manufacturer=door_manufacturer)
+        slot = (n - 1) % TEMPLATE_MAX_LIFTS + 1  # column within the lift's sheet
+        col: List[Any] = []
+        for rp in row_plan:
+            value = _resolve_param_plan(rp.param_plan, ctx)
+            if value in (None, "") or slot in rp.formula_lifts:
+                col.append(None)
+            else:
+                col.append(_coerce_cell_value(value))
+        columns.append(col)
+    return [list(row) for row in zip(*columns)] if columns else [[] for _ in row_plan]
+
+
 def _build_ctx(
     user_inputs: Mapping[str, Any],
     lift_index: int,
     door_manufacturer: Optional[str] = None,
 ) -> _ExportCtx:
-    """Assemble the per-lift resolver context used by :func:`_value_for_param`."""
-    return _ExportCtx(
-        user_inputs=user_inputs,
-        lift_index=lift_index,
-        lift=_lift(user_inputs, lift_index),
-        forces=_forces(user_inputs, lift_index),
-        drive=_drive(user_inputs, lift_index),
-        compliance=_compliance(user_inputs, lift_index),
-        emergency=_emergency(user_inputs, lift_index),
-        cost=_cost(user_inputs, lift_index),
-        derived=compute_derived(user_inputs, lift_index, door_manufacturer=door_manufacturer),
-    )
+    """
+    Assemble the per-lift resolver context used by :func:`_value_for_param` (same
+    context as the LD export, including its normalized UI key index).
+    """
+    return _build_export_ctx(user_inputs, lift_index, door_manufacturer=door_manufacturer)
+
+
+def _template_page_title(base: str, page: int) -> str:
+    """Sheet title for 0-based ``page`` (``base``, ``base (2)``, … within 31 chars)."""
+    if page == 0:
+        return base
+    suffix = f" ({page + 1})"
+    return base[: 31 - len(suffix)] + suffix
+
+
+def _number_template_page(ws, page: int) -> None:
+    """Continue the numeric lift numbers in the header row of a copied page."""
+    for slot in range(1, TEMPLATE_MAX_LIFTS + 1):
+        cell = ws.cell(TEMPLATE_LIFT_HEADER_ROW, _lift_column_index(slot))
+        if isinstance(cell.value, (int, float)) and not isinstance(cell.value, bool):
+            cell.value = page * TEMPLATE_MAX_LIFTS + slot
 
 
 def write_schedule_workbook_from_template(
@@ -652,6 +747,7 @@ def write_schedule_workbook_from_template(
     revisions: Optional[Sequence[Mapping[str, Any]]] = None,
     overrides: Optional[Mapping[int, Sequence[str]]] = None,
     door_manufacturer: Optional[str] = None,
+    engine: str = "patch",
 ) -> int:
     """
     Fill the VT Schedules template with values resolved from ``user_inputs`` and
@@ -659,13 +755,26 @@ def write_schedule_workbook_from_template(
 
     Behaviour:
 
-    - Loads ``template_path`` (defaults to :func:`default_schedule_template_path`)
-      so the template's styling, merged cells, German translations and units are
-      preserved.
-    - For each 1-based lift ``N`` (up to :data:`TEMPLATE_MAX_LIFTS`), walks
-      column A from row :data:`TEMPLATE_PARAM_FIRST_ROW` to the sheet's last row
-      and, for every non-empty label, writes ``_value_for_param(label, ctx)``
-      into the cell at column ``4N + 4``.
+    - Stamps values into ``template_path`` (defaults to
+      :func:`default_schedule_template_path`) so the template's styling, merged
+      cells, German translations and units are preserved. With ``engine="patch"``
+      (default) only the sheet's edited rows are rewritten in the xlsx package and
+      the parsed template is reused until the file changes (see
+      :func:`lift_designer_xlsx_patch.load_template_sheet`); ``engine="openpyxl"``
+      loads and re-saves the whole workbook.
+    - For each 1-based lift ``N`` and every non-empty column-A label from row
+      :data:`TEMPLATE_PARAM_FIRST_ROW` down, writes ``_value_for_param(label, ctx)``
+      into the lift's column (``4N + 4`` on the first sheet) unless that cell holds a
+      template formula. The label rows and formula cells are planned once per
+      template file; all values are resolved into a rows × lifts matrix before
+      anything is written.
+    - The template sheet holds :data:`TEMPLATE_MAX_LIFTS` lifts. Larger projects
+      continue on copies of it (``"VT General Schedules (2)"``, …) that keep the
+      layout, merged cells and formulas — which only reference their own lift
+      column, so they stay correct on every page — and number their lifts on from
+      the previous page. The copies also carry the revision title block. With
+      ``engine="openpyxl"`` copies do not include the template's drawing or data
+      validations (``copy_worksheet`` limitation).
     - Empty resolver results leave the template cell untouched (so any pre-filled
       defaults in the template survive).
     - Values are coerced via :func:`_coerce_cell_value` so numeric strings render
@@ -674,32 +783,46 @@ def write_schedule_workbook_from_template(
       cleared and the entries are written top-down from
       :data:`TEMPLATE_REVISION_FIRST_ROW` (one revision per row). Pass ``None``
       or ``[]`` to leave the template's built-in title block untouched.
-
-    Projects with more than :data:`TEMPLATE_MAX_LIFTS` lifts still export — only
-    the first eight are written and the return value reflects that. The caller is
-    responsible for surfacing that truncation to the user.
     """
-    try:
-        from openpyxl import load_workbook
-        from openpyxl.styles import PatternFill
-    except ImportError as e:
-        raise ImportError("pip install openpyxl") from e
-
     src = template_path or default_schedule_template_path()
-    wb = load_workbook(src)
-    if TEMPLATE_SHEET_NAME in wb.sheetnames:
-        ws = wb[TEMPLATE_SHEET_NAME]
+    if engine == "patch":
+        ws = load_template_sheet(src, TEMPLATE_SHEET_NAME)
+        save = ws.save
+        copy_page = ws.copy_sheet
+        override_fill: Any = OVERRIDE_HIGHLIGHT_HEX
+    elif engine == "openpyxl":
+        try:
+            from openpyxl import load_workbook
+            from openpyxl.styles import PatternFill
+        except ImportError as e:
+            raise ImportError("pip install openpyxl") from e
+
+        wb = load_workbook(src)
+        if TEMPLATE_SHEET_NAME in wb.sheetnames:
+            ws = wb[TEMPLATE_SHEET_NAME]
+        else:
+            ws = wb.active
+        save = wb.save
+
+        def copy_page(title: str):
+            page = wb.copy_worksheet(ws)
+            page.title = title
+            page.freeze_panes = ws.freeze_panes
+            if ws.print_area:
+                page.print_area = ws.print_area.split("!")[-1]
+            return page
+
+        override_fill = PatternFill(
+            start_color=OVERRIDE_HIGHLIGHT_HEX,
+            end_color=OVERRIDE_HIGHLIGHT_HEX,
+            fill_type="solid",
+        )
     else:
-        ws = wb.active
+        raise ValueError(f"engine must be 'patch' or 'openpyxl', not {engine!r}")
 
     if revisions:
         _write_revision_block(ws, revisions)
 
-    override_fill = PatternFill(
-        start_color=OVERRIDE_HIGHLIGHT_HEX,
-        end_color=OVERRIDE_HIGHLIGHT_HEX,
-        fill_type="solid",
-    )
     normalized_overrides: Dict[int, Set[str]] = {}
     if overrides:
         for lift_idx, labels in overrides.items():
@@ -714,37 +837,88 @@ def write_schedule_workbook_from_template(
             if norm_labels:
                 normalized_overrides[key] = norm_labels
 
-    lifts_to_write = max(0, min(int(num_lifts), TEMPLATE_MAX_LIFTS))
-    last_row = ws.max_row
-
-    for n in range(1, lifts_to_write + 1):
-        lift_index = n - 1
-        ctx = _build_ctx(user_inputs, lift_index, door_manufacturer=door_manufacturer)
-        target_col = _lift_column_index(n)
-        lift_overrides = normalized_overrides.get(lift_index, set())
-
-        for r in range(TEMPLATE_PARAM_FIRST_ROW, last_row + 1):
-            label_cell = ws.cell(r, 1).value
-            if label_cell is None:
-                continue
-            label = str(label_cell).strip()
-            if not label:
-                continue
-            value = _value_for_param(label, ctx)
-            if value in (None, ""):
-                continue
-            cell = ws.cell(r, target_col)
-            # Preserve template-authored Excel formulas (V3.0 introduced cascading
-            # formulas like =H82+1.5 / =ROUND(...) / =H53). The template's formula
-            # is authoritative for those cells — overwriting them with a static
-            # value would break the user's interactive recalc when they edit a
-            # dependency cell in Excel. Leave the formula in place.
-            existing = cell.value
-            if isinstance(existing, str) and existing.startswith("="):
+    lifts_to_write = max(0, int(num_lifts))
+    row_plan = _template_row_plan(ws, src)
+    matrix = _template_value_matrix(row_plan, user_inputs, lifts_to_write, door_manufacturer)
+
+    # Copies are taken after the revision block is written so every page carries it.
+    pages = [ws]
+    for page in range(1, -(-lifts_to_write // TEMPLATE_MAX_LIFTS)):
+        pages.append(copy_page(_template_page_title(str(ws.title), page)))
+        _number_template_page(pages[-1], page)
+    target_sheets = [pages[i // TEMPLATE_MAX_LIFTS] for i in range(lifts_to_write)]
+    target_cols = [_lift_column_index(i % TEMPLATE_MAX_LIFTS + 1) for i in range(lifts_to_write)]
+    lift_overrides = [normalized_overrides.get(i, set()) for i in range(lifts_to_write)]
+
+    for rp, values in zip(row_plan, matrix):
+        for i, value in enumerate(values):
+            if value is None:
                 continue
-            cell.value = _coerce_cell_value(value)
-            if lift_overrides and _normalize_override_label(label) in lift_overrides:
+            cell = target_sheets[i].cell(rp.row, target_cols[i])
+            cell.value = value
+            if rp.override_key in lift_overrides[i]:
                 cell.fill = override_fill
 
-    wb.save(output_path)
+    save(output_path)
     return lifts_to_write
+
+
+def benchmark_template_export(
+    user_inputs: Mapping[str, Any],
+    num_lifts: int,
+    repeat: int = 3,
+    template_path: Optional[str] = None,
+    log=print,
+) -> Dict[str, float]:
+    """
+    Best-of-``repeat`` wall time (seconds) of :func:`write_schedule_workbook_from_template`
+    per engine (``"openpyxl"`` and ``"patch"``), writing to a temporary folder.
+    """
+    import tempfile
+    import time
+
+    out: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for engine in ("openpyxl", "patch"):
+            best = float("inf")
+            for i in range(max(1, int(repeat))):
+                path = os.path.join(tmp, f"{engine}_{i}.xlsx")
+                t0 = time.perf_counter()
+                write_schedule_workbook_from_template(
+                    path, user_inputs, num_lifts, template_path=template_path, engine=engine
+                )
+                best = min(best, time.perf_counter() - t0)
+            out[engine] = best
+            log(f"{engine:>8}: {best * 1000:7.1f} ms")
+    log(f" speedup: {out['openpyxl'] / out['patch']:.1f}x")
+    return out
+
+
+if __name__ == "__main__":
+    import argparse
+
+    p = argparse.ArgumentParser(description="Benchmark the VT Schedules template export engines.")
+    p.add_argument(
+        "project_json",
+        nargs="?",
+        default=None,
+        help="Path to a LiftDesign project .json file. If omitted, a minimal demo dict is used.",
+    )
+    p.add_argument("--lifts", type=int, default=TEMPLATE_MAX_LIFTS, help="Lifts to write (demo dict size).")
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    if args.project_json:
+        from gui.project_json import load_project_json
+
+        data = load_project_json(args.project_json)
+    else:
+        n = args.lifts
+        data = {
+            "FileName": "demo",
+            "BuildingSystems": [{} for _ in range(n)],
+            "GeneralSpecification": [{"Load capacity": "1000", "Speed": "1.6"} for _ in range(n)],
+            "LayoutInformation": [{"Cabin type/shape": "Deep"} for _ in range(n)],
+            "Floors": [{f"Lift {i + 1}": []} for i in range(n)],
+        }
+    benchmark_template_export(data, args.lifts, repeat=args.repeat)
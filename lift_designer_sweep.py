@@ -0,0 +1,286 @@
+"""
+Design-space sweep over the VT standard configurations (non-UI).
+
+Answers questions like *"what shaft sizes and pit / head depths do all 630–3500 kg
+configurations need at 1.0–2.5 m/s, with and without through-access?"* without editing
+a project: :class:`SweepSpec` lists the values per dimension, every combination is
+turned into a one-lift project the way the Layout page would fill it (clear cabin height
+and door width from :func:`gui.lift_types.load_profile_constants`), and
+:func:`lift_designer_vt_derived.compute_derived` supplies the result columns.
+
+Points are evaluated in chunks across a process pool and yielded in order, so
+:func:`write_sweep_csv` / :func:`write_sweep_xlsx` stream the table without holding it
+in memory::
+
+    python lift_designer_sweep.py sweep.csv --speeds 1.0 1.6 2.0 2.5 --access "Front" "Front + Rear"
+"""
+from __future__ import annotations
+
+import csv
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from gui.lift_types import LOAD_CAPACITY_KG, load_profile_constants
+from lift_designer_vt_derived import DOOR_MANUFACTURER_OPTIONS, compute_derived
+
+
+__all__ = [
+    "SweepSpec",
+    "SWEEP_POINT_COLUMNS",
+    "SWEEP_DEFAULT_COLUMNS",
+    "iter_sweep_points",
+    "evaluate_sweep_point",
+    "run_sweep",
+    "write_sweep_csv",
+    "write_sweep_xlsx",
+]
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    """Values per sweep dimension; the sweep covers their full cartesian product."""
+
+    capacities: Tuple[int, ...] = LOAD_CAPACITY_KG
+    shapes: Tuple[str, ...] = ("Deep", "Wide")
+    speeds: Tuple[float, ...] = (1.0, 1.6, 2.0, 2.5)
+    access_types: Tuple[str, ...] = ("Front", "Front + Rear")
+    cladding_mm: Tuple[float, ...] = (0.0, 10.0)
+    door_manufacturers: Tuple[str, ...] = DOOR_MANUFACTURER_OPTIONS
+    cwt_locations: Tuple[str, ...] = ("CWT-Left",)
+    accessible_rooms: Tuple[str, ...] = ("no",)
+
+    def size(self) -> int:
+        n = 1
+        for dim in self.dimensions():
+            n *= len(dim)
+        return n
+
+    def dimensions(self) -> Tuple[Tuple[Any, ...], ...]:
+        return (
+            self.capacities,
+            self.shapes,
+            self.speeds,
+            self.access_types,
+            self.cladding_mm,
+            self.door_manufacturers,
+            self.cwt_locations,
+            self.accessible_rooms,
+        )
+
+
+# Header for the point columns, in :meth:`SweepSpec.dimensions` order.
+SWEEP_POINT_COLUMNS: Tuple[str, ...] = (
+    "Load capacity (kg)",
+    "Cabin type/shape",
+    "Speed (m/s)",
+    "Access type",
+    "Cladding thickness each wall (mm)",
+    "Door manufacturer",
+    "Counterweight location",
+    "Accessible rooms/cwt safety",
+)
+
+# ``compute_derived`` keys written by default (normalized VT labels).
+SWEEP_DEFAULT_COLUMNS: Tuple[str, ...] = (
+    "cabin width (clear)",
+    "cabin depth (clear)",
+    "structural cabin height",
+    "door height",
+    "door type",
+    "door structural opening width",
+    "shaft width suggested",
+    "shaft depth suggested",
+    "shaft head suggested",
+    "shaft pit suggested",
+    "walldistance ctw side",
+    "wall distance non-cwt side",
+    "front entrance",
+    "rear entrance",
+    "car rail",
+    "ctw rail name",
+    "force f3, each buffer",
+    "force f5, per counterweight buffer",
+    "force f8, static cabin",
+)
+
+SweepPoint = Tuple[Any, ...]
+
+# Layout-page defaults for the cells the sweep does not vary. Clear cabin height and
+# door width only read the load profile and cabin width, so they come straight from the
+# per-(capacity, shape) load-profile table rather than being evaluated per point.
+def _layout_fill(capacity: str, shape: str) -> Tuple[Any, Any]:
+    row = load_profile_constants(capacity, shape)
+    return (
+        row.clear_cabin_height_mm if row.clear_cabin_height_mm is not None else "",
+        row.door_width_mm if row.door_width_mm is not None else "",
+    )
+
+
+def _num_text(v: Any) -> str:
+    return str(int(v)) if isinstance(v, float) and v.is_integer() else str(v)
+
+
+def iter_sweep_points(spec: SweepSpec) -> Iterator[SweepPoint]:
+    return itertools.product(*spec.dimensions())
+
+
+def _user_inputs_for_point(point: SweepPoint) -> Dict[str, Any]:
+    capacity, shape, speed, access, cladding, manufacturer, cwt, accessible = point
+    general = {
+        "Load capacity": _num_text(capacity),
+        "Speed": _num_text(speed),
+        "Access type": access,
+        "Counterweight location": cwt,
+        "Accessible rooms/cwt safety": accessible,
+    }
+    clear_height, door_width = _layout_fill(general["Load capacity"], shape)
+    layout = {
+        "Cabin type/shape": shape,
+        "Cladding thickness each wall": _num_text(cladding),
+        "Clear cabin height": clear_height,
+        "Door width": door_width,
+    }
+    return {
+        "GeneralSpecification": [general],
+        "LayoutInformation": [layout],
+        "DoorManufacturer": manufacturer,
+    }
+
+
+def evaluate_sweep_point(point: SweepPoint, columns: Sequence[str] = SWEEP_DEFAULT_COLUMNS) -> List[Any]:
+    """One output row: the point's values followed by ``columns`` from ``compute_derived``."""
+    derived = compute_derived(_user_inputs_for_point(point), 0, use_cache=False)
+    return list(point) + [derived.get(c, "") for c in columns]
+
+
+def _evaluate_chunk(args: Tuple[List[SweepPoint], Tuple[str, ...]]) -> List[List[Any]]:
+    points, columns = args
+    return [evaluate_sweep_point(p, columns) for p in points]
+
+
+def _chunks(points: Iterable[SweepPoint], size: int, columns: Tuple[str, ...]) -> Iterator[Tuple[List[SweepPoint], Tuple[str, ...]]]:
+    it = iter(points)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk, columns
+
+
+def run_sweep(
+    spec: SweepSpec,
+    columns: Sequence[str] = SWEEP_DEFAULT_COLUMNS,
+    workers: Optional[int] = None,
+    chunk_size: int = 2000,
+) -> Iterator[List[Any]]:
+    """
+    Yield one row per point of ``spec`` (in :func:`iter_sweep_points` order).
+
+    ``workers`` is the process count (default: CPU count); ``1`` evaluates in-process.
+    Points travel to the workers in chunks of ``chunk_size`` so per-task overhead stays
+    small. At most ``2 * workers`` chunks are in flight at a time, so memory stays
+    bounded however large the sweep is.
+    """
+    cols = tuple(columns)
+    n_workers = workers or os.cpu_count() or 1
+    chunks = _chunks(iter_sweep_points(spec), max(1, int(chunk_size)), cols)
+    if n_workers <= 1:
+        for chunk in chunks:
+            yield from _evaluate_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        pending: Deque[Future] = deque(
+            pool.submit(_evaluate_chunk, chunk) for chunk in itertools.islice(chunks, 2 * n_workers)
+        )
+        while pending:
+            rows = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(pool.submit(_evaluate_chunk, chunk))
+            yield from rows
+
+
+def _header(columns: Sequence[str]) -> List[str]:
+    return list(SWEEP_POINT_COLUMNS) + list(columns)
+
+
+def write_sweep_csv(
+    path: str,
+    spec: SweepSpec,
+    columns: Sequence[str] = SWEEP_DEFAULT_COLUMNS,
+    workers: Optional[int] = None,
+    chunk_size: int = 2000,
+) -> int:
+    """Stream the sweep to a CSV file; returns the number of data rows written."""
+    n = 0
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(_header(columns))
+        for row in run_sweep(spec, columns, workers=workers, chunk_size=chunk_size):
+            w.writerow(row)
+            n += 1
+    return n
+
+
+def write_sweep_xlsx(
+    path: str,
+    spec: SweepSpec,
+    columns: Sequence[str] = SWEEP_DEFAULT_COLUMNS,
+    workers: Optional[int] = None,
+    chunk_size: int = 2000,
+) -> int:
+    """Stream the sweep to a write-only ``.xlsx`` workbook; returns the number of data rows."""
+    try:
+        from openpyxl import Workbook
+    except ImportError as e:
+        raise ImportError("pip install openpyxl") from e
+    from lift_designer_ld_export import _coerce_cell_value
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sweep")
+    ws.append(_header(columns))
+    n = 0
+    for row in run_sweep(spec, columns, workers=workers, chunk_size=chunk_size):
+        ws.append([_coerce_cell_value(v) if isinstance(v, str) else v for v in row])
+        n += 1
+    wb.save(path)
+    return n
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    defaults = SweepSpec()
+    ap = argparse.ArgumentParser(description="Sweep VT standard configurations and write a CSV / XLSX table.")
+    ap.add_argument("output", help="output path (.csv or .xlsx)")
+    ap.add_argument("--capacities", type=int, nargs="+", default=list(defaults.capacities))
+    ap.add_argument("--shapes", nargs="+", default=list(defaults.shapes))
+    ap.add_argument("--speeds", type=float, nargs="+", default=list(defaults.speeds))
+    ap.add_argument("--access", nargs="+", default=list(defaults.access_types))
+    ap.add_argument("--cladding", type=float, nargs="+", default=list(defaults.cladding_mm))
+    ap.add_argument("--door-manufacturers", nargs="+", default=list(defaults.door_manufacturers))
+    ap.add_argument("--cwt", nargs="+", default=list(defaults.cwt_locations))
+    ap.add_argument("--accessible", nargs="+", default=list(defaults.accessible_rooms))
+    ap.add_argument("--columns", nargs="+", default=list(SWEEP_DEFAULT_COLUMNS))
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--chunk-size", type=int, default=2000)
+    args = ap.parse_args()
+
+    spec = SweepSpec(
+        capacities=tuple(args.capacities),
+        shapes=tuple(args.shapes),
+        speeds=tuple(args.speeds),
+        access_types=tuple(args.access),
+        cladding_mm=tuple(args.cladding),
+        door_manufacturers=tuple(args.door_manufacturers),
+        cwt_locations=tuple(args.cwt),
+        accessible_rooms=tuple(args.accessible),
+    )
+    writer = write_sweep_xlsx if args.output.lower().endswith(".xlsx") else write_sweep_csv
+    t0 = time.perf_counter()
+    rows = writer(args.output, spec, args.columns, workers=args.workers, chunk_size=args.chunk_size)
+    print(f"{rows:,} configurations -> {args.output} in {time.perf_counter() - t0:.1f} s")
@@ -16,140 +16,72 @@ ready to go into the LD workbook. ``build_ld_rows_from_user_inputs`` uses this a
 
 Implementations reuse :mod:`gui.lift_types` (load-profile classes) where possible and
 port the remaining VT formulas inline (door opening width, rear-door mirror, COP, wall
-distances, car wall thickness, CWT layout).
+distances, car wall thickness, CWT layout). Lift inputs arrive as a
+:class:`gui.lift_record.LiftRecord`, so each UI cell is parsed once per lift. Door RIDs,
+door depths and door / wall clearance come from the door-manufacturer catalogue
+(:mod:`lift_designer_door_catalogue`).
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
+from gui.lift_record import LiftRecord, lift_record
 from gui.lift_types import (
     electrical_hvac_derived_for_lift,
-    load_profile_for_capacity,
+    load_profile_generation,
     mechanical_loading_derived_for_lift,
 )
-from gui.project_lift_schema import merged_lift_at
+from gui.project_lift_schema import merged_lift_view
+from lift_designer_door_catalogue import DOOR_KINDS, DOOR_TYPES, DoorCatalogue, load_door_catalogue
+from lift_designer_vt_graph import LAYOUT_GRAPH, VTGraphEvaluator
 
 
 __all__ = [
     "compute_derived",
+    "DerivedCacheInfo",
+    "DERIVED_CACHE_MAXSIZE",
+    "derived_cache_info",
+    "clear_derived_cache",
     "DOOR_MANUFACTURER_COMMON",
     "DOOR_MANUFACTURER_MEILLER",
     "DOOR_MANUFACTURER_OPTIONS",
     "DEFAULT_DOOR_MANUFACTURER",
+    "DOOR_CATALOGUE_PROBLEMS",
     "normalize_door_manufacturer",
+    "benchmark_vt_lookups",
 ]
 
 
-# --- Door manufacturer lookup tables (port of VT 'selection' sheet) ----------
+# --- Door manufacturer catalogue (port of VT 'selection' sheet) --------------
 #
-# Mirrors ``selection!C94:G104`` / ``selection!K94:O110`` (entrance doors RIDs)
-# and the corresponding cabin-door blocks. Values come straight from the VT
-# workbook; ``None`` means *no LD product for this combination*, matching the
-# Excel "no doors" / blank cells. The order across each row is the canonical
-# door-type order ``("2C", "4C", "6C", "2L", "2R")`` so a single column index
-# resolves type → RID for every width row.
-
+# Entrance / cabin door RIDs by door type and width, door depths and the door / wall
+# clearance per supplier live in ``door_catalogue/*.json`` (one file per manufacturer,
+# see :mod:`lift_designer_door_catalogue`). A missing product means *no LD product for
+# this combination*, matching the Excel "no doors" / blank cells. Files that fail
+# validation are skipped (logged, and listed in DOOR_CATALOGUE_PROBLEMS for the UI).
+
+_DOOR_CATALOGUE: DoorCatalogue = load_door_catalogue()
+
+# Names of the two manufacturers shipped in ``door_catalogue/``, kept for callers that
+# refer to them directly. They are not derived from the catalogue: if a shipped file is
+# removed or skipped as invalid, its name is absent from DOOR_MANUFACTURER_OPTIONS and
+# normalize_door_manufacturer maps it to DEFAULT_DOOR_MANUFACTURER.
 DOOR_MANUFACTURER_COMMON: str = "Common component"
 DOOR_MANUFACTURER_MEILLER: str = "Meiller"
-DOOR_MANUFACTURER_OPTIONS: Tuple[str, str] = (
-    DOOR_MANUFACTURER_COMMON,
-    DOOR_MANUFACTURER_MEILLER,
-)
-DEFAULT_DOOR_MANUFACTURER: str = DOOR_MANUFACTURER_COMMON
+DOOR_MANUFACTURER_OPTIONS: Tuple[str, ...] = _DOOR_CATALOGUE.options
+DEFAULT_DOOR_MANUFACTURER: str = _DOOR_CATALOGUE.default_manufacturer
+DOOR_CATALOGUE_PROBLEMS: Tuple[str, ...] = tuple(_DOOR_CATALOGUE.problems)
 
-_DOOR_TYPES: Tuple[str, str, str, str, str] = ("2C", "4C", "6C", "2L", "2R")
 _DOOR_NOT_AVAILABLE: str = "Doors dont exist in LD"
 
-# selection!C95:G104 (Common component entrance doors RID by door width)
-_COMMON_ENTRANCE_RID: Dict[int, Tuple[Optional[int], ...]] = {
-    700:  (1,    8,    15,   43,   55),
-    800:  (2,    9,    16,   44,   56),
-    900:  (3,    10,   17,   45,   57),
-    1000: (4,    11,   18,   46,   58),
-    1100: (5,    12,   19,   47,   59),
-    1200: (6,    13,   20,   48,   60),
-    1500: (None, 14,   None, None, None),
-    2000: (7,    None, 21,   None, None),
-}
-
-# selection!K95:O110 (Meiller entrance doors RID by door width)
-_MEILLER_ENTRANCE_RID: Dict[int, Tuple[Optional[int], ...]] = {
-    700:  (1400072, None,    None,    1400681, 1400670),
-    800:  (1400073, None,    None,    1400682, 1400671),
-    900:  (1400074, None,    None,    1400683, 1400672),
-    1000: (1400075, None,    None,    1400684, 1400673),
-    1100: (1400076, None,    None,    1400685, 1400674),
-    1200: (1400077, 1400092, None,    1400686, 1400675),
-    1300: (1400078, 1400093, None,    1400687, 1400676),
-    1400: (1400079, 1400094, 1400128, 1400688, 1400677),
-    1500: (1400080, 1400095, 1400129, 1400689, 1400678),
-    1600: (1400081, 1400096, 1400130, 1400690, 1400679),
-    1700: (None,    1400097, 1400131, 1400691, 1400680),
-    1800: (None,    1400098, 1400132, None,    None),
-    1900: (None,    1400099, 1400133, None,    None),
-    2000: (None,    1400100, 1400134, None,    None),
-    2100: (None,    1400101, 1400135, None,    None),
-    2200: (None,    1400102, 1400136, None,    None),
-}
-
-# selection!C107:G107 / K112:O112 (entrance door depth in mm)
-_COMMON_ENTRANCE_DEPTH: Dict[str, float] = {"2C": 125, "4C": 150, "6C": 195, "2L": 150, "2R": 150}
-_MEILLER_ENTRANCE_DEPTH: Dict[str, float] = {"2C": 120, "4C": 120, "6C": 180, "2L": 98.5, "2R": 98.5}
-
-# selection!C110:G119 (Common component cabin doors RID by door width)
-_COMMON_CABIN_RID: Dict[int, Tuple[Optional[int], ...]] = {
-    700:  (22,   29,   36,   67,   79),
-    800:  (23,   30,   37,   68,   80),
-    900:  (24,   31,   38,   69,   81),
-    1000: (25,   32,   39,   70,   82),
-    1100: (26,   33,   40,   71,   83),
-    1200: (27,   34,   41,   72,   84),
-    1300: (None, 244,  None, None, None),
-    1400: (None, 245,  None, None, None),
-    2000: (28,   35,   42,   None, None),
-}
-
-# selection!K116:O131 (Meiller cabin doors RID by door width)
-_MEILLER_CABIN_RID: Dict[int, Tuple[Optional[int], ...]] = {
-    700:  (1400082, None,    None,    1400346, 1400280),
-    800:  (1400083, None,    None,    1400347, 1400337),
-    900:  (1400084, None,    None,    1400348, 1400338),
-    1000: (1400085, None,    None,    1400349, 1400339),
-    1100: (1400086, None,    None,    1400350, 1400340),
-    1200: (1400087, 1400105, None,    1400351, 1400341),
-    1300: (1400088, 1400106, None,    1400352, 1400342),
-    1400: (1400089, 1400107, 1400147, 1400353, 1400343),
-    1500: (1400090, 1400108, 1400148, 1400354, 1400344),
-    1600: (1400091, 1400109, 1400149, 1400355, 1400345),
-    1700: (None,    1400110, 1400150, 1400693, 1400346),
-    1800: (None,    1400111, 1400151, None,    None),
-    1900: (None,    1400112, 1400152, None,    None),
-    2000: (None,    1400113, 1400153, None,    None),
-    2100: (None,    1400114, 1400154, None,    None),
-    2200: (None,    1400115, 1400155, None,    None),
-}
-
-# selection!C121:G121 / K134:O134 (cabin door depth in mm)
-_COMMON_CABIN_DEPTH: Dict[str, float] = {"2C": 90, "4C": 90, "6C": 135, "2L": 90, "2R": 90}
-_MEILLER_CABIN_DEPTH: Dict[str, float] = {"2C": 91, "4C": 91, "6C": 135, "2L": 93, "2R": 93}
-
-# Door / wall clearance: VT R313 / R323 — Common = 25 mm, Meiller = 0 mm.
-_DOOR_WALL_CLEARANCE: Dict[str, int] = {
-    DOOR_MANUFACTURER_COMMON: 25,
-    DOOR_MANUFACTURER_MEILLER: 0,
-}
-
 
 def normalize_door_manufacturer(value: Any) -> str:
-    """Map free-form input to one of :data:`DOOR_MANUFACTURER_OPTIONS` (default Common)."""
-    s = _s(value).strip().lower()
-    if not s:
-        return DEFAULT_DOOR_MANUFACTURER
-    if "meiller" in s:
-        return DOOR_MANUFACTURER_MEILLER
-    if "common" in s or "standard" in s or "std" in s:
-        return DOOR_MANUFACTURER_COMMON
-    return DEFAULT_DOOR_MANUFACTURER
+    """Map free-form input to one of :data:`DOOR_MANUFACTURER_OPTIONS` (catalogue aliases, else the default)."""
+    return _DOOR_CATALOGUE.normalize(value)
 
 
 def _mirror_rear_door_type(dt: str) -> str:
@@ -164,17 +96,13 @@ def _mirror_rear_door_type(dt: str) -> str:
 
 
 def _door_rid(
-    table: Dict[int, Tuple[Optional[int], ...]],
+    manufacturer: str,
+    kind: str,
     door_type: str,
     door_width_mm: Optional[int],
 ) -> Optional[int]:
-    """Resolve (door_type, door_width) → RID using a manufacturer table; ``None`` if absent."""
-    if not door_type or door_type not in _DOOR_TYPES or door_width_mm is None:
-        return None
-    row = table.get(door_width_mm)
-    if not row:
-        return None
-    return row[_DOOR_TYPES.index(door_type)]
+    """Resolve (door_type, door_width) → RID for a manufacturer's ``kind`` doors; ``None`` if absent."""
+    return _DOOR_CATALOGUE.rid(manufacturer, kind, door_type, door_width_mm)
 
 
 # --- small helpers -----------------------------------------------------------
@@ -226,10 +154,6 @@ def _field(d: Mapping[str, Any], *keys: str) -> str:
     return ""
 
 
-def _yes(v: Any) -> bool:
-    return _s(v).lower() in ("yes", "y", "true", "1")
-
-
 # --- section resolvers -------------------------------------------------------
 
 def _drive(ui: Mapping[str, Any], i: int) -> Dict[str, Any]:
@@ -242,10 +166,20 @@ def _forces(ui: Mapping[str, Any], i: int) -> Dict[str, Any]:
     return dict(rows[i]) if 0 <= i < len(rows) and isinstance(rows[i], dict) else {}
 
 
+# --- layout cascade ----------------------------------------------------------
+# ``compute_derived`` reads clear cabin height, door width and cladding straight from the
+# UI (the Layout page has already applied its own formulas to those cells).
+DERIVED_LAYOUT_GRAPH = LAYOUT_GRAPH.with_inputs(
+    "clear cabin height", "door width", "cladding thickness each wall"
+)
+
+
 # --- VT R292 / R293 — shaft wall-distance lookup ----------------------------
 # Encoded as a shared table: each row matches (cabin_width, door_width, {door_types}).
 # ``access_restrict``: ``None`` = any accessibility; ``"yes"`` / ``"no"`` = restricted.
-# Cladding is added on top of the base offset (Excel: ``+ M36``).
+# Cladding is added on top of the base offset (Excel: ``+ M36``). The tables are
+# compiled at import into ``(cabin width, door width, door type, accessible) → base``
+# indexes; the first matching row wins, as in the Excel lookup.
 
 _WALL_CWT_SIDE: Tuple[Tuple[int, int, Tuple[str, ...], Optional[str], int], ...] = (
     (1100,  900, ("2L", "2R"), None,  450),
@@ -275,32 +209,106 @@ _WALL_NON_CWT_SIDE: Tuple[Tuple[int, int, Tuple[str, ...], Optional[str], int],
 )
 
 
-def _lookup_wall_distance(
+def _index_wall_distances(
     table: Tuple[Tuple[int, int, Tuple[str, ...], Optional[str], int], ...],
+) -> Dict[Tuple[int, int, str, bool], int]:
+    index: Dict[Tuple[int, int, str, bool], int] = {}
+    for row_cw, row_dw, row_dts, row_access, base in table:
+        for dt in row_dts:
+            for accessible_yes in (False, True):
+                if row_access is None or row_access == ("yes" if accessible_yes else "no"):
+                    index.setdefault((row_cw, row_dw, dt, accessible_yes), base)
+    return index
+
+
+_WALL_CWT_SIDE_INDEX: Dict[Tuple[int, int, str, bool], int] = _index_wall_distances(_WALL_CWT_SIDE)
+_WALL_NON_CWT_SIDE_INDEX: Dict[Tuple[int, int, str, bool], int] = _index_wall_distances(
+    _WALL_NON_CWT_SIDE
+)
+
+
+def _lookup_wall_distance(
+    index: Mapping[Tuple[int, int, str, bool], int],
     cw_mm: Optional[int],
     dw_mm: Optional[int],
     dt: str,
     accessible_yes: bool,
     cladding_mm: float,
 ) -> Optional[int]:
-    if cw_mm is None or dw_mm is None or not dt:
+    base = index.get((cw_mm, dw_mm, dt, bool(accessible_yes)))
+    if base is None:
         return None
-    access_key = "yes" if accessible_yes else "no"
-    for row_cw, row_dw, row_dts, row_access, base in table:
-        if row_cw != cw_mm or row_dw != dw_mm or dt not in row_dts:
-            continue
-        if row_access is not None and row_access != access_key:
-            continue
-        return int(round(base + float(cladding_mm)))
-    return None
+    return int(round(base + float(cladding_mm)))
 
 
 # --- main builder ------------------------------------------------------------
 
+def _floor_list(ui: Mapping[str, Any], i: int) -> List[Any]:
+    floors_root = ui.get("Floors") or []
+    if not floors_root:
+        return []
+    first = floors_root[0] if isinstance(floors_root, list) else {}
+    floor_list = first.get(f"Lift {i + 1}", []) if isinstance(first, dict) else []
+    return list(floor_list or [])
+
+
+# --- derived-value cache -----------------------------------------------------
+# ``compute_derived`` is called per lift by the LD export, again by the Schedules export
+# and by the GUI pages. Results are memoized process-wide, keyed by a fingerprint of
+# exactly the inputs the cascade reads: merged lift fields, drive row, forces row, the
+# resolved door manufacturer and the lift's floor list.
+
+DERIVED_CACHE_MAXSIZE: int = 256
+
+_DERIVED_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, str]]" = OrderedDict()
+_derived_hits = 0
+_derived_misses = 0
+# Guards the cache and its counters: the LD export's thread executor derives lifts
+# concurrently. Derivations themselves run outside the lock.
+_DERIVED_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class DerivedCacheInfo:
+    """Counters for the :func:`compute_derived` cache (see :func:`derived_cache_info`)."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+def derived_cache_info() -> DerivedCacheInfo:
+    with _DERIVED_CACHE_LOCK:
+        return DerivedCacheInfo(_derived_hits, _derived_misses, len(_DERIVED_CACHE), DERIVED_CACHE_MAXSIZE)
+
+
+def clear_derived_cache() -> None:
+    """Drop every cached derivation and reset the hit/miss counters."""
+    global _derived_hits, _derived_misses
+    with _DERIVED_CACHE_LOCK:
+        _DERIVED_CACHE.clear()
+        _derived_hits = 0
+        _derived_misses = 0
+
+
+def _freeze(v: Any) -> Any:
+    """Hashable, order-preserving snapshot of a UI value (dicts / lists nest)."""
+    if isinstance(v, Mapping):
+        return tuple((k, _freeze(x)) for k, x in v.items())
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    if v is None or isinstance(v, (str, int, float, bool)):
+        return v
+    return repr(v)
+
+
 def compute_derived(
     user_inputs: Mapping[str, Any],
     lift_index: int,
     door_manufacturer: Optional[str] = None,
+    use_cache: bool = True,
+    record: Optional[LiftRecord] = None,
 ) -> Dict[str, str]:
     """
     Compute VT-formula values for lift ``lift_index``; keys are normalized parameter labels.
@@ -312,118 +320,159 @@ def compute_derived(
     omitted, falls back to ``user_inputs["DoorManufacturer"]`` and finally to
     :data:`DEFAULT_DOOR_MANUFACTURER`. Any non-canonical string is mapped through
     :func:`normalize_door_manufacturer` so external callers can pass user-typed text.
+
+    Results are served from a bounded LRU cache (:data:`DERIVED_CACHE_MAXSIZE` entries)
+    keyed by the inputs above and the load-profile registry generation (so
+    :func:`~gui.lift_types.register_load_profile` invalidates it); the caller always
+    receives its own copy. Pass ``use_cache=False`` to force a fresh computation.
+
+    ``record`` is the lift's :class:`~gui.lift_record.LiftRecord` when the caller already
+    built one (the LD export does, per lift); otherwise it is read from ``user_inputs``,
+    and only on a cache miss.
     """
+    global _derived_hits, _derived_misses
     if not isinstance(user_inputs, dict):
         return {}
-    lift = merged_lift_at(user_inputs, lift_index)
-    drive = _drive(user_inputs, lift_index)
-    forces = _forces(user_inputs, lift_index)
-
-    # --- raw UI inputs
-    load_kg_raw = _field(lift, "Load capacity", "Load capacity (kg)")
-    persons_raw = _field(lift, "Permissible number of persons", "Permissible number of persons (Pers.)")
-    speed_raw = _field(lift, "Speed", "Speed (m/s)")
-    shape = _field(lift, "Cabin type/shape")
-    cwt_loc = _field(lift, "Counterweight location")
-    access_type = _field(lift, "Access type")
-    accessible = _field(lift, "Accessible rooms/cwt safety", "Accessible rooms / cwt safety")
-    cladding_raw = _field(lift, "Cladding thickness each wall", "Cladding thickness each wall (mm)")
-    clear_h_raw = _field(lift, "Clear cabin height", "Clear cabin height (mm)")
-    travel_raw = _field(lift, "Travel height", "Travel height (m)")
-    door_width_raw = _field(lift, "Door width", "Door width (mm)")
-
-    cabin_w_ui = _field(lift, "Cabin width", "Cabin width (mm)")
-    cabin_d_ui = _field(lift, "Cabin depth", "Cabin depth (mm)")
-    struct_h_ui = _field(lift, "Structural cabin height", "Structural cabin height (mm)")
-    door_h_ui = _field(lift, "Door height", "Door height (mm)")
-    door_type_ui = _field(lift, "Door type", "door type")
-
-    duty_cycle = _field(drive, "Duty cycle (motor)", "Duty cycle (motor) (%)")
-    num_car_buf = _field(forces, "Number of car buffers", "Number of car buffers (St.)", "number of car buffers (kg/m)")
-    num_cwt_buf = _field(forces, "Number of cwt buffers", "Number of cwt buffers (St.)")
-    cwt_safety = _field(forces, "Counterweight safety gear")
-
-    cladding_mm = _to_float(cladding_raw) or 0.0
-    accessible_yes = _yes(accessible)
-
-    profile = load_profile_for_capacity(load_kg_raw)
+    if record is not None:
+        lift, drive, forces = record.lift, record.drive, record.forces
+    else:
+        lift = merged_lift_view(user_inputs, lift_index)
+        drive = _drive(user_inputs, lift_index)
+        forces = _forces(user_inputs, lift_index)
+    if door_manufacturer is None:
+        door_manufacturer = user_inputs.get("DoorManufacturer")
+    manufacturer = normalize_door_manufacturer(door_manufacturer)
+    floor_list = _floor_list(user_inputs, lift_index)
+
+    if not use_cache:
+        return _derive(record or lift_record(lift, drive, forces), manufacturer, floor_list)
+
+    key = (
+        _freeze(lift), _freeze(drive), _freeze(forces), manufacturer, _freeze(floor_list),
+        load_profile_generation(),
+    )
+    with _DERIVED_CACHE_LOCK:
+        cached = _DERIVED_CACHE.get(key)
+        if cached is not None:
+            _DERIVED_CACHE.move_to_end(key)
+            _derived_hits += 1
+            return dict(cached)
+        _derived_misses += 1
+    out = _derive(record or lift_record(lift, drive, forces), manufacturer, floor_list)
+    with _DERIVED_CACHE_LOCK:
+        # Another thread may have stored (or evicted) the same key meanwhile.
+        _DERIVED_CACHE.pop(key, None)
+        _DERIVED_CACHE[key] = out
+        while len(_DERIVED_CACHE) > DERIVED_CACHE_MAXSIZE:
+            _DERIVED_CACHE.popitem(last=False)
+    return dict(out)
+
+
+def _derive(
+    rec: LiftRecord,
+    manufacturer: str,
+    floor_list: List[Any],
+) -> Dict[str, str]:
+    """The VT cascade proper; see :func:`compute_derived`."""
+    lift = rec.lift
+
+    # -------- R34..R62 layout cascade (cabin, heights, doors, shaft) via the shared graph.
+    # Clear cabin height, door width and cladding are plain UI inputs here; UI-entered
+    # cabin / height / door-type values override the formula result for downstream rows.
+    ev = VTGraphEvaluator(
+        DERIVED_LAYOUT_GRAPH,
+        overrides={
+            "cabin width (clear)": rec.cabin_width,
+            "cabin depth (clear)": rec.cabin_depth,
+            "structural cabin height": rec.structural_height,
+            "door height": rec.door_height,
+            "door type": rec.door_type,
+        },
+    )
+    ev.update(
+        {
+            "load capacity": rec.load_capacity,
+            "cabin type/shape": rec.cabin_shape,
+            "counterweight location": rec.cwt_location,
+            "access type": rec.access_type,
+            "accessible rooms yes": rec.accessible_rooms_yes,
+            "speed": rec.speed,
+            "clear cabin height": rec.clear_height,
+            "door width": rec.door_width,
+            "cladding thickness each wall": rec.cladding,
+        }
+    )
+    calc = ev.computed
+    cladding_mm = ev.value("cladding mm")
+    accessible_yes = ev.value("accessible rooms yes")
 
     out: Dict[str, str] = {}
 
     # -------- R34 cabin width (clear): IF(shape="Deep",...,IF(shape="Wide",...))
-    cabin_w_calc = profile.cabin_width_mm(shape)
+    cabin_w_calc = calc["cabin width (clear)"]
     if cabin_w_calc and not cabin_w_calc.startswith("non std") and not cabin_w_calc.startswith("Wrong"):
         out["cabin width (clear)"] = cabin_w_calc
         # Alias for VT rows that use the unqualified "Cabin width" label (e.g. R304).
         out["cabin width"] = cabin_w_calc
-    cabin_w_used = cabin_w_ui or cabin_w_calc or ""
+    cabin_w_used = ev.value("cabin width (clear)")
 
     # -------- R35 cabin depth (clear): derived from cabin width
-    cabin_d_calc = profile.cabin_depth_mm(cabin_w_used)
+    cabin_d_calc = calc["cabin depth (clear)"]
     if cabin_d_calc and not cabin_d_calc.startswith("non std") and not cabin_d_calc.startswith("non standard"):
         out["cabin depth (clear)"] = cabin_d_calc
         # Alias for VT rows R318/R333/R344 that use the unqualified "Cabin depth" label.
         out["cabin depth"] = cabin_d_calc
-    cabin_d_used = cabin_d_ui or cabin_d_calc or ""
+    cabin_d_used = ev.value("cabin depth (clear)")
 
     # -------- R38 structural cabin height = clear + 100
-    struct_h_calc = profile.structural_cabin_height_mm(clear_h_raw)
+    struct_h_calc = calc["structural cabin height"]
     if struct_h_calc:
         out["structural cabin height"] = struct_h_calc
-    struct_h_used = struct_h_ui or struct_h_calc or ""
 
     # -------- R43 door height = clear − 100
-    door_h_calc = profile.door_height_mm(clear_h_raw)
+    door_h_calc = calc["door height"]
     if door_h_calc:
         out["door height"] = door_h_calc
-    door_h_used = door_h_ui or door_h_calc or ""
+    door_h_used = ev.value("door height")
 
     # -------- R44 door structural opening height = door height + 140
-    doh_calc = profile.door_structural_opening_height_mm(door_h_used)
+    doh_calc = calc["door structural opening height"]
     if doh_calc:
         out["door structural opening height"] = doh_calc
 
     # -------- R42 door structural opening width = door width + 2*140
-    dw_mm = _to_int(door_width_raw)
+    dw_mm = rec.door_width_mm
     if dw_mm is not None:
         out["door structural opening width"] = str(dw_mm + 280)
 
     # -------- R45 door type (from cabin width + CWT side)
-    dt_calc = profile.door_type_code(cabin_w_used, cwt_loc)
+    dt_calc = calc["door type"]
     if dt_calc and not dt_calc.startswith("Non std") and not dt_calc.startswith("non std") and not dt_calc.startswith("wrong") and not dt_calc.startswith("Wrong"):
         out["door type"] = dt_calc
-    door_type_used = door_type_ui or dt_calc or ""
+    door_type_used = ev.value("door type")
 
     # -------- R54 shaft width suggested
-    sw = profile.shaft_width_suggested_mm(cabin_w_used, cladding_mm, accessible_yes)
+    sw = calc["shaft width suggested"]
     if sw and not sw.startswith("non"):
         out["shaft width suggested"] = sw
 
     # -------- R58 shaft depth suggested
-    sd = profile.shaft_depth_suggested_mm(cabin_d_used, cladding_mm, access_type)
+    sd = calc["shaft depth suggested"]
     if sd and not sd.startswith("non"):
         out["shaft depth suggested"] = sd
 
     # -------- R60 shaft head suggested
-    head = profile.shaft_head_suggested_mm(
-        struct_h_used,
-        speed_raw,
-        cabin_w_used,
-        door_width_raw,
-        door_type_used,
-        cladding_mm,
-        accessible_yes,
-    )
+    head = calc["shaft head suggested"]
     if head:
         out["shaft head suggested"] = head
 
     # -------- R62 shaft pit suggested
-    pit = profile.shaft_pit_suggested_mm(speed_raw)
+    pit = calc["shaft pit suggested"]
     if pit and not pit.startswith("non"):
         out["shaft pit suggested"] = pit
 
     # -------- R80..R87 Electrical & HVAC
-    elec = electrical_hvac_derived_for_lift(load_kg_raw, persons_raw, duty_cycle)
+    elec = electrical_hvac_derived_for_lift(rec.load_kg, rec.persons_count, rec.duty_cycle_pct)
     if elec:
         if "Drive/Motor Power" in elec:
             out["drive/motor power"] = elec["Drive/Motor Power"]
@@ -437,15 +486,15 @@ def compute_derived(
             out["heat dissipation motor"] = elec["Heat dissipation motor"]
 
     # -------- R92..R106 Mechanical forces
-    travel_m = _to_float(travel_raw) or 0.0
+    # Blank buffer counts default to 2; unparseable ones stay ``None`` (no forces).
     mech = mechanical_loading_derived_for_lift(
-        load_kg_raw,
-        travel_m,
+        rec.load_kg,
+        rec.travel_m,
         cabin_w_used,
         cabin_d_used,
-        _yes(cwt_safety),
-        num_car_buf or "2",
-        num_cwt_buf or "2",
+        rec.cwt_safety_gear_yes,
+        rec.car_buffer_count if rec.car_buffers else 2.0,
+        rec.cwt_buffer_count if rec.cwt_buffers else 2.0,
     )
     for mech_key, derived_key in (
         ("Force F1, F2 elevator rail segment", "force f1, f2 elevator rail segment"),
@@ -495,8 +544,8 @@ def compute_derived(
         out["secrond cop length"] = str(cd_mm - 400)
 
     # -------- R239 Third COP on/off: IF(shape="wide",40,44) — shape compare is case-insensitive in Excel
-    if shape:
-        is_wide = shape.strip().lower() == "wide"
+    if rec.shape:
+        is_wide = rec.shape == "wide"
         out["third cop on/off"] = "40" if is_wide else "44"
         # -------- R240 Third COP location: IF(shape="wide", 1, "doesnt apply")
         out["third cop loaction"] = "1" if is_wide else "doesnt apply"
@@ -508,15 +557,12 @@ def compute_derived(
     # -------- R277 Door manufacturer choice — drives R279/R281/R287/R289 RID lookups
     # and the R313/R323 door/wall clearance + R314/R322/R329/R340 (entrance depth) +
     # R316/R320/R331/R342 (cabin door depth) constants below.
-    if door_manufacturer is None:
-        door_manufacturer = user_inputs.get("DoorManufacturer")
-    manufacturer = normalize_door_manufacturer(door_manufacturer)
     out["door manufacturer choice"] = manufacturer
 
     # -------- R313 / R323 Door / wall clearance front + rear (Common = 25, Meiller = 0)
-    clearance = _DOOR_WALL_CLEARANCE.get(manufacturer)
+    clearance = _DOOR_CATALOGUE.wall_clearance_mm(manufacturer)
     if clearance is not None:
-        clearance_str = str(clearance)
+        clearance_str = _fmt_dim(clearance)
         # Front clearance label variants seen in VT (R313, R328 — same text).
         out["door / wall clearance front"] = clearance_str
         out["door/wall clearance front"] = clearance_str
@@ -531,21 +577,13 @@ def compute_derived(
     front_door_type = door_type_used or ""
     rear_door_type = _mirror_rear_door_type(front_door_type)
 
-    if manufacturer == DOOR_MANUFACTURER_COMMON:
-        entrance_table = _COMMON_ENTRANCE_RID
-        cabin_table = _COMMON_CABIN_RID
-        entrance_depth_lookup = _COMMON_ENTRANCE_DEPTH
-        cabin_depth_lookup = _COMMON_CABIN_DEPTH
-    else:
-        entrance_table = _MEILLER_ENTRANCE_RID
-        cabin_table = _MEILLER_CABIN_RID
-        entrance_depth_lookup = _MEILLER_ENTRANCE_DEPTH
-        cabin_depth_lookup = _MEILLER_CABIN_DEPTH
+    entrance_depth_lookup = _DOOR_CATALOGUE.entrance_depth_mm(manufacturer)
+    cabin_depth_lookup = _DOOR_CATALOGUE.cabin_depth_mm(manufacturer)
 
-    front_entrance_rid = _door_rid(entrance_table, front_door_type, dw_mm)
-    rear_entrance_rid = _door_rid(entrance_table, rear_door_type, dw_mm)
-    front_car_rid = _door_rid(cabin_table, front_door_type, dw_mm)
-    rear_car_rid = _door_rid(cabin_table, rear_door_type, dw_mm)
+    front_entrance_rid = _door_rid(manufacturer, "entrance", front_door_type, dw_mm)
+    rear_entrance_rid = _door_rid(manufacturer, "entrance", rear_door_type, dw_mm)
+    front_car_rid = _door_rid(manufacturer, "cabin", front_door_type, dw_mm)
+    rear_car_rid = _door_rid(manufacturer, "cabin", rear_door_type, dw_mm)
 
     if front_door_type:
         out["front entrance"] = (
@@ -623,10 +661,9 @@ def compute_derived(
     have_front_depths = front_entrance_depth is not None and front_cabin_depth is not None
     have_rear_depths = rear_entrance_depth is not None and rear_cabin_depth is not None
 
-    access_norm = access_type.strip().lower() if access_type else ""
-    open_through = access_norm in ("front + rear", "front+rear", "front + side + rear")
-    front_only = access_norm == "front"
-    rear_only = access_norm == "rear"
+    open_through = rec.access in ("front + rear", "front+rear", "front + side + rear")
+    front_only = rec.access == "front"
+    rear_only = rec.access == "rear"
 
     def _front_pocket_sum() -> Optional[float]:
         if not (have_front_depths and clearance is not None):
@@ -695,7 +732,7 @@ def compute_derived(
     # R349 (Car rail) returns a rail name based on load capacity buckets — the LD
     # rule for it has F='n' so it is not exported, but we still publish the value
     # for the Schedules workbook (parameter "Car rail").
-    load_kg_int = _to_int(load_kg_raw)
+    load_kg_int = rec.load_kg
     if load_kg_int is not None:
         if load_kg_int <= 1350:
             out["car rail"] = "T90(75)"
@@ -704,13 +741,12 @@ def compute_derived(
         else:
             out["car rail"] = "T125(82)"
 
-    cwt_loc_norm = (cwt_loc or "").strip().lower()
-    if cwt_loc_norm == "cwt-left":
+    if rec.cwt_side == "left":
         out["left rail"] = "9"
         out["right rail"] = "12"
         out["ctw rail name"] = "T75"
         out["ctw rail rid"] = "9"
-    elif cwt_loc_norm == "cwt-right":
+    elif rec.cwt_side == "right":
         out["left rail"] = "12"
         out["right rail"] = "9"
         out["ctw rail name"] = "T90"
@@ -745,7 +781,7 @@ def compute_derived(
     out["lop type"] = "Stadnard 150x300"  # VT spelling preserved (matches R384 IF arg)
 
     # -------- R383 / R388 LOP location (per LOP type and location dropdown)
-    lop_loc_raw = _field(lift, "LOP type and location", "LOP type and locaion")
+    lop_loc_raw = rec.lop_location
     lop_map = {
         "in lift door frame l": "138",
         "in lift door frame r": "146",
@@ -762,7 +798,7 @@ def compute_derived(
     out["panel type"] = "13"
 
     # -------- R394 LIP location (per LIP type and location dropdown)
-    lip_loc_raw = _field(lift, "LIP type and location")
+    lip_loc_raw = rec.lip_location
     lip_map = {
         "door frame side vertical": "130",
         "panel above horizontal": "132",
@@ -771,7 +807,7 @@ def compute_derived(
         out["location"] = lip_map.get(lip_loc_raw.strip().lower(), "non std.")
 
     # -------- R401..R418 Door-fixing rails (driven by R46 door fixation type, M46)
-    door_fix = _field(lift, "door fixation type", "Door fixation type").strip().lower()
+    door_fix = rec.door_fixation.lower()
     rail_inserts = ("insert rail 40/22", "insert rail 50/30")
 
     if door_fix:
@@ -824,7 +860,7 @@ def compute_derived(
             out["length"] = rail_len_val
 
     # -------- R420 / R423 Brackets (driven by R53 shaft equipment fixation type)
-    shaft_fix = _field(lift, "Shaft equipment fixation type").strip().lower()
+    shaft_fix = rec.shaft_fixation.lower()
     bracket_map = {
         "insert rail 40/22": "1",
         "insert rail 50/30": "493900023",
@@ -884,9 +920,8 @@ def compute_derived(
             out[sched_key] = ui_val
 
     # -------- Open-through / adjacent access flags from the Access type dropdown
-    access_norm = (access_type or "").strip().lower()
-    out["open-through"] = "yes" if access_norm == "open through" else "no"
-    out["adjacent access"] = "yes" if access_norm == "adjacent" else "no"
+    out["open-through"] = "yes" if rec.access == "open through" else "no"
+    out["adjacent access"] = "yes" if rec.access == "adjacent" else "no"
 
     # -------- Schematics & Occupancies: per-floor elevations
     # Schedule template has fixed labelled rows ("Ground floor (E0)",
@@ -904,36 +939,31 @@ def compute_derived(
         -1: "1st basement (e-1)",
         -2: "2nd basement (e-2)",
     }
-    floors_root = user_inputs.get("Floors") or []
-    if floors_root:
-        first = floors_root[0] if isinstance(floors_root, list) else {}
-        lift_floors_key = f"Lift {lift_index + 1}"
-        floor_list = first.get(lift_floors_key, []) if isinstance(first, dict) else []
-        for f in floor_list or []:
-            if not isinstance(f, dict):
-                continue
-            try:
-                idx = int(str(f.get("Floor", "")).strip())
-            except (ValueError, TypeError):
-                continue
-            label = _ord_labels.get(idx)
-            if not label:
-                continue
-            elev_raw = f.get("Elevation (m)", "")
-            if elev_raw is None or str(elev_raw).strip() == "":
-                continue
-            out[label] = str(elev_raw).strip()
+    for f in floor_list:
+        if not isinstance(f, dict):
+            continue
+        try:
+            idx = int(str(f.get("Floor", "")).strip())
+        except (ValueError, TypeError):
+            continue
+        label = _ord_labels.get(idx)
+        if not label:
+            continue
+        elev_raw = f.get("Elevation (m)", "")
+        if elev_raw is None or str(elev_raw).strip() == "":
+            continue
+        out[label] = str(elev_raw).strip()
 
     # -------- R292 wall-distance CWT side
     wall_cwt = _lookup_wall_distance(
-        _WALL_CWT_SIDE, cw_mm, dw_mm, door_type_used, accessible_yes, cladding_mm
+        _WALL_CWT_SIDE_INDEX, cw_mm, dw_mm, door_type_used, accessible_yes, cladding_mm
     )
     if wall_cwt is not None:
         out["walldistance ctw side"] = str(wall_cwt)
 
     # -------- R293 wall-distance non-CWT side
     wall_noncwt = _lookup_wall_distance(
-        _WALL_NON_CWT_SIDE, cw_mm, dw_mm, door_type_used, accessible_yes, cladding_mm
+        _WALL_NON_CWT_SIDE_INDEX, cw_mm, dw_mm, door_type_used, accessible_yes, cladding_mm
     )
     if wall_noncwt is not None:
         out["wall distance non-cwt side"] = str(wall_noncwt)
@@ -953,12 +983,11 @@ def compute_derived(
         cwt_depth = (wall_cwt - cwt_wall_dist_default - car_wall) / 2.0
         out["cwt depth"] = _fmt_dim(cwt_depth)
         # -------- R302 LEFT distance FROM CAR / R306 RIGHT DIST CAR
-        loc_lower = cwt_loc.strip().lower()
-        if loc_lower == "cwt-left":
+        if rec.cwt_side == "left":
             out["left distance from car"] = _fmt_dim(cwt_depth)
             if wall_noncwt is not None:
                 out["right dist car"] = _fmt_dim(wall_noncwt - car_wall)
-        elif loc_lower == "cwt-right":
+        elif rec.cwt_side == "right":
             out["right dist car"] = _fmt_dim(cwt_depth)
             if wall_noncwt is not None:
                 out["left distance from car"] = _fmt_dim(wall_noncwt - car_wall)
@@ -978,14 +1007,13 @@ def compute_derived(
         cwt_depth_val = _to_float(out.get("cwt depth", ""))
         right_dist_val = _to_float(out.get("right dist car", ""))
         offset = 0  # R294
-        loc_xc = cwt_loc.strip().lower()
         right_side_front: Optional[float] = None
-        if loc_xc == "cwt-left" and right_dist_val is not None:
+        if rec.cwt_side == "left" and right_dist_val is not None:
             right_side_front = (
                 right_dist_val + car_wall + cw_mm_geom / 2.0
             ) - struct_door_w / 2.0 - offset
         elif (
-            loc_xc == "cwt-right"
+            rec.cwt_side == "right"
             and right_dist_val is not None
             and cwt_depth_val is not None
         ):
@@ -1003,3 +1031,109 @@ def compute_derived(
             out["left side of the wall"] = _fmt_dim(left_side_front)
 
     return out
+
+
+# --- lookup micro-benchmark --------------------------------------------------
+
+def _scan_door_rid(
+    manufacturer: str, kind: str, door_type: str, door_width_mm: Optional[int]
+) -> Optional[int]:
+    """Reference (unindexed) RID lookup: first matching product of the catalogue."""
+    for p in _DOOR_CATALOGUE.products:
+        if (
+            p.manufacturer == manufacturer
+            and p.kind == kind
+            and p.door_type == door_type
+            and p.width_mm == door_width_mm
+        ):
+            return p.rid
+    return None
+
+
+def _scan_wall_distance(
+    table: Tuple[Tuple[int, int, Tuple[str, ...], Optional[str], int], ...],
+    cw_mm: Optional[int],
+    dw_mm: Optional[int],
+    dt: str,
+    accessible_yes: bool,
+    cladding_mm: float,
+) -> Optional[int]:
+    """Reference (pre-index) wall-distance lookup: first matching row of ``table``."""
+    if cw_mm is None or dw_mm is None or not dt:
+        return None
+    access_key = "yes" if accessible_yes else "no"
+    for row_cw, row_dw, row_dts, row_access, base in table:
+        if row_cw != cw_mm or row_dw != dw_mm or dt not in row_dts:
+            continue
+        if row_access is not None and row_access != access_key:
+            continue
+        return int(round(base + float(cladding_mm)))
+    return None
+
+
+def benchmark_vt_lookups(repeat: int = 5, log=print) -> Dict[str, float]:
+    """
+    Best-of-``repeat`` time (seconds) to evaluate every door-RID combination (every
+    catalogue manufacturer, entrance and cabin doors) and every wall-distance combination (both
+    sides, accessible yes / no) over all table widths plus off-table and missing values,
+    via the row scans (``"scan"``) and the import-time indexes (``"index"``). Raises
+    ``ValueError`` if the two paths disagree on any combination.
+    """
+    door_types = DOOR_TYPES + ("", "3X")
+    widths: List[Optional[int]] = sorted(
+        {p.width_mm for p in _DOOR_CATALOGUE.products}
+        | {w for table in (_WALL_CWT_SIDE, _WALL_NON_CWT_SIDE) for row in table for w in row[:2]}
+        | {950}
+    )
+    widths.append(None)
+    rid_args = [
+        (maker, kind, dt, w)
+        for maker in _DOOR_CATALOGUE.options
+        for kind in DOOR_KINDS
+        for dt in door_types
+        for w in widths
+    ]
+    walls = ((_WALL_CWT_SIDE, _WALL_CWT_SIDE_INDEX), (_WALL_NON_CWT_SIDE, _WALL_NON_CWT_SIDE_INDEX))
+    wall_args = [
+        (cw, dw, dt, acc, 20.0)
+        for cw in widths
+        for dw in widths
+        for dt in door_types
+        for acc in (False, True)
+    ]
+
+    def _scan() -> List[Optional[int]]:
+        out = [_scan_door_rid(*a) for a in rid_args]
+        for table, _index in walls:
+            out.extend(_scan_wall_distance(table, *a) for a in wall_args)
+        return out
+
+    def _index() -> List[Optional[int]]:
+        out = [_door_rid(*a) for a in rid_args]
+        for _table, index in walls:
+            out.extend(_lookup_wall_distance(index, *a) for a in wall_args)
+        return out
+
+    expected, got = _scan(), _index()
+    if expected != got:
+        raise ValueError("Indexed VT lookup disagrees with the table scan")
+
+    out: Dict[str, float] = {}
+    for name, fn in (("scan", _scan), ("index", _index)):
+        best = float("inf")
+        for _ in range(max(1, int(repeat))):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        out[name] = best
+        log(f"{name:>6}: {best * 1000:7.2f} ms ({len(expected)} lookups)")
+    log(f"speedup: {out['scan'] / out['index']:.1f}x")
+    return out
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Benchmark the VT door-RID and wall-distance lookups.")
+    ap.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported).")
+    benchmark_vt_lookups(repeat=ap.parse_args().repeat)
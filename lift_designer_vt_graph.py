@@ -0,0 +1,284 @@
+"""
+Declarative dependency graph of the ``VT standard configurations`` layout cascade.
+
+Each :class:`VTFormulaNode` names one VT parameter (normalized label, same keys as
+:func:`lift_designer_vt_derived.compute_derived`), the nodes it reads and the formula
+that computes it — e.g. R34 cabin width → R35 cabin depth → R58 shaft depth, or
+R37 clear cabin height → R38 structural height → R60 shaft head. Names that no node
+defines are **inputs** (load capacity, speed, counterweight location, …).
+
+:class:`VTGraphEvaluator` keeps the values of one lift and, when inputs change or a
+node is edited by hand, re-evaluates only the nodes downstream of the change::
+
+    ev = VTGraphEvaluator(LAYOUT_GRAPH)
+    ev.update({"load capacity": "1000", "speed": "1.6", ...})   # full evaluation
+    ev.update({"speed": "2"})                                     # head + pit only
+    ev.last_evaluated        # ('shaft head suggested', 'shaft pit suggested')
+    LAYOUT_GRAPH.dependents("speed")
+
+A node's *used* value (what downstream formulas read) is its manual override when one
+is set, otherwise the formula result — the same rule the Layout page applies to its
+formula cells and ``compute_derived`` applies to UI-entered values.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from gui.lift_types import load_profile_for_capacity
+
+
+__all__ = [
+    "VTFormulaNode",
+    "VTDependencyGraph",
+    "VTGraphEvaluator",
+    "LAYOUT_GRAPH",
+]
+
+
+@dataclass(frozen=True)
+class VTFormulaNode:
+    """One VT formula: ``formula(*used values of deps)`` → value (``None`` = no value)."""
+
+    name: str
+    deps: Tuple[str, ...]
+    formula: Callable[..., Any]
+    vt_row: Optional[int] = None
+
+
+class VTDependencyGraph:
+    """
+    Immutable DAG of :class:`VTFormulaNode`. Nodes are kept in topological order;
+    :meth:`dependents` / :meth:`dependencies` answer "what depends on X" queries.
+    """
+
+    def __init__(self, nodes: Sequence[VTFormulaNode]) -> None:
+        by_name: Dict[str, VTFormulaNode] = {}
+        for n in nodes:
+            if n.name in by_name:
+                raise ValueError(f"Duplicate VT graph node {n.name!r}")
+            by_name[n.name] = n
+        self.nodes: Dict[str, VTFormulaNode] = by_name
+        self.inputs: FrozenSet[str] = frozenset(
+            d for n in nodes for d in n.deps if d not in by_name
+        )
+        self._children: Dict[str, List[str]] = {}
+        for n in nodes:
+            for d in n.deps:
+                self._children.setdefault(d, []).append(n.name)
+        self.order: Tuple[str, ...] = self._topological_order()
+        self._rank: Dict[str, int] = {name: i for i, name in enumerate(self.order)}
+
+    def _topological_order(self) -> Tuple[str, ...]:
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str) -> None:
+            s = state.get(name)
+            if s == 2:
+                return
+            if s == 1:
+                raise ValueError(f"Cycle in VT graph at {name!r}")
+            state[name] = 1
+            for d in self.nodes[name].deps:
+                if d in self.nodes:
+                    visit(d)
+            state[name] = 2
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        return tuple(order)
+
+    def dependents(self, name: str) -> Tuple[str, ...]:
+        """Every node downstream of ``name`` (transitively), in evaluation order."""
+        return self._sorted(self._downstream((name,)))
+
+    def dependencies(self, name: str) -> Tuple[str, ...]:
+        """Every node and input ``name`` reads (transitively); inputs sort first."""
+        seen: Set[str] = set()
+        stack = list(self.nodes[name].deps) if name in self.nodes else []
+        while stack:
+            d = stack.pop()
+            if d in seen:
+                continue
+            seen.add(d)
+            if d in self.nodes:
+                stack.extend(self.nodes[d].deps)
+        return tuple(sorted(seen, key=lambda n: (n in self.nodes, self._rank.get(n, -1), n)))
+
+    def with_inputs(self, *names: str) -> "VTDependencyGraph":
+        """A copy of this graph where the named nodes are plain inputs (no formula)."""
+        drop = set(names)
+        return VTDependencyGraph([n for n in self.nodes.values() if n.name not in drop])
+
+    def _downstream(self, names: Iterable[str]) -> Set[str]:
+        out: Set[str] = set()
+        stack = list(names)
+        while stack:
+            for child in self._children.get(stack.pop(), ()):
+                if child not in out:
+                    out.add(child)
+                    stack.append(child)
+        return out
+
+    def _sorted(self, names: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(sorted(names, key=self._rank.__getitem__))
+
+
+class VTGraphEvaluator:
+    """
+    Values of one lift over a :class:`VTDependencyGraph`, recomputed incrementally.
+
+    ``overrides`` maps node names to manually entered text; a non-empty override wins
+    over the formula result for downstream nodes. ``apply`` replaces that rule with a
+    callback ``apply(name, computed) -> used`` — the Layout page uses it to push each
+    result into its line edit and read back what the cell now shows.
+
+    ``nodes_evaluated`` counts formula calls over the evaluator's lifetime and
+    ``last_evaluated`` lists the nodes recomputed by the latest :meth:`update`.
+    """
+
+    def __init__(
+        self,
+        graph: VTDependencyGraph,
+        overrides: Optional[Mapping[str, Any]] = None,
+        apply: Optional[Callable[[str, Any], Any]] = None,
+    ) -> None:
+        self.graph = graph
+        self.overrides: Dict[str, Any] = dict(overrides or {})
+        self.apply = apply
+        self.values: Dict[str, Any] = {}
+        self.computed: Dict[str, Any] = {}
+        self.nodes_evaluated = 0
+        self.last_evaluated: Tuple[str, ...] = ()
+        self._primed = False
+
+    def value(self, name: str) -> Any:
+        return self.values.get(name, "")
+
+    def update(
+        self,
+        inputs: Optional[Mapping[str, Any]] = None,
+        overrides: Optional[Mapping[str, Any]] = None,
+        touched: Iterable[str] = (),
+    ) -> Tuple[str, ...]:
+        """
+        Apply changed ``inputs`` / ``overrides`` and re-evaluate what they affect.
+        ``touched`` names nodes whose cell changed outside the evaluator (they are
+        re-resolved along with their dependents). The first call evaluates every node.
+        Returns the nodes evaluated.
+        """
+        dirty: Set[str] = set()
+        for k, v in (inputs or {}).items():
+            if k not in self.values or self.values[k] != v:
+                self.values[k] = v
+                dirty.add(k)
+        for k, v in (overrides or {}).items():
+            if self.overrides.get(k) != v:
+                self.overrides[k] = v
+                dirty.add(k)
+        dirty.update(touched)
+
+        if not self._primed:
+            todo = self.graph.order
+            self._primed = True
+        else:
+            affected = self.graph._downstream(dirty)
+            affected.update(d for d in dirty if d in self.graph.nodes)
+            todo = self.graph._sorted(affected)
+
+        for name in todo:
+            node = self.graph.nodes[name]
+            comp = node.formula(*(self.values.get(d, "") for d in node.deps))
+            self.computed[name] = comp
+            self.values[name] = self._resolve(name, comp)
+        self.nodes_evaluated += len(todo)
+        self.last_evaluated = tuple(todo)
+        return self.last_evaluated
+
+    def _resolve(self, name: str, comp: Any) -> Any:
+        if self.apply is not None:
+            return self.apply(name, comp)
+        ov = self.overrides.get(name)
+        if ov:
+            return ov
+        return comp if comp is not None else ""
+
+
+# --- VT layout cascade -------------------------------------------------------
+
+def _float_or_zero(raw: Any) -> float:
+    t = str(raw if raw is not None else "").strip().replace(",", ".")
+    if not t:
+        return 0.0
+    try:
+        return float(t) or 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _door_structural_opening_width(door_width: Any) -> Optional[str]:
+    """VT R42 as shown on the Layout page: door width + 2 × 140."""
+    try:
+        dv = float(str(door_width).strip().replace(",", "."))
+        return str(int(dv + 280)) if dv == int(dv) else str(dv + 280)
+    except (ValueError, OverflowError):
+        return None
+
+
+_P = "load profile"
+_CW = "cabin width (clear)"
+_CD = "cabin depth (clear)"
+_CLAD = "cladding thickness each wall"
+_CLAD_MM = "cladding mm"
+_ACC = "accessible rooms yes"  # input: LiftRecord.accessible_rooms_yes
+_CLEAR = "clear cabin height"
+_STRUCT = "structural cabin height"
+_DW = "door width"
+_DH = "door height"
+_DT = "door type"
+
+#: The Layout-page cascade (VT rows R34–R62), keyed by normalized parameter label.
+LAYOUT_GRAPH = VTDependencyGraph(
+    (
+        VTFormulaNode(_P, ("load capacity",), load_profile_for_capacity),
+        VTFormulaNode(_CW, (_P, "cabin type/shape"), lambda p, shape: p.cabin_width_mm(shape), 34),
+        VTFormulaNode(_CD, (_P, _CW), lambda p, cw: p.cabin_depth_mm(cw), 35),
+        VTFormulaNode(_CLAD, (_P,), lambda p: p.cladding_thickness_mm(), 36),
+        VTFormulaNode(_CLAD_MM, (_CLAD,), _float_or_zero),
+        VTFormulaNode(_CLEAR, (_P, _CW), lambda p, cw: p.clear_cabin_height_mm(cw), 37),
+        VTFormulaNode(_STRUCT, (_P, _CLEAR), lambda p, ch: p.structural_cabin_height_mm(ch), 38),
+        VTFormulaNode(_DW, (_P, _CW), lambda p, cw: p.door_width_mm(cw), 41),
+        VTFormulaNode("door structural opening width", (_DW,), _door_structural_opening_width, 42),
+        VTFormulaNode(_DH, (_P, _CLEAR), lambda p, ch: p.door_height_mm(ch), 43),
+        VTFormulaNode(
+            "door structural opening height",
+            (_P, _DH),
+            lambda p, dh: p.door_structural_opening_height_mm(dh),
+            44,
+        ),
+        VTFormulaNode(_DT, (_P, _CW, "counterweight location"), lambda p, cw, loc: p.door_type_code(cw, loc), 45),
+        VTFormulaNode(
+            "shaft width suggested",
+            (_P, _CW, _CLAD_MM, _ACC),
+            lambda p, cw, clad, acc: p.shaft_width_suggested_mm(cw, clad, acc),
+            54,
+        ),
+        VTFormulaNode(
+            "shaft depth suggested",
+            (_P, _CD, _CLAD_MM, "access type"),
+            lambda p, cd, clad, access: p.shaft_depth_suggested_mm(cd, clad, access),
+            58,
+        ),
+        VTFormulaNode(
+            "shaft head suggested",
+            (_P, _STRUCT, "speed", _CW, _DW, _DT, _CLAD_MM, _ACC),
+            lambda p, sh, speed, cw, dw, dt, clad, acc: p.shaft_head_suggested_mm(
+                sh, speed, cw, dw, str(dt or "").strip(), clad, acc
+            ),
+            60,
+        ),
+        VTFormulaNode("shaft pit suggested", (_P, "speed"), lambda p, speed: p.shaft_pit_suggested_mm(speed), 62),
+    )
+)
@@ -0,0 +1,524 @@
+"""
+Compiled snapshot of the ``VT standard configurations_V00.xlsx`` export rules (non-UI).
+
+Both exports read the same sheet (``VT Standard configs``): the LD export keeps rows whose
+column **F** holds an LD variable path (:class:`lift_designer_ld_export.VTExportRule`), the
+Schedules export keeps column **E** = ``yes`` rows plus section headers
+(:class:`lift_designer_schedules_export.VTScheduleRule`). Parsing the workbook with openpyxl
+takes most of a second, so :func:`load_vt_rule_set` compiles both rule lists once and
+
+- keeps them in memory for the rest of the process, and
+- persists them as JSON next to the workbook (``<stem>.vtrules.json``), keyed by the
+  workbook's absolute path, mtime, size and SHA-256 content hash.
+
+A snapshot is reused when path + mtime + size match. When they don't (file copied, touched by
+a checkout, project folder moved) the content hash decides: same bytes → the snapshot is
+re-stamped and reused, different bytes → the rules are re-parsed and the snapshot rewritten.
+A missing, unreadable or older-format snapshot rebuilds transparently; a read-only folder
+(e.g. the PyInstaller bundle) simply skips persisting.
+
+Parsing is a single streaming pass (:func:`scan_vt_workbook`): the sheet is opened with
+openpyxl's read-only row iterator and every row is classified for both exports at once, so
+neither styles nor the other sheets are materialized. Run this module as a script to compare
+its parse time and peak memory against a full ``load_workbook`` of the same file.
+
+Frozen builds skip even that: ``exe_builder.py`` calls :func:`bake_vt_rules_module` to write
+``lift_designer_vt_baked.py`` (rules, section headers and the Schedules template's label → row
+map as Python literals, stamped with the source files' size + SHA-256) and bundles it into the
+executable. :func:`load_vt_rule_set` and :func:`baked_template_label_rows` use the baked data
+whenever the shipped workbook still has the baked content, and fall back to live parsing when
+the xlsx next to the executable differs (e.g. a newer VT revision dropped in by hand).
+
+The returned rule lists are shared between callers — treat them as read-only.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from lift_designer_ld_export import VTExportRule, _export_rule_from_row, default_vt_workbook_path
+
+__all__ = [
+    "VTRuleSet",
+    "VTScanResult",
+    "VT_RULES_SNAPSHOT_VERSION",
+    "VT_SHEET_NAME",
+    "scan_vt_workbook",
+    "benchmark_vt_scan",
+    "bake_vt_rules_module",
+    "baked_template_label_rows",
+    "BAKED_MODULE_NAME",
+    "load_vt_rule_set",
+    "vt_rules_snapshot_path",
+    "clear_vt_rule_cache",
+]
+
+# Bump whenever the parsing rules or the serialized layout change so stale snapshots rebuild.
+VT_RULES_SNAPSHOT_VERSION: int = 2
+
+VT_SHEET_NAME: str = "VT Standard configs"
+_FIRST_RULE_ROW = 3  # rows 1–2 hold the sheet title and column headers
+
+_SNAPSHOT_SUFFIX = ".vtrules.json"
+
+# Generated by :func:`bake_vt_rules_module` at build time; absent in a source checkout.
+BAKED_MODULE_NAME: str = "lift_designer_vt_baked"
+
+
+@dataclass
+class VTScanResult:
+    """
+    Output of one :func:`scan_vt_workbook` pass.
+
+    ``section_headers`` lists every structural section row of the sheet (label in column A,
+    columns D/E/F blank) as ``(vt_row, title)`` — the raw material the curated
+    :data:`lift_designer_ld_export._LD_SECTION_HEADERS` anchors are picked from.
+    ``peak_memory_bytes`` is only filled when the scan ran with ``measure_memory=True``.
+    """
+
+    export_rules: List[VTExportRule] = field(default_factory=list)
+    schedule_rules: List[Any] = field(default_factory=list)  # List[VTScheduleRule]
+    section_headers: List[Tuple[int, str]] = field(default_factory=list)
+    rows_scanned: int = 0
+    parse_seconds: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+
+
+@dataclass
+class VTRuleSet:
+    """Both rule lists compiled from one VT workbook, plus the key they were built for."""
+
+    export_rules: List[VTExportRule] = field(default_factory=list)
+    schedule_rules: List[Any] = field(default_factory=list)  # List[VTScheduleRule]
+    section_headers: List[Tuple[int, str]] = field(default_factory=list)
+    source_path: str = ""
+    source_mtime_ns: int = 0
+    source_size: int = 0
+    source_sha256: str = ""
+
+
+# In-process memo: (normalized path, mtime_ns, size) → rule set.
+_MEMO: Dict[Tuple[str, int, int], VTRuleSet] = {}
+
+
+def _remember(memo_key: Tuple[str, int, int], rs: VTRuleSet) -> VTRuleSet:
+    """Memoize ``rs``, dropping entries for older versions of the same workbook."""
+    for k in [k for k in _MEMO if k[0] == memo_key[0]]:
+        del _MEMO[k]
+    _MEMO[memo_key] = rs
+    return rs
+
+
+def _norm_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _sha256_of_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def vt_rules_snapshot_path(path_vt: str) -> str:
+    """Snapshot file stored next to ``path_vt`` (``VT standard configurations_V00.vtrules.json``)."""
+    stem, _ext = os.path.splitext(path_vt)
+    return stem + _SNAPSHOT_SUFFIX
+
+
+def clear_vt_rule_cache() -> None:
+    """Forget every in-memory rule set (on-disk snapshots are left alone)."""
+    _MEMO.clear()
+
+
+def _cell_text(v: Any) -> str:
+    return "" if v is None else str(v).strip()
+
+
+def scan_vt_workbook(
+    path_vt: Optional[str] = None,
+    *,
+    measure_memory: bool = False,
+) -> VTScanResult:
+    """
+    Single streaming pass over ``VT Standard configs`` (columns A–F from row 3).
+
+    Each row is handed to :func:`lift_designer_ld_export._export_rule_from_row` and
+    :func:`lift_designer_schedules_export._schedule_rule_from_row`, so the result is
+    identical to running both loaders separately. Only the first ``floors_z`` /
+    ``floors_desc`` export rule is kept, as before.
+
+    ``measure_memory=True`` traces allocations with :mod:`tracemalloc` (slower) and
+    reports the peak in ``peak_memory_bytes``.
+    """
+    from lift_designer_schedules_export import _schedule_rule_from_row
+
+    path_vt = path_vt or default_vt_workbook_path()
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise ImportError("pip install openpyxl") from e
+
+    started_tracing = False
+    if measure_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started_tracing = True
+    if measure_memory:
+        tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+
+    result = VTScanResult()
+    wb = load_workbook(path_vt, read_only=True, data_only=True)
+    try:
+        if VT_SHEET_NAME in wb.sheetnames:
+            ws = wb[VT_SHEET_NAME]
+            seen_floor_kinds: set = set()
+            r = _FIRST_RULE_ROW - 1
+            for values in ws.iter_rows(min_row=_FIRST_RULE_ROW, max_col=6, values_only=True):
+                r += 1
+                a, _b, _c, d, e, f = (tuple(values) + (None,) * 6)[:6]
+                result.rows_scanned += 1
+
+                rule = _export_rule_from_row(r, a, f)
+                if rule is not None:
+                    if rule.kind == "static":
+                        result.export_rules.append(rule)
+                    elif rule.kind not in seen_floor_kinds:
+                        seen_floor_kinds.add(rule.kind)
+                        result.export_rules.append(rule)
+
+                srule = _schedule_rule_from_row(r, a, d, e, f)
+                if srule is not None:
+                    result.schedule_rules.append(srule)
+
+                a_s = _cell_text(a)
+                if a_s and not (_cell_text(d) or _cell_text(e) or _cell_text(f)):
+                    result.section_headers.append((r, a_s))
+    finally:
+        wb.close()
+
+    result.parse_seconds = time.perf_counter() - t0
+    if measure_memory:
+        result.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+        if started_tracing:
+            tracemalloc.stop()
+    return result
+
+
+def benchmark_vt_scan(path_vt: Optional[str] = None) -> Dict[str, float]:
+    """
+    Time and trace :func:`scan_vt_workbook` against the former full-workbook path
+    (``load_workbook(data_only=True)`` + ``ws.cell`` reads of columns A/D/E/F).
+    Returns seconds and peak bytes for both.
+    """
+    from openpyxl import load_workbook
+
+    path_vt = path_vt or default_vt_workbook_path()
+    scan = scan_vt_workbook(path_vt, measure_memory=True)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    wb = load_workbook(path_vt, data_only=True)
+    if VT_SHEET_NAME in wb.sheetnames:
+        ws = wb[VT_SHEET_NAME]
+        for r in range(_FIRST_RULE_ROW, ws.max_row + 1):
+            for c in (1, 4, 5, 6):
+                ws.cell(r, c).value
+    wb.close()
+    full_seconds = time.perf_counter() - t0
+    full_peak = tracemalloc.get_traced_memory()[1]
+    if started_tracing:
+        tracemalloc.stop()
+
+    return {
+        "scan_seconds": scan.parse_seconds,
+        "scan_peak_bytes": float(scan.peak_memory_bytes or 0),
+        "full_load_seconds": full_seconds,
+        "full_load_peak_bytes": float(full_peak),
+    }
+
+
+def _parse_rule_set(path_vt: str) -> VTScanResult:
+    """Parse both rule lists from the workbook (the slow path)."""
+    return scan_vt_workbook(path_vt)
+
+
+# Rule fields compiled in ``__post_init__``; rebuilt on load, never written to snapshots.
+_DERIVED_RULE_FIELDS = frozenset({"varname_templates", "param_plan"})
+
+
+def _rule_set_to_json(rs: VTRuleSet) -> Dict[str, Any]:
+    return {
+        "version": VT_RULES_SNAPSHOT_VERSION,
+        "source_path": rs.source_path,
+        "source_mtime_ns": rs.source_mtime_ns,
+        "source_size": rs.source_size,
+        "source_sha256": rs.source_sha256,
+        "export_rules": [
+            {k: v for k, v in asdict(r).items() if k not in _DERIVED_RULE_FIELDS} for r in rs.export_rules
+        ],
+        "schedule_rules": [
+            {k: v for k, v in asdict(r).items() if k not in _DERIVED_RULE_FIELDS} for r in rs.schedule_rules
+        ],
+        "section_headers": [list(h) for h in rs.section_headers],
+    }
+
+
+def _rule_set_from_json(data: Any) -> Optional[VTRuleSet]:
+    """Rebuild a :class:`VTRuleSet` from snapshot JSON; ``None`` if the layout is not understood."""
+    from lift_designer_schedules_export import VTScheduleRule
+
+    if not isinstance(data, dict) or data.get("version") != VT_RULES_SNAPSHOT_VERSION:
+        return None
+    try:
+        export_rules = [
+            VTExportRule(
+                kind=str(r["kind"]),
+                varnames=[str(v) for v in r.get("varnames", [])],
+                param_label=str(r.get("param_label", "")),
+                vt_row=int(r.get("vt_row", 0)),
+            )
+            for r in data["export_rules"]
+        ]
+        schedule_rules = [
+            VTScheduleRule(
+                kind=str(r["kind"]),
+                param_label=str(r.get("param_label", "")),
+                unit=str(r.get("unit", "")),
+                vt_row=int(r.get("vt_row", 0)),
+            )
+            for r in data["schedule_rules"]
+        ]
+        section_headers = [(int(r), str(t)) for r, t in data["section_headers"]]
+        return VTRuleSet(
+            export_rules=export_rules,
+            schedule_rules=schedule_rules,
+            section_headers=section_headers,
+            source_path=str(data.get("source_path", "")),
+            source_mtime_ns=int(data.get("source_mtime_ns", 0)),
+            source_size=int(data.get("source_size", 0)),
+            source_sha256=str(data.get("source_sha256", "")),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _read_snapshot(snap_path: str) -> Optional[VTRuleSet]:
+    try:
+        with open(snap_path, "r", encoding="utf-8") as f:
+            return _rule_set_from_json(json.load(f))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_snapshot(snap_path: str, rs: VTRuleSet) -> None:
+    """Atomically replace the snapshot; failures (read-only folder, …) are ignored."""
+    tmp = f"{snap_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_rule_set_to_json(rs), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, snap_path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _baked_module() -> Any:
+    """The generated ``lift_designer_vt_baked`` module, or ``None`` when it was never built."""
+    try:
+        import lift_designer_vt_baked as baked  # noqa: F401 — generated by exe_builder.py
+    except ImportError:
+        return None
+    if getattr(baked, "BAKED_VERSION", None) != VT_RULES_SNAPSHOT_VERSION:
+        return None
+    return baked
+
+
+def _baked_rule_set(path_vt: str, st: os.stat_result) -> Optional[VTRuleSet]:
+    """Baked rules when ``path_vt`` still holds the bytes they were compiled from."""
+    baked = _baked_module()
+    if baked is None or baked.VT_SOURCE_SIZE != st.st_size:
+        return None
+    digest = _sha256_of_file(path_vt)
+    if digest != baked.VT_SOURCE_SHA256:
+        return None
+    rs = _rule_set_from_json(baked.VT_SNAPSHOT)
+    if rs is None:
+        return None
+    rs.source_path = _norm_path(path_vt)
+    rs.source_mtime_ns = st.st_mtime_ns
+    rs.source_size = st.st_size
+    rs.source_sha256 = digest
+    return rs
+
+
+def _scan_template_label_rows(template_path: str) -> List[Tuple[int, str]]:
+    """``(row, label)`` for every non-empty column-A cell below the template's lift header."""
+    from openpyxl import load_workbook
+
+    from lift_designer_schedules_export import TEMPLATE_PARAM_FIRST_ROW, TEMPLATE_SHEET_NAME
+
+    wb = load_workbook(template_path, read_only=True)
+    try:
+        ws = wb[TEMPLATE_SHEET_NAME] if TEMPLATE_SHEET_NAME in wb.sheetnames else wb.active
+        out: List[Tuple[int, str]] = []
+        r = TEMPLATE_PARAM_FIRST_ROW - 1
+        for (a,) in ws.iter_rows(min_row=TEMPLATE_PARAM_FIRST_ROW, max_col=1, values_only=True):
+            r += 1
+            label = _cell_text(a)
+            if label:
+                out.append((r, label))
+        return out
+    finally:
+        wb.close()
+
+
+def baked_template_label_rows(template_path: str) -> Optional[List[Tuple[int, str]]]:
+    """
+    Baked Schedules-template ``(row, label)`` map when ``template_path`` matches the
+    baked template bytes; ``None`` otherwise (callers then read column A themselves).
+    """
+    baked = _baked_module()
+    if baked is None or not getattr(baked, "TEMPLATE_SOURCE_SHA256", ""):
+        return None
+    try:
+        if os.path.getsize(template_path) != baked.TEMPLATE_SOURCE_SIZE:
+            return None
+        if _sha256_of_file(template_path) != baked.TEMPLATE_SOURCE_SHA256:
+            return None
+    except OSError:
+        return None
+    return [(int(r), str(label)) for r, label in baked.TEMPLATE_LABEL_ROWS]
+
+
+def bake_vt_rules_module(
+    out_path: str,
+    path_vt: Optional[str] = None,
+    template_path: Optional[str] = None,
+) -> str:
+    """
+    Write the importable data module consumed by frozen builds (see module docstring).
+
+    ``template_path`` defaults to the shipped Schedules template; when no template can be
+    found only the VT rules are baked. Returns ``out_path``.
+    """
+    from lift_designer_schedules_export import default_schedule_template_path
+
+    path_vt = path_vt or default_vt_workbook_path()
+    scan = scan_vt_workbook(path_vt)
+    rs = VTRuleSet(
+        export_rules=scan.export_rules,
+        schedule_rules=scan.schedule_rules,
+        section_headers=scan.section_headers,
+    )
+    snapshot = _rule_set_to_json(rs)
+    for k in ("source_path", "source_mtime_ns"):
+        snapshot.pop(k, None)
+
+    if template_path is None:
+        try:
+            template_path = default_schedule_template_path()
+        except FileNotFoundError:
+            template_path = None
+    tpl_sha, tpl_size, tpl_rows = "", 0, []
+    if template_path:
+        tpl_sha = _sha256_of_file(template_path)
+        tpl_size = os.path.getsize(template_path)
+        tpl_rows = _scan_template_label_rows(template_path)
+
+    lines = [
+        '"""Generated by ``lift_designer_vt_rules.bake_vt_rules_module`` — do not edit."""',
+        f"BAKED_VERSION = {VT_RULES_SNAPSHOT_VERSION!r}",
+        f"VT_SOURCE_NAME = {os.path.basename(path_vt)!r}",
+        f"VT_SOURCE_SIZE = {os.path.getsize(path_vt)!r}",
+        f"VT_SOURCE_SHA256 = {_sha256_of_file(path_vt)!r}",
+        f"VT_SNAPSHOT = {snapshot!r}",
+        f"TEMPLATE_SOURCE_NAME = {os.path.basename(template_path or '')!r}",
+        f"TEMPLATE_SOURCE_SIZE = {tpl_size!r}",
+        f"TEMPLATE_SOURCE_SHA256 = {tpl_sha!r}",
+        f"TEMPLATE_LABEL_ROWS = {tuple(tpl_rows)!r}",
+        "",
+    ]
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return out_path
+
+
+def load_vt_rule_set(
+    path_vt: Optional[str] = None,
+    *,
+    use_disk_cache: bool = True,
+) -> VTRuleSet:
+    """
+    Return the compiled LD + Schedules rules for ``path_vt`` (default:
+    :func:`lift_designer_ld_export.default_vt_workbook_path`).
+
+    Lookup order: in-process memo → baked module (frozen builds) → on-disk snapshot →
+    parse the workbook. Pass ``use_disk_cache=False`` to neither read nor write the
+    snapshot file (the in-process memo is still used).
+    """
+    path_vt = path_vt or default_vt_workbook_path()
+    norm = _norm_path(path_vt)
+    st = os.stat(path_vt)
+    memo_key = (norm, st.st_mtime_ns, st.st_size)
+    hit = _MEMO.get(memo_key)
+    if hit is not None:
+        return hit
+
+    baked = _baked_rule_set(path_vt, st)
+    if baked is not None:
+        return _remember(memo_key, baked)
+
+    snap_path = vt_rules_snapshot_path(path_vt)
+    snap = _read_snapshot(snap_path) if use_disk_cache else None
+
+    rs: Optional[VTRuleSet] = None
+    if (
+        snap is not None
+        and snap.source_path == norm
+        and snap.source_mtime_ns == st.st_mtime_ns
+        and snap.source_size == st.st_size
+    ):
+        rs = snap
+    else:
+        digest = _sha256_of_file(path_vt)
+        if snap is not None and snap.source_size == st.st_size and snap.source_sha256 == digest:
+            # Same bytes under a new path / mtime — re-stamp instead of re-parsing.
+            rs = snap
+        else:
+            scan = _parse_rule_set(path_vt)
+            rs = VTRuleSet(
+                export_rules=scan.export_rules,
+                schedule_rules=scan.schedule_rules,
+                section_headers=scan.section_headers,
+            )
+        rs.source_path = norm
+        rs.source_mtime_ns = st.st_mtime_ns
+        rs.source_size = st.st_size
+        rs.source_sha256 = digest
+        if use_disk_cache:
+            _write_snapshot(snap_path, rs)
+
+    return _remember(memo_key, rs)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    p = argparse.ArgumentParser(description="Compare the streaming VT scan with a full openpyxl load.")
+    p.add_argument("vt_path", nargs="?", default=None, help="VT workbook (default: shipped file).")
+    args = p.parse_args()
+    stats = benchmark_vt_scan(args.vt_path)
+    print(f"streaming scan : {stats['scan_seconds'] * 1000:8.1f} ms  peak {stats['scan_peak_bytes'] / 1e6:7.2f} MB")
+    print(f"full load      : {stats['full_load_seconds'] * 1000:8.1f} ms  peak {stats['full_load_peak_bytes'] / 1e6:7.2f} MB")
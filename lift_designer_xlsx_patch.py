@@ -0,0 +1,739 @@
+"""
+Patch cell values of one worksheet inside an existing ``.xlsx`` package (non-UI).
+
+:class:`XlsxTemplateSheet` opens the workbook as a zip, reads the target sheet's XML
+once and exposes the small subset of the openpyxl worksheet API the template exports
+use — ``ws.max_row``, ``ws.cell(row, column).value`` (read / write) and
+``cell.fill = "FFRRGGBB"`` (solid fill). :meth:`XlsxTemplateSheet.save` rewrites only the
+``<row>`` elements that were edited; every other part of the package (shared strings,
+drawings, custom XML, printer settings, the other sheets) is copied unchanged, and
+``styles.xml`` only gains the fill / cell formats the edits need.
+
+Compared to ``load_workbook`` + ``save`` this avoids building the full object model of
+a heavily styled template (thousands of merged ranges and styled cells)::
+
+    ws = XlsxTemplateSheet("template.xlsx", "VT General Schedules")
+    c = ws.cell(10, 8)
+    if not (isinstance(c.value, str) and c.value.startswith("=")):
+        c.value = 1000
+        c.fill = "FFFFF2CC"
+    ws.save("out.xlsx")
+
+:meth:`XlsxTemplateSheet.copy_sheet` appends further copies of the sheet (with their
+own drawing / printer-settings parts and print area) for layouts that paginate.
+
+Written strings are stored inline (``t="inlineStr"``) so the shared-string table stays
+untouched. Formula cells read back as ``"=<formula>"`` like openpyxl; because edited
+inputs invalidate their cached results, the saved workbook is flagged for a full
+recalculation on open.
+
+:func:`load_template_sheet` keeps parsed templates in a process-level cache keyed by
+path and modification time, handing out a cheap :meth:`XlsxTemplateSheet.clone` per
+export so concurrent exports never share edits.
+"""
+from __future__ import annotations
+
+import os
+import posixpath
+import re
+import threading
+import zipfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from xml.sax.saxutils import escape
+
+
+__all__ = [
+    "XlsxTemplateSheet",
+    "XlsxPatchCell",
+    "TemplateCacheInfo",
+    "load_template_sheet",
+    "template_cache_info",
+    "clear_template_cache",
+    "check_fill_round_trip",
+]
+
+
+_ROW_RE = re.compile(r"<row\b([^>]*?)(?:/>|>(.*?)</row>)", re.S)
+_CELL_RE = re.compile(r"<c\b([^>]*?)(?:/>|>(.*?)</c>)", re.S)
+_ATTR_RE = re.compile(r'([\w:]+)="([^"]*)"')
+_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+_T_RE = re.compile(r"<t(?:\s[^>]*)?>(.*?)</t>|<t(?:\s[^>]*)?/>", re.S)
+_RPH_RE = re.compile(r"<rPh\b.*?</rPh>", re.S)
+_XF_RE = re.compile(r"<xf\b[^>]*?(?:/>|>.*?</xf>)", re.S)
+_REL_RE = re.compile(r"<Relationship\b([^>]*?)/?>")
+_SHEET_ENTRY_RE = re.compile(r"<sheet\b([^>]*?)/?>")
+_DEFINED_NAME_RE = re.compile(r"<definedName\b([^>]*)>(.*?)</definedName>", re.S)
+
+# Sheet relationships whose target part copy_sheet() duplicates for each copy.
+_COPIED_SHEET_PARTS = ("drawing", "printerSettings", "vmlDrawing")
+_INVALID_TITLE_CHARS = set("[]:*?/\\")
+
+
+def _col_letter(col: int) -> str:
+    out = ""
+    while col > 0:
+        col, rem = divmod(col - 1, 26)
+        out = chr(65 + rem) + out
+    return out
+
+
+def _col_index(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - 64)
+    return n
+
+
+def _unescape(text: str) -> str:
+    if "&" not in text:
+        return text
+    return (
+        text.replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&quot;", '"')
+        .replace("&apos;", "'")
+        .replace("&amp;", "&")
+    )
+
+
+def _attrs(raw: str) -> Dict[str, str]:
+    return dict(_ATTR_RE.findall(raw))
+
+
+def _attr_text(attrs: Mapping[str, str]) -> str:
+    return "".join(f' {k}="{v}"' for k, v in attrs.items())
+
+
+def _rels_part(part: str) -> str:
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def _rel_target(base_part: str, target: str) -> str:
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_part), target))
+
+
+def _next_part(names: Set[str], part: str) -> str:
+    """First free ``stemN.ext`` name for a copy of ``part`` (``drawing1.xml`` → ``drawing2.xml``)."""
+    m = re.fullmatch(r"(.*?)\d*(\.[^./]+)", part)
+    stem, ext = (m.group(1), m.group(2)) if m else (part, "")
+    n = 1
+    while f"{stem}{n}{ext}" in names:
+        n += 1
+    return f"{stem}{n}{ext}"
+
+
+def _next_rid(rels_xml: str) -> str:
+    used = [int(m) for m in re.findall(r'\bId="rId(\d+)"', rels_xml)]
+    return f"rId{max(used, default=0) + 1}"
+
+
+def _quote_sheet(title: str) -> str:
+    return "'" + title.replace("'", "''") + "'"
+
+
+def _rich_text(inner: str) -> str:
+    """Text of an ``<si>`` / ``<is>`` body (runs concatenated, phonetic hints dropped)."""
+    inner = _RPH_RE.sub("", inner)
+    return "".join(_unescape(m.group(1) or "") for m in _T_RE.finditer(inner))
+
+
+class XlsxPatchCell:
+    """One cell of an :class:`XlsxTemplateSheet`; ``value`` / ``fill`` mirror openpyxl."""
+
+    __slots__ = ("_sheet", "row", "column")
+
+    def __init__(self, sheet: "XlsxTemplateSheet", row: int, column: int) -> None:
+        self._sheet = sheet
+        self.row = row
+        self.column = column
+
+    @property
+    def value(self) -> Any:
+        return self._sheet._value(self.row, self.column)
+
+    @value.setter
+    def value(self, v: Any) -> None:
+        self._sheet._edits[(self.row, self.column)] = v
+
+    @property
+    def fill(self) -> Optional[str]:
+        return self._sheet._fills.get((self.row, self.column))
+
+    @fill.setter
+    def fill(self, argb: str) -> None:
+        """Solid fill colour as ``AARRGGBB`` (e.g. ``"FFFFF2CC"``)."""
+        self._sheet._fills[(self.row, self.column)] = str(argb).upper()
+
+
+class XlsxTemplateSheet:
+    """
+    One worksheet of ``path`` opened for in-place value edits (see module docstring).
+    ``sheet_name=None`` — or a name the workbook does not contain — selects the
+    active sheet, like ``wb[name] if name in wb.sheetnames else wb.active``.
+    """
+
+    def __init__(self, path: str, sheet_name: Optional[str] = None) -> None:
+        self.path = path
+        # The whole package is read once; save() writes from this snapshot.
+        with zipfile.ZipFile(path) as zf:
+            self._infos = zf.infolist()
+            self._payload: Dict[str, bytes] = {i.filename: zf.read(i.filename) for i in self._infos}
+        workbook_xml = self._payload["xl/workbook.xml"].decode("utf-8")
+        rels_xml = self._payload["xl/_rels/workbook.xml.rels"].decode("utf-8")
+        self.title, self._sheet_part = self._resolve_sheet(workbook_xml, rels_xml, sheet_name)
+        self._xml = self._payload[self._sheet_part].decode("utf-8")
+        shared = self._payload.get("xl/sharedStrings.xml")
+        self._shared_xml = shared.decode("utf-8") if shared is not None else ""
+        self._shared: Optional[List[str]] = None
+
+        start = self._xml.find("<sheetData")
+        open_end = self._xml.find(">", start)
+        if self._xml[open_end - 1] == "/":  # <sheetData/>
+            self._head = self._xml[:start] + "<sheetData>"
+            self._body = ""
+            self._tail = "</sheetData>" + self._xml[open_end + 1 :]
+        else:
+            close = self._xml.find("</sheetData>", open_end)
+            self._head = self._xml[: open_end + 1]
+            self._body = self._xml[open_end + 1 : close]
+            self._tail = self._xml[close:]
+
+        # row number -> (start, end) of the <row> element in _body
+        self._rows: Dict[int, Tuple[int, int]] = {}
+        # row number -> {column: (attributes, inner XML, original element text)}
+        self._row_cells: Dict[int, Dict[int, Tuple[Dict[str, str], str, str]]] = {}
+        for m in _ROW_RE.finditer(self._body):
+            r = int(_attrs(m.group(1))["r"])
+            self._rows[r] = (m.start(), m.end())
+        self._edits: Dict[Tuple[int, int], Any] = {}
+        self._fills: Dict[Tuple[int, int], str] = {}
+        # Sheets added by copy_sheet(); a copy points back at the sheet that saves it.
+        self._copies: List["XlsxTemplateSheet"] = []
+        self._owner: Optional["XlsxTemplateSheet"] = None
+
+    def clone(self) -> "XlsxTemplateSheet":
+        """
+        A copy with no edits that shares this sheet's parsed (read-only) template data;
+        edits on either never affect the other.
+        """
+        self._shared_strings()
+        twin = object.__new__(type(self))
+        twin.__dict__.update(self.__dict__)
+        twin._edits = {}
+        twin._fills = {}
+        twin._copies = []
+        twin._owner = None
+        return twin
+
+    def copy_sheet(self, title: str) -> "XlsxTemplateSheet":
+        """
+        Append a copy of this sheet named ``title`` to the workbook and return it for
+        editing, like openpyxl's ``wb.copy_worksheet``. The copy starts from this
+        sheet's template XML plus the edits made so far, keeps its merged cells,
+        formulas, validations and print area, and gets its own copies of the sheet's
+        drawing / printer-settings parts. Copies are written by this sheet's
+        :meth:`save` (calling ``save`` on a copy saves the whole workbook).
+        """
+        if self._owner is not None:
+            return self._owner.copy_sheet(title)
+        wb_xml = self._payload["xl/workbook.xml"].decode("utf-8")
+        taken = {_unescape(_attrs(m.group(1)).get("name", "")) for m in _SHEET_ENTRY_RE.finditer(wb_xml)}
+        taken.update(c.title for c in self._copies)
+        if not title or len(title) > 31 or _INVALID_TITLE_CHARS & set(title):
+            raise ValueError(f"Invalid worksheet title {title!r}")
+        if title in taken:
+            raise ValueError(f"Worksheet {title!r} already exists")
+        twin = self.clone()
+        twin._edits = dict(self._edits)
+        twin._fills = dict(self._fills)
+        twin.title = title
+        twin._owner = self
+        self._copies.append(twin)
+        return twin
+
+    # --- workbook structure -------------------------------------------------
+
+    @staticmethod
+    def _resolve_sheet(workbook_xml: str, rels_xml: str, sheet_name: Optional[str]) -> Tuple[str, str]:
+        sheets = [_attrs(m.group(1)) for m in re.finditer(r"<sheet\b([^>]*?)/?>", workbook_xml)]
+        if not sheets:
+            raise ValueError("Workbook has no worksheets")
+        chosen = next((s for s in sheets if sheet_name is not None and _unescape(s.get("name", "")) == sheet_name), None)
+        if chosen is None:
+            m = re.search(r'<workbookView\b[^>]*?\bactiveTab="(\d+)"', workbook_xml)
+            idx = int(m.group(1)) if m else 0
+            chosen = sheets[idx if idx < len(sheets) else 0]
+        rid = chosen.get("r:id") or next((v for k, v in chosen.items() if k.endswith(":id")), "")
+        for m in re.finditer(r"<Relationship\b([^>]*?)/?>", rels_xml):
+            rel = _attrs(m.group(1))
+            if rel.get("Id") == rid:
+                target = rel["Target"]
+                part = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+                return _unescape(chosen.get("name", "")), part
+        raise ValueError(f"Worksheet part for {chosen.get('name')!r} not found")
+
+    # --- reading ----------------------------------------------------------------
+
+    @property
+    def max_row(self) -> int:
+        rows = set(self._rows)
+        rows.update(r for r, _ in self._edits)
+        return max(rows) if rows else 1
+
+    def cell(self, row: int, column: int) -> XlsxPatchCell:
+        return XlsxPatchCell(self, row, column)
+
+    def _cells(self, row: int) -> Dict[int, Tuple[Dict[str, str], str, str]]:
+        cells = self._row_cells.get(row)
+        if cells is None:
+            cells = {}
+            span = self._rows.get(row)
+            if span is not None:
+                m = _ROW_RE.match(self._body, span[0])
+                for cm in _CELL_RE.finditer(m.group(2) or ""):
+                    a = _attrs(cm.group(1))
+                    ref = _REF_RE.fullmatch(a.get("r", ""))
+                    if ref:
+                        cells[_col_index(ref.group(1))] = (a, cm.group(2) or "", cm.group(0))
+            self._row_cells[row] = cells
+        return cells
+
+    def _shared_strings(self) -> List[str]:
+        if self._shared is None:
+            self._shared = [
+                _rich_text(m.group(1) or "")
+                for m in re.finditer(r"<si>(.*?)</si>|<si/>", self._shared_xml, re.S)
+            ]
+        return self._shared
+
+    def _value(self, row: int, column: int) -> Any:
+        if (row, column) in self._edits:
+            return self._edits[(row, column)]
+        hit = self._cells(row).get(column)
+        if hit is None:
+            return None
+        a, inner, _ = hit
+        f = re.search(r"<f\b[^>]*?(?:/>|>(.*?)</f>)", inner, re.S)
+        if f is not None:
+            return "=" + _unescape(f.group(1) or "")
+        t = a.get("t", "n")
+        if t == "inlineStr":
+            m = re.search(r"<is>(.*?)</is>", inner, re.S)
+            return _rich_text(m.group(1)) if m else ""
+        v = re.search(r"<v>(.*?)</v>", inner, re.S)
+        if v is None:
+            return None
+        raw = _unescape(v.group(1))
+        if t == "s":
+            return self._shared_strings()[int(raw)]
+        if t == "b":
+            return raw == "1"
+        if t in ("str", "e"):
+            return raw
+        try:
+            return float(raw) if any(ch in raw for ch in ".eE") else int(raw)
+        except ValueError:
+            return raw
+
+    # --- writing ----------------------------------------------------------------
+
+    @staticmethod
+    def _value_xml(value: Any) -> Tuple[Optional[str], str]:
+        """``(t attribute or None, cell body)`` for a written value."""
+        if value is None:
+            return None, ""
+        if isinstance(value, bool):
+            return "b", f"<v>{int(value)}</v>"
+        if isinstance(value, (int, float)):
+            return None, f"<v>{value!r}</v>" if isinstance(value, float) else f"<v>{value}</v>"
+        text = str(value)
+        if text == "":
+            return None, ""
+        space = ' xml:space="preserve"' if text != text.strip() or "\n" in text else ""
+        return "inlineStr", f"<is><t{space}>{escape(text)}</t></is>"
+
+    def _cell_xml(self, row: int, column: int, style_map: Mapping[Tuple[int, str], int]) -> str:
+        old = self._cells(row).get(column)
+        attrs = dict(old[0]) if old else {}
+        attrs["r"] = f"{_col_letter(column)}{row}"
+        fill = self._fills.get((row, column))
+        if fill is not None:
+            attrs["s"] = str(style_map[(int(attrs.get("s", "0")), fill)])
+        if (row, column) in self._edits:
+            t, body = self._value_xml(self._edits[(row, column)])
+            attrs.pop("t", None)
+            if t is not None:
+                attrs["t"] = t
+        else:
+            body = old[1] if old else ""
+        ordered = {"r": attrs.pop("r")}
+        if "s" in attrs:
+            ordered["s"] = attrs.pop("s")
+        ordered.update(attrs)
+        return f"<c{_attr_text(ordered)}/>" if not body else f"<c{_attr_text(ordered)}>{body}</c>"
+
+    def _row_xml(self, row: int, columns: Set[int], style_map: Mapping[Tuple[int, str], int]) -> str:
+        span = self._rows.get(row)
+        cells = self._cells(row)
+        if span is not None:
+            m = _ROW_RE.match(self._body, span[0])
+            row_attrs = _attrs(m.group(1))
+        else:
+            row_attrs = {"r": str(row)}
+        if columns - set(cells):
+            row_attrs.pop("spans", None)  # optional hint; drop rather than recompute
+        parts: List[str] = []
+        for c in sorted(set(cells) | columns):
+            parts.append(self._cell_xml(row, c, style_map) if c in columns else cells[c][2])
+        return f"<row{_attr_text(row_attrs)}>{''.join(parts)}</row>"
+
+    def _patched_styles(self, styles_xml: str) -> Tuple[str, Dict[Tuple[int, str], int]]:
+        """
+        Append one solid fill per colour and one cell format per (base format, colour),
+        covering the fills of this sheet and its copies.
+        """
+        needed: Set[Tuple[int, str]] = set()
+        for sheet in [self] + self._copies:
+            for (r, c), argb in sheet._fills.items():
+                old = sheet._cells(r).get(c)
+                needed.add((int(old[0].get("s", "0")) if old else 0, argb))
+        if not needed:
+            return styles_xml, {}
+
+        fills_m = re.search(r"<fills\b[^>]*?count=\"(\d+)\"[^>]*>(.*?)</fills>", styles_xml, re.S)
+        xfs_m = re.search(r"<cellXfs\b[^>]*?count=\"(\d+)\"[^>]*>(.*?)</cellXfs>", styles_xml, re.S)
+        if fills_m is None or xfs_m is None:
+            raise ValueError("styles.xml has no <fills> / <cellXfs> table")
+        fill_ids: Dict[str, int] = {}
+        n_fills = int(fills_m.group(1))
+        new_fills: List[str] = []
+        for argb in sorted({a for _, a in needed}):
+            fill_ids[argb] = n_fills + len(new_fills)
+            new_fills.append(
+                f'<fill><patternFill patternType="solid"><fgColor rgb="{argb}"/>'
+                f'<bgColor rgb="{argb}"/></patternFill></fill>'
+            )
+        xfs = _XF_RE.findall(xfs_m.group(2))
+        style_map: Dict[Tuple[int, str], int] = {}
+        new_xfs: List[str] = []
+        for base, argb in sorted(needed):
+            xf = xfs[base] if base < len(xfs) else '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+            head_end = xf.find(">")
+            head = xf[:head_end]
+            # ``<xf .../>`` has no children; keep it self-closing.
+            rest = "/>" if head.endswith("/") else xf[head_end:]
+            head = head.rstrip("/")
+            a = _attrs(head)
+            a["fillId"] = str(fill_ids[argb])
+            a["applyFill"] = "1"
+            style_map[(base, argb)] = len(xfs) + len(new_xfs)
+            new_xfs.append(f"<xf{_attr_text(a)}{rest}")
+
+        def _grow(m: "re.Match[str]", added: List[str], tag: str) -> str:
+            opening = m.group(0)[: m.group(0).find(">") + 1]
+            opening = re.sub(r'count="\d+"', f'count="{int(m.group(1)) + len(added)}"', opening, count=1)
+            return f"{opening}{m.group(2)}{''.join(added)}</{tag}>"
+
+        # cellXfs follows fills in styles.xml; patch it first so offsets stay valid.
+        styles_xml = styles_xml[: xfs_m.start()] + _grow(xfs_m, new_xfs, "cellXfs") + styles_xml[xfs_m.end() :]
+        styles_xml = styles_xml[: fills_m.start()] + _grow(fills_m, new_fills, "fills") + styles_xml[fills_m.end() :]
+        return styles_xml, style_map
+
+    def _patched_sheet(self, style_map: Mapping[Tuple[int, str], int]) -> str:
+        by_row: Dict[int, Set[int]] = {}
+        for r, c in list(self._edits) + list(self._fills):
+            by_row.setdefault(r, set()).add(c)
+        if not by_row:
+            return self._xml
+
+        out: List[str] = []
+        pos = 0
+        pending = sorted(by_row)
+        for r, (start, end) in sorted(self._rows.items(), key=lambda kv: kv[1][0]):
+            while pending and pending[0] < r and pending[0] not in self._rows:
+                out.append(self._body[pos:start])
+                pos = start
+                nr = pending.pop(0)
+                out.append(self._row_xml(nr, by_row[nr], style_map))
+            if r in by_row:
+                out.append(self._body[pos:start])
+                out.append(self._row_xml(r, by_row[r], style_map))
+                pos = end
+                pending.remove(r)
+        out.append(self._body[pos:])
+        for nr in pending:  # rows below the last template row
+            out.append(self._row_xml(nr, by_row[nr], style_map))
+
+        head = self._head
+        dim = re.search(r'<dimension ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"', head)
+        if dim is not None:
+            c1, r1 = _col_index(dim.group(1)), int(dim.group(2))
+            c2 = _col_index(dim.group(3)) if dim.group(3) else c1
+            r2 = int(dim.group(4)) if dim.group(4) else r1
+            for r, cols in by_row.items():
+                r1, r2 = min(r1, r), max(r2, r)
+                c1, c2 = min(c1, min(cols)), max(c2, max(cols))
+            ref = f"{_col_letter(c1)}{r1}:{_col_letter(c2)}{r2}"
+            head = head[: dim.start(1)] + ref + head[dim.end(dim.lastindex) :]
+        return head + "".join(out) + self._tail
+
+    def _add_copies(self, payload: Dict[str, bytes], style_map: Mapping[Tuple[int, str], int]) -> List[Tuple[str, str]]:
+        """
+        Add the :meth:`copy_sheet` sheets to ``payload``; returns ``(new part, source
+        part)`` pairs so the new zip entries can mirror the source entries' settings.
+        """
+        names = set(payload)
+        added: List[Tuple[str, str]] = []
+        types_xml = payload["[Content_Types].xml"].decode("utf-8")
+        wb_xml = payload["xl/workbook.xml"].decode("utf-8")
+        wb_rels = payload["xl/_rels/workbook.xml.rels"].decode("utf-8")
+
+        def _add_part(src: str, data: bytes) -> str:
+            nonlocal types_xml
+            new = _next_part(names, src)
+            names.add(new)
+            payload[new] = data
+            added.append((new, src))
+            m = re.search(rf'<Override\b[^>]*?PartName="/{re.escape(src)}"[^>]*?ContentType="([^"]*)"[^>]*/>', types_xml)
+            if m is not None:
+                types_xml = types_xml.replace(
+                    "</Types>", f'<Override PartName="/{new}" ContentType="{m.group(1)}"/></Types>', 1
+                )
+            return new
+
+        def _add_rels(part: str, src: str, data: bytes) -> None:
+            names.add(_rels_part(part))
+            payload[_rels_part(part)] = data
+            added.append((_rels_part(part), _rels_part(src)))
+
+        sheets = [_attrs(m.group(1)) for m in _SHEET_ENTRY_RE.finditer(wb_xml)]
+        src_idx = next(i for i, a in enumerate(sheets) if _unescape(a.get("name", "")) == self.title)
+        src_entry = sheets[src_idx]
+        id_attr = next((k for k in src_entry if k.endswith(":id")), "r:id")
+        src_rel = next(
+            a for a in (_attrs(m.group(1)) for m in _REL_RE.finditer(wb_rels)) if a.get("Id") == src_entry.get(id_attr)
+        )
+        next_sheet_id = max(int(a.get("sheetId", "0")) for a in sheets) + 1
+        local_names = [
+            (a, text)
+            for a, text in ((_attrs(m.group(1)), m.group(2)) for m in _DEFINED_NAME_RE.finditer(wb_xml))
+            if a.get("localSheetId") == str(src_idx)
+        ]
+        sheet_rels = payload.get(_rels_part(self._sheet_part), b"").decode("utf-8")
+
+        new_entries: List[str] = []
+        new_names: List[str] = []
+        for k, copy in enumerate(self._copies):
+            # Related parts (drawing, printer settings) are duplicated: Excel expects
+            # one owner per drawing part. Their own relationships (images) are shared.
+            copy_rels = sheet_rels
+            for m in _REL_RE.finditer(sheet_rels):
+                rel = _attrs(m.group(1))
+                if rel.get("TargetMode") == "External":
+                    continue
+                kind = rel.get("Type", "").rsplit("/", 1)[-1]
+                if kind not in _COPIED_SHEET_PARTS:
+                    raise ValueError(f"Cannot copy worksheet {self.title!r}: {kind} parts are not supported")
+                target = _rel_target(self._sheet_part, rel["Target"])
+                new_target = _add_part(target, payload[target])
+                if _rels_part(target) in payload:
+                    _add_rels(new_target, target, payload[_rels_part(target)])
+                rel_target = posixpath.relpath(new_target, posixpath.dirname(self._sheet_part))
+                new_rel = m.group(0).replace(f'Target="{rel["Target"]}"', f'Target="{rel_target}"')
+                copy_rels = copy_rels.replace(m.group(0), new_rel, 1)
+
+            xml = re.sub(r'(<sheetView\b[^>]*?)\s+tabSelected="1"', r"\1", copy._patched_sheet(style_map), count=1)
+            part = _add_part(self._sheet_part, xml.encode("utf-8"))
+            if sheet_rels:
+                _add_rels(part, self._sheet_part, copy_rels.encode("utf-8"))
+
+            rid = _next_rid(wb_rels)
+            target = posixpath.relpath(part, "xl")
+            rel_xml = f'<Relationship Id="{rid}" Type="{src_rel["Type"]}" Target="{target}"/>'
+            wb_rels = wb_rels.replace("</Relationships>", rel_xml + "</Relationships>", 1)
+            title = escape(copy.title, {'"': "&quot;"})
+            new_entries.append(f'<sheet name="{title}" sheetId="{next_sheet_id + k}" {id_attr}="{rid}"/>')
+            for a, text in local_names:
+                a = dict(a, localSheetId=str(len(sheets) + k))
+                text = text.replace(escape(_quote_sheet(self.title)) + "!", escape(_quote_sheet(copy.title)) + "!")
+                text = text.replace(escape(self.title) + "!", escape(_quote_sheet(copy.title)) + "!")
+                new_names.append(f"<definedName{_attr_text(a)}>{text}</definedName>")
+
+        wb_xml = wb_xml.replace("</sheets>", "".join(new_entries) + "</sheets>", 1)
+        if new_names:
+            wb_xml = wb_xml.replace("</definedNames>", "".join(new_names) + "</definedNames>", 1)
+
+        # The calculation chain only lists the source sheet's formulas; drop it and let
+        # Excel rebuild it (the workbook is recalculated on load anyway).
+        for m in _REL_RE.finditer(wb_rels):
+            rel = _attrs(m.group(1))
+            if rel.get("Type", "").endswith("/calcChain"):
+                wb_rels = wb_rels.replace(m.group(0), "", 1)
+                chain = _rel_target("xl/workbook.xml", rel["Target"])
+                payload.pop(chain, None)
+                types_xml = re.sub(rf'<Override\b[^>]*?PartName="/{re.escape(chain)}"[^>]*/>', "", types_xml)
+
+        payload["[Content_Types].xml"] = types_xml.encode("utf-8")
+        payload["xl/workbook.xml"] = wb_xml.encode("utf-8")
+        payload["xl/_rels/workbook.xml.rels"] = wb_rels.encode("utf-8")
+        return added
+
+    def save(self, path: str) -> None:
+        """Write the patched package to ``path`` (may equal the source path)."""
+        if self._owner is not None:
+            self._owner.save(path)
+            return
+        payload = dict(self._payload)
+        styles_part = "xl/styles.xml"
+        style_map: Dict[Tuple[int, str], int] = {}
+        if (self._fills or any(c._fills for c in self._copies)) and styles_part in payload:
+            styles_xml, style_map = self._patched_styles(payload[styles_part].decode("utf-8"))
+            payload[styles_part] = styles_xml.encode("utf-8")
+        added = self._add_copies(payload, style_map) if self._copies else []
+        if self._edits or self._fills or self._copies:
+            payload[self._sheet_part] = self._patched_sheet(style_map).encode("utf-8")
+            wb_xml = payload["xl/workbook.xml"].decode("utf-8")
+            if "fullCalcOnLoad" not in wb_xml:
+                if "<calcPr" in wb_xml:
+                    wb_xml = wb_xml.replace("<calcPr", '<calcPr fullCalcOnLoad="1"', 1)
+                else:
+                    wb_xml = wb_xml.replace("</workbook>", '<calcPr fullCalcOnLoad="1"/></workbook>', 1)
+                payload["xl/workbook.xml"] = wb_xml.encode("utf-8")
+
+        infos = {i.filename: i for i in self._infos}
+        entries = [(i.filename, i) for i in self._infos if i.filename in payload]
+        entries += [(new, infos[src]) for new, src in added]
+        with zipfile.ZipFile(path, "w") as zout:
+            for name, info in entries:
+                # writestr() fills sizes / offsets into the ZipInfo: never hand it the
+                # shared template entries (clones may be saving concurrently).
+                entry = zipfile.ZipInfo(name, info.date_time)
+                entry.compress_type = info.compress_type
+                entry.external_attr = info.external_attr
+                entry.create_system = info.create_system
+                zout.writestr(entry, payload[name])
+
+
+# --- Process-level template cache --------------------------------------------
+
+# (absolute path, sheet name) -> ((mtime_ns, size), parsed prototype)
+_TEMPLATE_CACHE: Dict[Tuple[str, Optional[str]], Tuple[Tuple[int, int], XlsxTemplateSheet]] = {}
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+_template_hits = 0
+_template_misses = 0
+_template_evictions = 0
+
+
+@dataclass(frozen=True)
+class TemplateCacheInfo:
+    """Counters for the :func:`load_template_sheet` cache (see :func:`template_cache_info`)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+def load_template_sheet(path: str, sheet_name: Optional[str] = None) -> XlsxTemplateSheet:
+    """
+    :class:`XlsxTemplateSheet` for ``path`` from a process-level cache, as a fresh
+    :meth:`~XlsxTemplateSheet.clone` per call. Entries are keyed by path and sheet and
+    re-parsed when the file's modification time or size changes.
+    """
+    global _template_hits, _template_misses, _template_evictions
+    key = (os.path.abspath(path), sheet_name)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _TEMPLATE_CACHE_LOCK:
+        hit = _TEMPLATE_CACHE.get(key)
+        if hit is not None and hit[0] == stamp:
+            _template_hits += 1
+            return hit[1].clone()
+        if hit is not None:
+            _template_evictions += 1
+        _template_misses += 1
+        proto = XlsxTemplateSheet(path, sheet_name)
+        _TEMPLATE_CACHE[key] = (stamp, proto)
+        return proto.clone()
+
+
+def template_cache_info() -> TemplateCacheInfo:
+    return TemplateCacheInfo(_template_hits, _template_misses, _template_evictions, len(_TEMPLATE_CACHE))
+
+
+def clear_template_cache() -> None:
+    """Drop every cached template and reset the counters."""
+    global _template_hits, _template_misses, _template_evictions
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE.clear()
+        _template_hits = _template_misses = _template_evictions = 0
+
+
+# --- Round-trip check --------------------------------------------------------
+
+def check_fill_round_trip(path: str, sheet_name: Optional[str] = None, argb: str = "FFFFF2CC") -> int:
+    """
+    Fill one unstyled cell (style 0) and one existing cell per cell format used on the
+    sheet, save to a temporary file and reload it with openpyxl. Raises ``ValueError``
+    when the saved package does not load or a fill / value did not survive; returns the
+    number of cells checked.
+    """
+    import tempfile
+
+    from openpyxl import load_workbook
+
+    ws = XlsxTemplateSheet(path, sheet_name)
+    # openpyxl drops the style of merged-away cells, so only merge anchors are checked.
+    covered: Set[Tuple[int, int]] = set()
+    for m in re.finditer(r'<mergeCell\b[^>]*?ref="([A-Z]+)(\d+):([A-Z]+)(\d+)"', ws._xml):
+        c0, r0, c1, r1 = _col_index(m.group(1)), int(m.group(2)), _col_index(m.group(3)), int(m.group(4))
+        covered.update((r, c) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1))
+        covered.discard((r0, c0))
+    targets: Dict[Tuple[int, int], Any] = {(ws.max_row + 2, 1): None}
+    seen_styles = {"0"}
+    for r in sorted(ws._rows):
+        for c, (a, inner, _) in ws._cells(r).items():
+            style = a.get("s", "0")
+            if style not in seen_styles and "<f" not in inner and (r, c) not in covered:
+                seen_styles.add(style)
+                targets[(r, c)] = ws._value(r, c)
+    for r, c in targets:
+        ws.cell(r, c).fill = argb
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "round_trip.xlsx")
+        ws.save(out)
+        try:
+            wb = load_workbook(out)
+        except Exception as e:
+            raise ValueError(f"Patched workbook does not load: {e}") from e
+        try:
+            sheet = wb[ws.title]
+            for (r, c), value in targets.items():
+                cell = sheet.cell(r, c)
+                if (cell.fill.fgColor.rgb or "").upper() != argb.upper():
+                    raise ValueError(f"Fill lost at {_col_letter(c)}{r}")
+                if cell.value != value:
+                    raise ValueError(f"Value changed at {_col_letter(c)}{r}: {cell.value!r} != {value!r}")
+        finally:
+            wb.close()
+    return len(targets)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Check that filled cells survive a patch + openpyxl round trip.")
+    ap.add_argument("xlsx_path", nargs="?", default=None, help="Workbook (default: shipped VT Schedules template).")
+    ap.add_argument("--sheet", default=None, help="Worksheet name (default: active sheet).")
+    args = ap.parse_args()
+    if args.xlsx_path is None:
+        from lift_designer_schedules_export import default_schedule_template_path
+
+        args.xlsx_path = default_schedule_template_path()
+    n = check_fill_round_trip(args.xlsx_path, args.sheet)
+    print(f"{n} filled cells round-tripped through openpyxl")